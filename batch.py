@@ -0,0 +1,81 @@
+"""Vectorized evaluation of many five-card hands with NumPy.
+
+The functions here use the same lookup tables as poker.evaluator, copied into
+NumPy arrays, so every hand gets exactly the strength evaluate_rank would
+return for it; hands with repeated cards that evaluate_rank rejects raise
+the same ValueError. NumPy is an optional dependency
+(``pip install poker[fast]``).
+"""
+import numpy as np
+
+from poker import evaluator
+from poker.cards import repeated_cards_error
+
+_FLUSH_TABLE = np.array(evaluator.FLUSH_TABLE, dtype=np.int32)
+_UNIQUE_TABLE = np.array(evaluator.UNIQUE_TABLE, dtype=np.int32)
+_PAIRED_KEYS = np.array(sorted(evaluator.PAIRED_TABLE), dtype=np.int64)
+_PAIRED_VALUES = np.array(
+    [evaluator.PAIRED_TABLE[key] for key in _PAIRED_KEYS.tolist()], dtype=np.int32
+)
+_PRIMES = np.array(evaluator.PRIMES, dtype=np.int64)
+_CATEGORIES = np.array(
+    [0] + [evaluator.hand_category(s) for s in range(1, evaluator.MAX_STRENGTH + 1)],
+    dtype=np.uint8,
+)
+
+
+def evaluate_hands_batch(cards: np.ndarray) -> np.ndarray:
+    """Return the strength of every hand in an (N, 5) array of encoded cards.
+
+    Args:
+        cards (np.ndarray): Integer array of shape (N, 5) with encoded cards.
+
+    Returns:
+        np.ndarray: Array of N strengths (int32), as returned by
+        poker.evaluator.evaluate_rank.
+
+    Raises:
+        ValueError: If the array does not have shape (N, 5), or a hand
+            repeats cards in a way one deck's tables cannot score (see
+            poker.shoe.evaluate_shoe).
+    """
+    cards = np.asarray(cards)
+    if cards.ndim != 2 or cards.shape[1] != 5:
+        raise ValueError(f"Expected an (N, 5) array of cards, got shape {cards.shape}")
+
+    ranks = (cards >> 2).astype(np.intp)
+    suits = cards & 3
+    masks = np.bitwise_or.reduce(np.left_shift(1, ranks), axis=1)
+    flush = (suits == suits[:, :1]).all(axis=1)
+
+    strengths = np.where(flush, _FLUSH_TABLE[masks], _UNIQUE_TABLE[masks])
+    paired = strengths == 0
+    # A flush with a repeated rank has no flush-table entry.
+    bad = flush & paired
+    if bad.any():
+        raise repeated_cards_error(cards[bad.argmax()].tolist())
+    if paired.any():
+        products = _PRIMES[ranks[paired]].prod(axis=1)
+        index = np.searchsorted(_PAIRED_KEYS, products)
+        index = np.minimum(index, len(_PAIRED_KEYS) - 1)
+        # Five of a kind has no key; searchsorted would land on a neighbour.
+        missing = _PAIRED_KEYS[index] != products
+        if missing.any():
+            rows = np.flatnonzero(paired)
+            raise repeated_cards_error(
+                cards[rows[missing.argmax()]].tolist()
+            )
+        strengths[paired] = _PAIRED_VALUES[index]
+    return strengths
+
+
+def hand_categories_batch(strengths: np.ndarray) -> np.ndarray:
+    """Return the hand category of every strength in an array.
+
+    Args:
+        strengths (np.ndarray): Strengths returned by evaluate_hands_batch.
+
+    Returns:
+        np.ndarray: Array of categories (uint8) with the same shape.
+    """
+    return _CATEGORIES[strengths]
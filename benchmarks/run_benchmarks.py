@@ -0,0 +1,282 @@
+"""Benchmarks for the hot paths of the poker package.
+
+Every benchmark measures operations per second and the peak memory allocated
+per operation, and compares them with a stored JSON baseline. Speeds are
+compared relative to a fixed pure-Python calibration loop timed in the same
+run, so a baseline recorded on one machine holds on another. The run fails
+when a benchmark gets slower, or allocates more, than the baseline allows.
+It also cross-checks the lookup-table evaluators against main.evaluate_hand.
+
+Usage:
+    python benchmarks/run_benchmarks.py              # compare with baseline
+    python benchmarks/run_benchmarks.py --update     # record a new baseline
+    python benchmarks/run_benchmarks.py --crosscheck all
+"""
+import argparse
+import contextlib
+import io
+import json
+import random
+import sys
+import timeit
+import tracemalloc
+from itertools import combinations
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from poker import canonical, engine, evaluator, main, tie_break
+from poker.cards import decode_cards, encode_cards
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+BASELINE = Path(__file__).with_name("baseline.json")
+
+CATEGORY_HANDS = {
+    "high_card": "2h 5d 9c Js Kh",
+    "one_pair": "3h 3s 9c Jd Kh",
+    "two_pairs": "Kh Ks 3c 3d 9h",
+    "three_of_a_kind": "7h 7s 7c Jd 2h",
+    "straight": "9h 10d Jc Qs Kh",
+    "flush": "2h 5h 9h Jh Kh",
+    "full_house": "Qh Qs Qc 4d 4h",
+    "four_of_a_kind": "Ah As Ac Ad 5h",
+    "straight_flush": "9s 10s Js Qs Ks",
+    "royal_flush": "10h Jh Qh Kh Ah",
+}
+
+
+def parse_hand(text: str) -> list[tuple[str, str]]:
+    """Parse a hand written as space separated cards such as "10h Jh".
+
+    Args:
+        text (str): Cards as value followed by a suit letter.
+
+    Returns:
+        list[tuple[str, str]]: Cards as (suit, value) tuples.
+    """
+    suits = {"h": "Hearts", "d": "Diamonds", "c": "Clubs", "s": "Spades"}
+    return [(suits[card[-1]], card[:-1]) for card in text.split()]
+
+
+def benchmarks() -> "dict[str, Callable[[], object]]":
+    """Return the benchmarked operations by name."""
+    cases = {}
+    for name, text in CATEGORY_HANDS.items():
+        hand = parse_hand(text)
+        encoded = encode_cards(hand)
+        cases[f"evaluate_hand[{name}]"] = lambda hand=hand: main.evaluate_hand(hand)
+        cases[f"evaluate5[{name}]"] = lambda cards=encoded: evaluator.evaluate5(*cards)
+
+    def deal() -> None:
+        main.deal_cards(main.generate_deck(encoded=True), amount_of_users=4)
+
+    def change() -> None:
+        deck = main.generate_deck(encoded=True)
+        cards = deck[:5]
+        del deck[:5]
+        main.change_cards(cards, deck, [0, 2, 4])
+
+    sink = io.StringIO()
+
+    def tie_breaks() -> None:
+        with contextlib.redirect_stdout(sink):
+            tie_break.high_card_tie_break("K", "Q")
+            tie_break.pair_tie_break((2, "K", "4"), (2, "K", "9"))
+            tie_break.two_pairs_tie_break((3, "K", "10", "A"), (3, "K", "10", "9"))
+            tie_break.grouped_cards_tie_break((4, "5", "8"), (4, "5", "8"))
+        sink.seek(0)
+        sink.truncate()
+
+    # Hands from real play repeat: 1,000 hands drawn from 100 distinct ones.
+    rng = random.Random(3)
+    pool = [decode_cards(rng.sample(range(52), 5)) for _ in range(100)]
+    stream = [rng.choice(pool) for _ in range(1000)]
+
+    def uncached_stream() -> None:
+        for hand in stream:
+            main.evaluate_hand(hand)
+
+    def cached_stream() -> None:
+        for hand in stream:
+            canonical.evaluate_hand_cached(hand)
+
+    cases["evaluate_hand[stream]"] = uncached_stream
+    cases["evaluate_hand_cached[stream]"] = cached_stream
+    cases["deal_cards"] = deal
+    cases["change_cards"] = change
+    cases["tie_break"] = tie_breaks
+    cases["play_game[4 players]"] = lambda: engine.play_game(
+        4, lambda seat, cards: [0, 1], seed=7
+    )
+    return cases
+
+
+def calibration() -> int:
+    """Run a fixed pure-Python workload that gauges the speed of the machine.
+
+    It mixes the operations the benchmarks spend their time on: calls,
+    tuple indexing, bit operations, dict lookups and small lists.
+
+    Returns:
+        int: A checksum, so that the work cannot be skipped.
+    """
+    squares = {value: value * value for value in range(64)}
+    bits = tuple(1 << (value & 15) for value in range(64))
+    total = 0
+    for value in range(500):
+        cards = [value & 63, (value >> 1) & 63, (value >> 2) & 63]
+        total += squares[cards[0]] + (bits[cards[1]] | bits[cards[2]])
+        total += len(sorted(cards))
+    return total
+
+
+def measure(operation: "Callable[[], object]", min_time: float) -> dict[str, float]:
+    """Measure throughput and the memory allocated while an operation runs.
+
+    Args:
+        operation (Callable[[], object]): Operation to run.
+        min_time (float): Minimum seconds to spend timing it.
+
+    Returns:
+        dict[str, float]: ops_per_sec and peak_bytes_per_op, the largest
+        amount of memory held by one call at any point.
+    """
+    timer = timeit.Timer(operation)
+    number, _ = timer.autorange()
+    number = max(number, int(number * min_time / 0.2))
+    best = min(timer.repeat(repeat=3, number=number))
+
+    peak_bytes = 0
+    tracemalloc.start()
+    for _ in range(20):
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        operation()
+        _, peak = tracemalloc.get_traced_memory()
+        peak_bytes = max(peak_bytes, peak - before)
+    tracemalloc.stop()
+    return {"ops_per_sec": number / best, "peak_bytes_per_op": peak_bytes}
+
+
+def crosscheck(sample: int | None, seed: int = 0) -> int:
+    """Compare the evaluator categories with main.evaluate_hand.
+
+    Args:
+        sample (int | None): Number of random hands, or None for every hand.
+        seed (int, optional): Seed for the random sample. Defaults to 0.
+
+    Returns:
+        int: Number of hands whose categories differ.
+    """
+    deck = main.generate_deck(encoded=True)
+    if sample is None:
+        hands = combinations(deck, 5)
+    else:
+        rng = random.Random(seed)
+        hands = (rng.sample(deck, 5) for _ in range(sample))
+
+    mismatches = 0
+    for hand in hands:
+        strength = evaluator.evaluate5(*hand)
+        result = main.evaluate_hand(list(hand))
+        expected = result if result == 10 else result[0]
+        if evaluator.hand_category(strength) != expected:
+            mismatches += 1
+            print(f"mismatch: {decode_cards(list(hand))} {result} {strength}")
+    return mismatches
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    threshold: float,
+) -> list[str]:
+    """Return a description of every regression against the baseline.
+
+    Speed is compared as relative_speed, the ops/s of a benchmark divided by
+    the ops/s of the calibration loop on the same machine; the absolute
+    ops/s only depend on the hardware and are not compared.
+
+    Args:
+        results (dict): Fresh measurements by benchmark name.
+        baseline (dict): Stored measurements by benchmark name.
+        threshold (float): Allowed relative slowdown or allocation growth.
+
+    Returns:
+        list[str]: One line per regression; empty when everything passes.
+    """
+    regressions = []
+    for name, current in results.items():
+        if name not in baseline:
+            continue
+        expected = baseline[name]
+        if current["relative_speed"] < expected["relative_speed"] * (1 - threshold):
+            regressions.append(
+                f"{name}: {current['relative_speed']:.4g}x calibration, "
+                f"baseline {expected['relative_speed']:.4g}x"
+            )
+        # A small absolute slack keeps allocator noise on tiny numbers quiet.
+        allowed = expected["peak_bytes_per_op"] * (1 + threshold) + 64
+        if current["peak_bytes_per_op"] > allowed:
+            regressions.append(
+                f"{name}: {current['peak_bytes_per_op']:.0f} B/op, "
+                f"baseline {expected['peak_bytes_per_op']:.0f} B/op"
+            )
+    return regressions
+
+
+def main_cli(argv: list[str] | None = None) -> int:
+    """Run the benchmarks from the command line.
+
+    Args:
+        argv (list[str] | None, optional): Command line arguments.
+
+    Returns:
+        int: Process exit code, non-zero on a regression or mismatch.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--update", action="store_true", help="store a new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--filter", default="", help="only run matching benchmarks")
+    parser.add_argument(
+        "--crosscheck", default="20000",
+        help="number of random hands to cross-check, or 'all' for every hand",
+    )
+    args = parser.parse_args(argv)
+
+    # The calibration loop runs before and after the benchmarks, and its best
+    # speed is used, so a slow start or a busy spell does not skew the ratios.
+    reference = measure(calibration, args.min_time)["ops_per_sec"]
+    results = {}
+    for name, operation in benchmarks().items():
+        if args.filter in name:
+            results[name] = measure(operation, args.min_time)
+    reference = max(reference, measure(calibration, args.min_time)["ops_per_sec"])
+    print(f"{'calibration':32} {reference:>14,.0f} ops/s")
+    for name, result in results.items():
+        result["relative_speed"] = result["ops_per_sec"] / reference
+        print(f"{name:32} {result['ops_per_sec']:>14,.0f} ops/s "
+              f"{result['relative_speed']:>10.4g}x "
+              f"{result['peak_bytes_per_op']:>10,.0f} B/op")
+
+    sample = None if args.crosscheck == "all" else int(args.crosscheck)
+    mismatches = crosscheck(sample)
+    print(f"cross-check: {mismatches} mismatching hands")
+
+    if args.update:
+        args.baseline.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+        print(f"baseline written to {args.baseline}")
+        return 1 if mismatches else 0
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    regressions = compare(results, baseline, args.threshold)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions or mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
@@ -0,0 +1,204 @@
+"""Suit-isomorphic canonical forms of hands.
+
+Two hands that differ only by a renaming of suits have the same strength and
+the same draw odds. canonicalize relabels the suits of a hand so that all of
+those hands map to one representative, which is what caches and solvers key
+their results on.
+
+CanonicalCache puts a bounded LRU cache in front of a hand function. Hands
+from real play repeat a lot, so a modest cache answers most lookups without
+re-evaluating, while memory stays capped well below the full space of hands.
+Computing the canonical form costs more than evaluating a hand, though, so
+the evaluation caches are keyed on strength_key instead: the product of the
+rank primes plus a flush bit, which is all a hand's strength depends on and
+which every suit permutation of the hand shares.
+"""
+from collections import OrderedDict
+from typing import TYPE_CHECKING, TypeVar
+
+from poker.cards import DECK_SIZE, encode_cards, reject_jokers
+from poker.evaluator import PRIMES, evaluate_rank
+from poker.instrumentation import METRICS
+from poker.main import _evaluate_encoded
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+T = TypeVar("T")
+
+_CARD_PRIME = tuple(PRIMES[card >> 2] for card in range(DECK_SIZE))
+
+
+def canonicalize(cards: list[int]) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """Return the suit-canonical form of a hand of encoded cards.
+
+    Suits are renumbered by the set of values they hold, the suit with the
+    highest value bitmask becoming suit 0, and the cards are sorted. Suits
+    holding the same values are interchangeable, so ties between them do not
+    change the result.
+
+    Args:
+        cards (list[int]): Encoded cards.
+
+    Returns:
+        tuple[tuple[int, ...], tuple[int, ...]]: The sorted canonical cards
+        and the suit mapping used, indexed by the original suit.
+    """
+    masks = [0, 0, 0, 0]
+    for card in cards:
+        masks[card & 3] |= 1 << (card >> 2)
+    order = sorted(range(4), key=masks.__getitem__, reverse=True)
+    suit_map = [0, 0, 0, 0]
+    for new_suit, old_suit in enumerate(order):
+        suit_map[old_suit] = new_suit
+    canonical = tuple(sorted(card & ~3 | suit_map[card & 3] for card in cards))
+    return canonical, tuple(suit_map)
+
+
+def canonical_key(cards: list[int]) -> tuple[int, ...]:
+    """Return the sorted suit-canonical cards of a hand, see canonicalize.
+
+    Args:
+        cards (list[int]): Encoded cards.
+
+    Returns:
+        tuple[int, ...]: Key shared by every suit permutation of the hand.
+    """
+    return canonicalize(cards)[0]
+
+
+def strength_key(cards: list[int]) -> int:
+    """Return a key that identifies the strength class of five cards.
+
+    Args:
+        cards (list[int]): Five encoded cards.
+
+    Returns:
+        int: The product of the rank primes shifted left by one, with the
+        low bit set for a flush. Hands with the same key have the same
+        strength, and there are 7,462 distinct keys.
+
+    Raises:
+        ValueError: If the hand holds a joker.
+    """
+    c0, c1, c2, c3, c4 = cards
+    prime = _CARD_PRIME
+    try:
+        key = prime[c0] * prime[c1] * prime[c2] * prime[c3] * prime[c4] << 1
+    except IndexError:
+        reject_jokers(cards)
+        raise
+    return key | 1 if c0 & 3 == c1 & 3 == c2 & 3 == c3 & 3 == c4 & 3 else key
+
+
+class CanonicalCache:
+    """Size-bounded LRU cache of a hand function keyed on a suit-free key.
+
+    The wrapped function must give the same answer for every hand with the
+    same key: any function invariant under suit permutation for
+    canonical_key, an evaluation for strength_key.
+
+    Attributes:
+        maxsize (int): Maximum number of cached hands.
+        hits (int): Calls answered from the cache.
+        misses (int): Calls that had to evaluate the hand.
+        evictions (int): Entries dropped to stay within maxsize.
+    """
+
+    def __init__(
+        self,
+        func: "Callable[[list[int]], T]",
+        maxsize: int = 65536,
+        key: "Callable[[list[int]], Hashable]" = canonical_key,
+    ) -> None:
+        """Wrap a hand function.
+
+        Args:
+            func (Callable[[list[int]], T]): Function of a list of encoded cards.
+            maxsize (int, optional): Maximum number of cached hands.
+                Defaults to 65536.
+            key (Callable[[list[int]], Hashable], optional): Function of the
+                encoded cards that the results are cached under. Defaults to
+                canonical_key.
+
+        Raises:
+            ValueError: If maxsize is not positive.
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.func = func
+        self.key = key
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def __call__(self, cards: list[tuple[str, str] | int]) -> T:
+        """Return the wrapped function's result for a hand, using the cache.
+
+        Args:
+            cards (list[tuple[str, str] | int]): Cards as (suit, value) tuples
+                or encoded ints.
+
+        Returns:
+            T: The result of the wrapped function.
+        """
+        cards = encode_cards(cards)
+        key = self.key(cards)
+        entries = self._entries
+        if key in entries:
+            self.hits += 1
+            entries.move_to_end(key)
+            return entries[key]
+
+        self.misses += 1
+        result = entries[key] = self.func(cards)
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+            self.evictions += 1
+        return result
+
+    def __len__(self) -> int:
+        """Return the number of cached hands."""
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every cached hand and reset the counters."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return the cache counters.
+
+        Returns:
+            dict[str, int]: hits, misses, evictions and current size.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+        }
+
+
+HAND_CACHE = CanonicalCache(_evaluate_encoded, key=strength_key)
+
+# evaluate_rank is itself one table lookup, so this cache only breaks even;
+# it is kept for callers that pass a cached evaluator around.
+evaluate_rank_cached = CanonicalCache(evaluate_rank, key=strength_key)
+
+
+def evaluate_hand_cached(cards: list[tuple[str, str] | int]) -> int | tuple:
+    """Return main.evaluate_hand of a five-card hand through HAND_CACHE.
+
+    Args:
+        cards (list[tuple[str, str] | int]): The five cards of the hand.
+
+    Returns:
+        int | tuple: The same result as main.evaluate_hand.
+    """
+    result = HAND_CACHE(cards)
+    if METRICS.enabled:
+        METRICS.count_category(result if result == 10 else result[0])
+    return result
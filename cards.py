@@ -0,0 +1,182 @@
+"""Compact integer card encoding.
+
+Every card is stored as a small integer ``rank << 2 | suit`` where ``rank`` is
+the index into :data:`RANKS` (0 for "2" up to 12 for "A") and ``suit`` is the
+index into :data:`SUITS`. The whole deck therefore fits in ``range(52)``, so a
+card can be used directly as an index into lookup tables or as a bit position
+in a 52-bit mask.
+
+The two jokers of a joker deck, see :data:`JOKERS`, are encoded as 52 and 53,
+after the regular cards. Only the wild-card evaluator in poker.wild accepts
+them.
+"""
+from numbers import Integral
+
+SUITS = ["Hearts", "Diamonds", "Clubs", "Spades"]
+RANKS = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"]
+
+DECK_SIZE = 52
+
+JOKERS = [("Joker", "Black"), ("Joker", "Red")]
+
+_TUPLE_TO_INT = {
+    (suit, rank): rank_index << 2 | suit_index
+    for suit_index, suit in enumerate(SUITS)
+    for rank_index, rank in enumerate(RANKS)
+}
+_TUPLE_TO_INT.update({joker: DECK_SIZE + i for i, joker in enumerate(JOKERS)})
+_INT_TO_TUPLE = [None] * (DECK_SIZE + len(JOKERS))
+for _card_tuple, _card in _TUPLE_TO_INT.items():
+    _INT_TO_TUPLE[_card] = _card_tuple
+_INT_TO_TUPLE = tuple(_INT_TO_TUPLE)
+
+
+def make_card(rank: int, suit: int) -> int:
+    """Build an encoded card from a rank index and a suit index.
+
+    Args:
+        rank (int): Index into RANKS (0 for "2", 12 for "A").
+        suit (int): Index into SUITS.
+
+    Returns:
+        int: Encoded card.
+    """
+    return rank << 2 | suit
+
+
+def card_rank(card: int) -> int:
+    """Return the rank index (0 for "2", 12 for "A") of an encoded card.
+
+    Args:
+        card (int): Encoded card.
+
+    Returns:
+        int: Rank index of the card.
+    """
+    return card >> 2
+
+
+def card_suit(card: int) -> int:
+    """Return the suit index of an encoded card.
+
+    Args:
+        card (int): Encoded card.
+
+    Returns:
+        int: Suit index of the card.
+    """
+    return card & 3
+
+
+def is_joker(card: int) -> bool:
+    """Return whether an encoded card is a joker.
+
+    Args:
+        card (int): Encoded card.
+
+    Returns:
+        bool: True for the jokers 52 and 53.
+    """
+    return card >= DECK_SIZE
+
+
+def reject_jokers(cards: list[int]) -> None:
+    """Check that encoded cards hold no joker, for the standard evaluators.
+
+    Args:
+        cards (list[int]): Encoded cards.
+
+    Raises:
+        ValueError: If any card is a joker.
+    """
+    if any(card >= DECK_SIZE for card in cards):
+        raise ValueError(
+            "Jokers are wild cards; evaluate the hand with poker.wild.evaluate_wild"
+        )
+
+
+def repeated_cards_error(cards: list[int]) -> ValueError:
+    """Return the error for a hand the single-deck tables cannot score.
+
+    Args:
+        cards (list[int]): The encoded hand, e.g. five of a kind from a shoe.
+
+    Returns:
+        ValueError: Error pointing to poker.shoe.evaluate_shoe.
+    """
+    return ValueError(
+        f"Cannot score {list(cards)} with one deck's tables; evaluate hands with "
+        "repeated cards with poker.shoe.evaluate_shoe"
+    )
+
+
+def encode_card(card: tuple[str, str] | int) -> int:
+    """Convert a (suit, value) tuple to its integer encoding.
+
+    Already encoded cards are returned unchanged, so the function can be used
+    at API boundaries that accept both representations. Other integer types,
+    such as the NumPy integers of poker.strategy.BatchResult, become ints.
+
+    Args:
+        card (tuple[str, str] | int): Card as a (suit, value) tuple or an int.
+
+    Returns:
+        int: Encoded card.
+
+    Raises:
+        ValueError: If the tuple does not describe a valid card, or the int
+            is not the code of a card or joker.
+    """
+    if isinstance(card, Integral):
+        if not 0 <= card < len(_INT_TO_TUPLE):
+            raise ValueError(f"Invalid card: {card!r}")
+        return int(card)
+    try:
+        return _TUPLE_TO_INT[card]
+    except KeyError:
+        raise ValueError(f"Invalid card: {card!r}") from None
+
+
+def decode_card(card: int) -> tuple[str, str]:
+    """Convert an encoded card back to its (suit, value) tuple.
+
+    Args:
+        card (int): Encoded card.
+
+    Returns:
+        tuple[str, str]: The card as a (suit, value) tuple.
+    """
+    return _INT_TO_TUPLE[card]
+
+
+def encode_cards(cards: list[tuple[str, str] | int]) -> list[int]:
+    """Encode a list of cards, accepting tuples and ints alike.
+
+    Args:
+        cards (list[tuple[str, str] | int]): Cards to encode.
+
+    Returns:
+        list[int]: Encoded cards in the same order.
+
+    Raises:
+        ValueError: If any card is invalid, see encode_card.
+    """
+    # Plain ints in range, the common case, skip the call; everything else,
+    # bools and NumPy integers included, goes through encode_card.
+    limit = len(_INT_TO_TUPLE)
+    return [
+        card if card.__class__ is int and 0 <= card < limit else encode_card(card)
+        for card in cards
+    ]
+
+
+def decode_cards(cards: list[int]) -> list[tuple[str, str]]:
+    """Decode a list of encoded cards to (suit, value) tuples.
+
+    Args:
+        cards (list[int]): Encoded cards.
+
+    Returns:
+        list[tuple[str, str]]: Cards as (suit, value) tuples in the same order.
+    """
+    return [_INT_TO_TUPLE[card] for card in cards]
@@ -0,0 +1,143 @@
+"""Command-line bulk evaluator: ``poker-eval [FILE ...]``.
+
+Reads one hand per line in compact notation, such as ``AhKdQs10cJh`` or
+``Ah Kd Qs Tc Jh``, from the given files or stdin, and writes one line per
+hand to stdout:
+
+    AhKdQs10cJh	5863	Straight
+
+with the hand as read, its strength (1..7462, higher is better) and its
+category. Blank lines are ignored; lines that are not five distinct cards
+are reported on stderr with their file and line number, and make the exit
+status 1.
+
+Cards are split by a precomputed token table instead of per-card parsing,
+and input is read, evaluated and written in chunks, so memory use does not
+grow with the size of the input.
+"""
+import argparse
+import sys
+from itertools import islice
+from typing import TYPE_CHECKING
+
+from poker.cards import RANKS, make_card
+from poker.evaluator import CATEGORY_NAMES, evaluate5, hand_category
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import TextIO
+
+# Every spelling of every card: rank "10" or "T" (any case for letters) and
+# suit letter h, d, c, s (any case), in the order of cards.SUITS.
+TOKENS = {
+    rank_text + suit_text: make_card(rank, suit)
+    for rank, name in enumerate(RANKS)
+    for rank_text in {name, name.lower(), *(("T", "t") if name == "10" else ())}
+    for suit, letter in enumerate("hdcs")
+    for suit_text in (letter, letter.upper())
+}
+
+_SEPARATORS = str.maketrans("", "", " \t,")
+
+DEFAULT_CHUNK = 4096
+
+
+def parse_hand(text: str) -> list[int]:
+    """Parse a hand written in compact notation.
+
+    Args:
+        text (str): Five cards such as "AhKdQs10cJh"; spaces and commas
+            between cards are allowed.
+
+    Returns:
+        list[int]: The encoded cards.
+
+    Raises:
+        ValueError: If the text is not five distinct valid cards.
+    """
+    text = text.translate(_SEPARATORS)
+    cards = []
+    start = 0
+    while start < len(text):
+        width = 2 if text[start:start + 2] in TOKENS else 3
+        card = TOKENS.get(text[start:start + width])
+        if card is None:
+            raise ValueError(f"Invalid card at {text[start:start + 3]!r}")
+        cards.append(card)
+        start += width
+    if len(cards) != 5 or len(set(cards)) != 5:
+        raise ValueError(f"Expected five distinct cards, got {len(cards)}")
+    return cards
+
+
+def evaluate_stream(
+    lines: "Iterable[str]",
+    out: "TextIO",
+    name: str = "<stdin>",
+    chunk_size: int = DEFAULT_CHUNK,
+    errors: "TextIO | None" = None,
+) -> int:
+    """Evaluate hands line by line and write one result line per hand.
+
+    Args:
+        lines (Iterable[str]): Input lines, one hand each.
+        out (TextIO): Where results are written.
+        name (str, optional): Input name used in error messages.
+        chunk_size (int, optional): Lines read and written at a time.
+        errors (TextIO | None, optional): Where invalid lines are reported.
+            Defaults to sys.stderr.
+
+    Returns:
+        int: Number of invalid lines.
+    """
+    errors = sys.stderr if errors is None else errors
+    lines = iter(lines)
+    number = invalid = 0
+    while chunk := list(islice(lines, chunk_size)):
+        results = []
+        for line in chunk:
+            number += 1
+            hand = line.strip()
+            if not hand:
+                continue
+            try:
+                strength = evaluate5(*parse_hand(hand))
+            except ValueError as exc:
+                print(f"{name}:{number}: {exc}", file=errors)
+                invalid += 1
+                continue
+            category = CATEGORY_NAMES[hand_category(strength)]
+            results.append(f"{hand}\t{strength}\t{category}\n")
+        out.write("".join(results))
+    return invalid
+
+
+def main(argv: "list[str] | None" = None) -> int:
+    """Run the bulk evaluator from the command line.
+
+    Args:
+        argv (list[str] | None, optional): Command line arguments.
+
+    Returns:
+        int: Process exit code, 1 if any line was invalid.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "files", nargs="*", default=["-"], help="input files, '-' for stdin"
+    )
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK)
+    args = parser.parse_args(argv)
+
+    invalid = 0
+    for path in args.files:
+        if path == "-":
+            lines, name = sys.stdin, "<stdin>"
+            invalid += evaluate_stream(lines, sys.stdout, name, args.chunk_size)
+        else:
+            with open(path) as source:
+                invalid += evaluate_stream(source, sys.stdout, path, args.chunk_size)
+    return 1 if invalid else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""Seedable deck of encoded cards with allocation-free dealing.
+
+Deck keeps its cards in one bytearray and deals with a partial Fisher-Yates
+shuffle: each dealt card is swapped from a random position of the undealt
+part into the next slot, so dealing n cards costs n swaps and never shifts or
+copies the rest of the deck. Every Deck owns its random.Random, so a deck
+built with the same seed deals the same cards again.
+"""
+import random
+
+from poker.cards import DECK_SIZE
+
+
+class Deck:
+    """A deck of encoded cards dealt by partial Fisher-Yates shuffling.
+
+    Attributes:
+        seed (int | None): Seed the deck's random generator was created with.
+    """
+
+    __slots__ = ("seed", "_cards", "_dealt", "_random")
+
+    def __init__(
+        self, seed: int | None = None, cards: "list[int] | None" = None
+    ) -> None:
+        """Create a full deck, or a deck of the given cards.
+
+        Args:
+            seed (int | None, optional): Seed of the deck's random generator.
+                Defaults to a random seed.
+            cards (list[int] | None, optional): Encoded cards to put in the
+                deck. Defaults to all 52 cards.
+        """
+        self.seed = seed
+        self._cards = bytearray(range(DECK_SIZE) if cards is None else cards)
+        self._dealt = 0
+        self._random = random.Random(seed).random
+
+    def __len__(self) -> int:
+        """Return the number of cards left to deal."""
+        return len(self._cards) - self._dealt
+
+    def reset(self) -> None:
+        """Return every dealt card to the deck.
+
+        The random stream continues, so the next deal differs from the
+        previous one; create a new Deck with the same seed to replay.
+        """
+        self._dealt = 0
+
+    def draw(self) -> int:
+        """Deal a single card.
+
+        Returns:
+            int: The encoded card.
+
+        Raises:
+            ValueError: If the deck is empty.
+        """
+        cards = self._cards
+        i = self._dealt
+        left = len(cards) - i
+        if left <= 0:
+            raise ValueError("No cards left in the deck")
+        j = i + int(self._random() * left)
+        cards[i], cards[j] = cards[j], cards[i]
+        self._dealt = i + 1
+        return cards[i]
+
+    def deal(
+        self, n: int, out: "list[int] | bytearray | None" = None, start: int = 0
+    ) -> "list[int] | bytearray":
+        """Deal n cards, optionally into a preallocated buffer.
+
+        Args:
+            n (int): Number of cards to deal.
+            out (list[int] | bytearray | None, optional): Buffer to write the
+                cards into. Defaults to a new list.
+            start (int, optional): First position in out to fill. Defaults to 0.
+
+        Returns:
+            list[int] | bytearray: The buffer holding the dealt cards.
+
+        Raises:
+            ValueError: If fewer than n cards are left.
+        """
+        cards = self._cards
+        size = len(cards)
+        first = self._dealt
+        if n > size - first:
+            raise ValueError(f"Cannot deal {n} cards, only {size - first} left")
+        if out is None:
+            out = [0] * n
+        rand = self._random
+        for i in range(first, first + n):
+            j = i + int(rand() * (size - i))
+            card = cards[j]
+            cards[j] = cards[i]
+            cards[i] = card
+            out[start] = card
+            start += 1
+        self._dealt = first + n
+        return out
+
+    def deal_hands(self, players: int, n: int = 5) -> list[list[int]]:
+        """Deal n cards to each of a number of players.
+
+        Args:
+            players (int): Number of players.
+            n (int, optional): Cards per player. Defaults to 5.
+
+        Returns:
+            list[list[int]]: One list of encoded cards per player.
+        """
+        return [self.deal(n) for _ in range(players)]
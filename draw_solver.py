@@ -0,0 +1,127 @@
+"""Exact optimal-discard solver for five-card draw.
+
+For every one of the 32 ways to hold cards from a hand the solver counts, over
+all replacement cards left in the deck, how many final hands land in each
+category. The counts are exact: every combination of replacements is scored
+with poker.batch. They depend only on the suit-canonical form of the hand, so
+they are memoized per canonical hand and a payout table is applied on top.
+"""
+from dataclasses import dataclass
+from functools import cache
+from itertools import combinations
+
+import numpy as np
+
+from poker import evaluator
+from poker.batch import evaluate_hands_batch, hand_categories_batch
+from poker.canonical import canonicalize
+from poker.cards import DECK_SIZE, encode_cards
+
+DEFAULT_PAYOUTS = {
+    evaluator.HIGH_CARD: 0,
+    evaluator.ONE_PAIR: 1,
+    evaluator.TWO_PAIRS: 2,
+    evaluator.THREE_OF_A_KIND: 3,
+    evaluator.STRAIGHT: 4,
+    evaluator.FLUSH: 6,
+    evaluator.FULL_HOUSE: 9,
+    evaluator.FOUR_OF_A_KIND: 25,
+    evaluator.STRAIGHT_FLUSH: 50,
+    evaluator.ROYAL_FLUSH: 800,
+}
+
+
+@dataclass(frozen=True)
+class DrawOption:
+    """Outcome of one discard choice.
+
+    Attributes:
+        discard (tuple[int, ...]): Indices of the discarded cards.
+        counts (tuple[int, ...]): Number of final hands per category, indexed
+            by category (index 0 is unused).
+        expected_value (float): Average payout under the payout table.
+    """
+
+    discard: tuple[int, ...]
+    counts: tuple[int, ...]
+    expected_value: float
+
+    @property
+    def total(self) -> int:
+        """Number of equally likely final hands."""
+        return sum(self.counts)
+
+
+@cache
+def _replacement_indices(draws: int) -> np.ndarray:
+    """Return every combination of ``draws`` positions in the 47-card stub."""
+    stub = DECK_SIZE - 5
+    indices = list(combinations(range(stub), draws))
+    return np.array(indices, dtype=np.uint8).reshape(len(indices), draws)
+
+
+@cache
+def _hold_counts(canonical: tuple[int, ...]) -> tuple[tuple[int, ...], ...]:
+    """Return category counts for each hold bitmask of a canonical hand."""
+    stub = [card for card in range(DECK_SIZE) if card not in canonical]
+    stub = np.array(stub, dtype=np.uint8)
+    result = []
+    for hold in range(32):
+        held = [card for idx, card in enumerate(canonical) if hold >> idx & 1]
+        drawn = stub[_replacement_indices(5 - len(held))]
+        held = np.broadcast_to(np.array(held, dtype=np.uint8), (len(drawn), len(held)))
+        hands = np.hstack([held, drawn])
+        categories = hand_categories_batch(evaluate_hands_batch(hands))
+        counts = np.bincount(categories, minlength=evaluator.ROYAL_FLUSH + 1)
+        result.append(tuple(counts.tolist()))
+    return tuple(result)
+
+
+def draw_options(
+    hand: list[tuple[str, str] | int],
+    payouts: dict[int, float] | None = None,
+) -> list[DrawOption]:
+    """Return all 32 discard choices of a hand, best first.
+
+    Args:
+        hand (list[tuple[str, str] | int]): The five cards of the hand.
+        payouts (dict[int, float] | None, optional): Payout per hand category;
+            missing categories pay nothing. Defaults to DEFAULT_PAYOUTS.
+
+    Returns:
+        list[DrawOption]: Discard choices ordered by expected value, ties
+        broken in favour of discarding fewer cards.
+    """
+    if payouts is None:
+        payouts = DEFAULT_PAYOUTS
+    cards = encode_cards(hand)
+    canonical, suit_map = canonicalize(cards)
+    # Position of each original card in the canonical hand.
+    positions = [canonical.index(card & ~3 | suit_map[card & 3]) for card in cards]
+    table = [payouts.get(category, 0) for category in range(evaluator.ROYAL_FLUSH + 1)]
+
+    options = []
+    for hold, counts in enumerate(_hold_counts(canonical)):
+        discard = tuple(idx for idx, pos in enumerate(positions) if not hold >> pos & 1)
+        value = sum(pay * count for pay, count in zip(table, counts)) / sum(counts)
+        options.append(DrawOption(discard, counts, value))
+    options.sort(key=lambda option: (-option.expected_value, len(option.discard)))
+    return options
+
+
+def solve_draw(
+    hand: list[tuple[str, str] | int],
+    payouts: dict[int, float] | None = None,
+) -> DrawOption:
+    """Return the discard choice with the highest expected payout.
+
+    Args:
+        hand (list[tuple[str, str] | int]): The five cards of the hand.
+        payouts (dict[int, float] | None, optional): Payout per hand category.
+            Defaults to DEFAULT_PAYOUTS.
+
+    Returns:
+        DrawOption: The best discard; its indices can be passed to
+        main.change_cards.
+    """
+    return draw_options(hand, payouts)[0]
@@ -0,0 +1,167 @@
+"""Headless five-card draw engine.
+
+play_game runs one complete game (deal, draw, evaluate, showdown) on encoded
+cards without any terminal I/O. Discards are chosen by a policy, a callable
+that receives the seat index and the player's cards and returns the indices
+to replace, so the same engine serves the console game in main(), bots and
+bulk regression runs. run_games streams any number of seeded games and
+write_results sends them to a file as JSON lines.
+"""
+import json
+import random
+from dataclasses import asdict, dataclass
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from poker.deck import Deck
+from poker.evaluator import evaluate5, hand_category
+from poker.instrumentation import METRICS
+from poker.main import change_cards
+from poker.showdown import rank_strengths
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+    from typing import TextIO
+
+    Policy = Callable[[int, list[int]], "Sequence[int] | None"]
+
+
+@dataclass(frozen=True)
+class GameResult:
+    """Everything that happened in one game, seat by seat.
+
+    Attributes:
+        seed (int): Seed that replays the game with the same policies.
+        dealt (tuple[tuple[int, ...], ...]): Encoded cards dealt to each seat.
+        discards (tuple[tuple[int, ...], ...]): Indices each seat replaced,
+            in ascending order.
+        final (tuple[tuple[int, ...], ...]): Encoded cards after the draw.
+        strengths (tuple[int, ...]): Evaluator strength of each final hand.
+        ranking (tuple[tuple[int, ...], ...]): Seats grouped by strength,
+            best first; the first group holds the winners.
+    """
+
+    seed: int
+    dealt: tuple[tuple[int, ...], ...]
+    discards: tuple[tuple[int, ...], ...]
+    final: tuple[tuple[int, ...], ...]
+    strengths: tuple[int, ...]
+    ranking: tuple[tuple[int, ...], ...]
+
+    @property
+    def winners(self) -> tuple[int, ...]:
+        """Seats that won or split the pot."""
+        return self.ranking[0]
+
+
+def stand_pat(seat: int, cards: list[int]) -> None:
+    """Policy that never replaces any card.
+
+    Args:
+        seat (int): Index of the player.
+        cards (list[int]): The player's encoded cards.
+    """
+    return None
+
+
+def play_game(
+    players: int = 2,
+    policy: "Policy | Sequence[Policy]" = stand_pat,
+    seed: int | None = None,
+) -> GameResult:
+    """Play one complete game without terminal I/O.
+
+    Args:
+        players (int, optional): Number of players. Defaults to 2.
+        policy (Policy | Sequence[Policy], optional): Discard policy for every
+            seat, or one policy per seat. The indices it returns are replaced
+            in ascending order, each once. Defaults to stand_pat.
+        seed (int | None, optional): Seed of the deal; a random one is picked
+            and recorded in the result when omitted.
+
+    Returns:
+        GameResult: The complete record of the game.
+    """
+    if seed is None:
+        seed = random.getrandbits(64)
+    policies = policy if isinstance(policy, (list, tuple)) else [policy] * players
+
+    timed = METRICS.enabled
+    if timed:
+        start = perf_counter()
+
+    deck = Deck(seed)
+    hands = deck.deal_hands(players)
+    if timed:
+        start = METRICS.lap("deal", start)
+
+    dealt, discards, final = [], [], []
+    for seat, cards in enumerate(hands):
+        dealt.append(tuple(cards))
+        # Replacements are drawn in position order, whatever order the policy
+        # lists the cards in, so a result always replays from its discards.
+        indices = tuple(sorted(set(policies[seat](seat, list(cards)) or ())))
+        change_cards(cards, deck, list(indices))
+        discards.append(indices)
+        final.append(tuple(cards))
+    if timed:
+        start = METRICS.lap("draw", start)
+
+    strengths = tuple(evaluate5(*cards) for cards in final)
+    if timed:
+        start = METRICS.lap("evaluate", start)
+        for strength in strengths:
+            METRICS.count_category(hand_category(strength))
+
+    ranking = rank_strengths(dict(enumerate(strengths)))
+    if timed:
+        METRICS.lap("showdown", start)
+    return GameResult(
+        seed=seed,
+        dealt=tuple(dealt),
+        discards=tuple(discards),
+        final=tuple(final),
+        strengths=strengths,
+        ranking=tuple(tuple(group) for group in ranking),
+    )
+
+
+def run_games(
+    games: int,
+    players: int = 2,
+    policy: "Policy | Sequence[Policy]" = stand_pat,
+    seed: int = 0,
+) -> "Iterator[GameResult]":
+    """Play a reproducible stream of games.
+
+    Args:
+        games (int): Number of games to play.
+        players (int, optional): Number of players per game. Defaults to 2.
+        policy (Policy | Sequence[Policy], optional): Discard policy, as in
+            play_game. Defaults to stand_pat.
+        seed (int, optional): Master seed of the stream. Defaults to 0.
+
+    Yields:
+        GameResult: One result per game, each with its own derived seed.
+    """
+    master = random.Random(seed)
+    for _ in range(games):
+        yield play_game(players, policy, master.getrandbits(64))
+
+
+def write_results(results: "Iterable[GameResult]", sink: "TextIO") -> int:
+    """Stream game results to a text file as JSON lines.
+
+    Args:
+        results (Iterable[GameResult]): Games to write, e.g. from run_games.
+        sink (TextIO): Open text file to write to.
+
+    Returns:
+        int: Number of games written.
+    """
+    written = 0
+    for result in results:
+        sink.write(json.dumps(asdict(result), separators=(",", ":")))
+        sink.write("\n")
+        written += 1
+    return written
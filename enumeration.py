@@ -0,0 +1,157 @@
+"""Exhaustive enumeration of all 2,598,960 five-card hands.
+
+The hands are split into 1,326 groups by their two lowest cards, and the
+groups are spread over a process pool. count_hands produces the exact number
+of hands per strength and per category; verify_reference sweeps the same
+hands through main.evaluate_hand and the hand_logic predicates and reports
+every hand on which they disagree with the lookup-table evaluator.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import combinations
+from typing import TYPE_CHECKING
+
+from poker import evaluator, hand_logic
+from poker.cards import DECK_SIZE, decode_cards
+from poker.main import evaluate_hand, extract_colors_and_values
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+TOTAL_HANDS = 2_598_960
+
+PREFIXES = tuple(combinations(range(DECK_SIZE), 2))
+
+
+@dataclass(frozen=True)
+class HandCounts:
+    """Exact frequencies over a set of five-card hands.
+
+    Attributes:
+        strengths (tuple[int, ...]): Number of hands of every strength,
+            indexed by strength (index 0 is unused).
+    """
+
+    strengths: tuple[int, ...]
+
+    @property
+    def total(self) -> int:
+        """Number of counted hands."""
+        return sum(self.strengths)
+
+    @property
+    def categories(self) -> dict[int, int]:
+        """Number of hands per category, from HIGH_CARD to ROYAL_FLUSH."""
+        counts = dict.fromkeys(evaluator.CATEGORY_NAMES, 0)
+        for strength, count in enumerate(self.strengths[1:], start=1):
+            counts[evaluator.hand_category(strength)] += count
+        return counts
+
+
+def _count_prefix(prefix: tuple[int, int]) -> list[int]:
+    """Count strengths of all hands whose two lowest cards are the prefix."""
+    first, second = prefix
+    counts = [0] * (evaluator.MAX_STRENGTH + 1)
+    evaluate5 = evaluator.evaluate5
+    for third, fourth, fifth in combinations(range(second + 1, DECK_SIZE), 3):
+        counts[evaluate5(first, second, third, fourth, fifth)] += 1
+    return counts
+
+
+def _map(
+    function: "Callable[[tuple[int, int]], list]",
+    prefixes: "Sequence[tuple[int, int]]",
+    workers: int | None,
+) -> list:
+    """Run a per-prefix function in process or over a process pool."""
+    if workers == 1:
+        return [function(prefix) for prefix in prefixes]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(function, prefixes, chunksize=16))
+
+
+def count_hands(
+    workers: int | None = None, prefixes: "Sequence[tuple[int, int]] | None" = None
+) -> HandCounts:
+    """Count every five-card hand by strength.
+
+    Args:
+        workers (int | None, optional): Worker processes; 1 runs in the
+            current process and None uses every core. Defaults to None.
+        prefixes (Sequence[tuple[int, int]] | None, optional): Restrict the
+            sweep to hands whose two lowest cards are one of these pairs.
+            Defaults to all hands.
+
+    Returns:
+        HandCounts: Number of hands per strength.
+    """
+    totals = [0] * (evaluator.MAX_STRENGTH + 1)
+    for counts in _map(_count_prefix, prefixes or PREFIXES, workers):
+        for strength, count in enumerate(counts):
+            totals[strength] += count
+    return HandCounts(tuple(totals))
+
+
+def _expected_predicates(category: int) -> dict[str, bool]:
+    """Return what every hand_logic predicate should say for a category."""
+    return {
+        "is_royal_flush": category == evaluator.ROYAL_FLUSH,
+        "is_straight": category in (
+            evaluator.STRAIGHT, evaluator.STRAIGHT_FLUSH, evaluator.ROYAL_FLUSH,
+        ),
+        "check_flush": category in (
+            evaluator.FLUSH, evaluator.STRAIGHT_FLUSH, evaluator.ROYAL_FLUSH,
+        ),
+        "find_three_of_a_kind": category in (
+            evaluator.THREE_OF_A_KIND, evaluator.FULL_HOUSE,
+        ),
+        "find_four_of_a_kind": category == evaluator.FOUR_OF_A_KIND,
+        "has_full_house": category == evaluator.FULL_HOUSE,
+    }
+
+
+def _verify_prefix(prefix: tuple[int, int]) -> list[tuple]:
+    """Check the reference code on all hands starting with the prefix."""
+    first, second = prefix
+    mismatches = []
+    for rest in combinations(range(second + 1, DECK_SIZE), 3):
+        hand = [first, second, *rest]
+        category = evaluator.hand_category(evaluator.evaluate5(*hand))
+        result = evaluate_hand(hand)
+        if (result if result == 10 else result[0]) != category:
+            mismatches.append((decode_cards(hand), "evaluate_hand", result))
+
+        colors, values = extract_colors_and_values(decode_cards(hand))
+        actual = {
+            "is_royal_flush": hand_logic.is_royal_flush(colors, values),
+            "is_straight": hand_logic.is_straight(values),
+            "check_flush": hand_logic.check_flush(colors),
+            "find_three_of_a_kind": hand_logic.find_three_of_a_kind(values),
+            "find_four_of_a_kind": hand_logic.find_four_of_a_kind(values),
+            "has_full_house": hand_logic.has_full_house(values),
+        }
+        for name, expected in _expected_predicates(category).items():
+            if actual[name] != expected:
+                mismatches.append((decode_cards(hand), name, actual[name]))
+    return mismatches
+
+
+def verify_reference(
+    workers: int | None = None, prefixes: "Sequence[tuple[int, int]] | None" = None
+) -> list[tuple]:
+    """Check main.evaluate_hand and hand_logic against the evaluator.
+
+    Args:
+        workers (int | None, optional): Worker processes; 1 runs in the
+            current process and None uses every core. Defaults to None.
+        prefixes (Sequence[tuple[int, int]] | None, optional): Restrict the
+            sweep as in count_hands. Defaults to all hands.
+
+    Returns:
+        list[tuple]: (hand, function name, wrong result) for every
+        disagreement; empty when the reference code is correct.
+    """
+    mismatches = []
+    for found in _map(_verify_prefix, prefixes or PREFIXES, workers):
+        mismatches.extend(found)
+    return mismatches
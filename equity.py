@@ -0,0 +1,262 @@
+"""Precomputed heads-up equity of every pat five-card hand.
+
+For each of the 2,598,960 hands the table stores how many of the 1,533,939
+possible opponent hands (five of the other 47 cards) it beats and how many it
+ties, with both players standing pat. Strengths come from poker.evaluator,
+which ranks hands exactly like main.evaluate_hand.
+
+build_equity_file is the offline job. Counting opponents one by one would
+take 4 * 10**12 comparisons, so it counts by inclusion-exclusion instead:
+the opponents of a hand H that are weaker than H are all weaker hands, minus
+those sharing a card with H, plus those sharing two cards, and so on. For
+every set T of one to four cards, the strengths of the hands containing T are
+kept sorted, so each term is a binary search. The job needs NumPy
+(``pip install poker[fast]``) and takes about a minute.
+
+The file holds an 8-byte header (magic b"PKEQ", format version) and one
+record of two little-endian uint32 (wins, ties) per hand, ordered by the
+colexicographic index of its sorted cards. EquityTable memory-maps it and
+answers a query with one index computation and one 8-byte read. Records are
+kept per hand rather than per suit-canonical class (poker.canonical): the
+file is about 21 MB instead of about 1 MB, but a lookup needs no
+canonicalization, which costs more than the read itself.
+"""
+import argparse
+import mmap
+import struct
+from itertools import combinations
+from math import comb
+from typing import TYPE_CHECKING
+
+from poker.cards import DECK_SIZE, encode_cards
+from poker.evaluator import evaluate5
+
+if TYPE_CHECKING:
+    import numpy as np
+    from typing_extensions import Self
+
+MAGIC = b"PKEQ"
+VERSION = 1
+HEADER = struct.Struct("<4sI")
+RECORD = struct.Struct("<II")
+
+TOTAL_HANDS = comb(DECK_SIZE, 5)
+OPPONENT_HANDS = comb(DECK_SIZE - 5, 5)
+
+# _BINOMIAL[k][n] == comb(n, k), for colexicographic ranking.
+_BINOMIAL = tuple(
+    tuple(comb(n, k) for n in range(DECK_SIZE)) for k in range(6)
+)
+
+# Strengths fit in 13 bits, so (subset rank, strength) packs into one key.
+_STRENGTH_BITS = 13
+
+
+def hand_index(cards: "list[tuple[str, str] | int]") -> int:
+    """Return the colexicographic index of a five-card hand.
+
+    Args:
+        cards (list[tuple[str, str] | int]): Five distinct cards, in any order.
+
+    Returns:
+        int: Index between 0 and 2,598,959, the position of the hand's record.
+
+    Raises:
+        ValueError: If the hand does not hold five distinct cards.
+    """
+    cards = sorted(encode_cards(cards))
+    if len(cards) != 5 or len(set(cards)) != 5:
+        raise ValueError(f"Expected five distinct cards, got {cards}")
+    c0, c1, c2, c3, c4 = cards
+    return (
+        _BINOMIAL[1][c0] + _BINOMIAL[2][c1] + _BINOMIAL[3][c2]
+        + _BINOMIAL[4][c3] + _BINOMIAL[5][c4]
+    )
+
+
+def hand_equity(cards: "list[tuple[str, str] | int]") -> tuple[int, int]:
+    """Count wins and ties of one hand against every opponent hand directly.
+
+    This is the slow reference for the table: about a second per hand.
+
+    Args:
+        cards (list[tuple[str, str] | int]): Five distinct cards.
+
+    Returns:
+        tuple[int, int]: Opponent hands beaten and opponent hands tied.
+    """
+    cards = encode_cards(cards)
+    strength = evaluate5(*cards)
+    rest = [card for card in range(DECK_SIZE) if card not in cards]
+    wins = ties = 0
+    for opponent in combinations(rest, 5):
+        other = evaluate5(*opponent)
+        if other < strength:
+            wins += 1
+        elif other == strength:
+            ties += 1
+    return wins, ties
+
+
+def _colex_ranks(cards: "np.ndarray", positions: tuple[int, ...]) -> "np.ndarray":
+    """Return the colex rank of the given columns of sorted hands."""
+    import numpy as np
+
+    ranks = np.zeros(len(cards), dtype=np.int64)
+    for k, position in enumerate(positions, start=1):
+        ranks += np.asarray(_BINOMIAL[k], dtype=np.int64)[cards[:, position]]
+    return ranks
+
+
+def compute_equity(deck_size: int = DECK_SIZE) -> "tuple[np.ndarray, np.ndarray]":
+    """Count wins and ties of every hand against every opponent hand.
+
+    Args:
+        deck_size (int, optional): Play with the lowest deck_size cards only
+            (encoded 0 to deck_size - 1), so that the counting can be checked
+            on a small deck. Defaults to the full deck.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Wins and ties (uint32) of every hand,
+        indexed by hand_index.
+
+    Raises:
+        ValueError: If the deck cannot deal two hands.
+    """
+    # Imported here so that reading a table never needs NumPy.
+    import numpy as np
+
+    from poker.batch import evaluate_hands_batch
+
+    if not 10 <= deck_size <= DECK_SIZE:
+        raise ValueError(f"deck_size must be between 10 and {DECK_SIZE}")
+    cards = np.array(list(combinations(range(deck_size), 5)), dtype=np.uint8)
+    strengths = evaluate_hands_batch(cards).astype(np.int64)
+
+    # Level 0 is the empty set: every hand in the deck.
+    ordered = np.sort(strengths)
+    less = np.searchsorted(ordered, strengths, side="left").astype(np.int64)
+    equal = np.searchsorted(ordered, strengths, side="right") - less
+    del ordered
+
+    for size in range(1, 5):
+        sign = -1 if size % 2 else 1
+        subsets = list(combinations(range(5), size))
+        # Every hand holding a given set of `size` cards, one row per set.
+        row = comb(deck_size - size, 5 - size)
+        keys = np.concatenate([
+            _colex_ranks(cards, positions) << _STRENGTH_BITS | strengths
+            for positions in subsets
+        ])
+        keys.sort()
+        for positions in subsets:
+            ranks = _colex_ranks(cards, positions)
+            query = ranks << _STRENGTH_BITS | strengths
+            below = np.searchsorted(keys, query, side="left")
+            less += sign * (below - ranks * row)
+            equal += sign * (np.searchsorted(keys, query, side="right") - below)
+        del keys
+
+    # The hand itself (level 5) ties with its own strength.
+    equal -= 1
+
+    order = _colex_ranks(cards, (0, 1, 2, 3, 4))
+    wins = np.empty(len(cards), dtype=np.uint32)
+    ties = np.empty(len(cards), dtype=np.uint32)
+    wins[order] = less
+    ties[order] = equal
+    return wins, ties
+
+
+def build_equity_file(path: str) -> None:
+    """Compute the equity of every hand and write the table file.
+
+    Args:
+        path (str): Where to write the file (about 21 MB).
+    """
+    import numpy as np
+
+    wins, ties = compute_equity()
+    records = np.empty((TOTAL_HANDS, 2), dtype="<u4")
+    records[:, 0] = wins
+    records[:, 1] = ties
+    with open(path, "wb") as sink:
+        sink.write(HEADER.pack(MAGIC, VERSION))
+        sink.write(records.tobytes())
+
+
+class EquityTable:
+    """Memory-mapped equity table written by build_equity_file."""
+
+    def __init__(self, path: str) -> None:
+        """Open and map a table file.
+
+        Args:
+            path (str): Path of the file.
+
+        Raises:
+            ValueError: If the file is not a complete table of this version.
+        """
+        with open(path, "rb") as source:
+            self._map = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        expected = HEADER.size + TOTAL_HANDS * RECORD.size
+        if len(self._map) != expected or HEADER.unpack_from(self._map) != (
+            MAGIC, VERSION
+        ):
+            self._map.close()
+            raise ValueError(f"{path} is not a version {VERSION} equity table")
+
+    def __len__(self) -> int:
+        """Return the number of hands in the table."""
+        return TOTAL_HANDS
+
+    def counts(self, cards: "list[tuple[str, str] | int]") -> tuple[int, int]:
+        """Return how many opponent hands a hand beats and ties.
+
+        Args:
+            cards (list[tuple[str, str] | int]): Five distinct cards.
+
+        Returns:
+            tuple[int, int]: Wins and ties out of OPPONENT_HANDS.
+        """
+        offset = HEADER.size + hand_index(cards) * RECORD.size
+        return RECORD.unpack_from(self._map, offset)
+
+    def equity(self, cards: "list[tuple[str, str] | int]") -> float:
+        """Return the pot share of a hand against a random opponent hand.
+
+        Args:
+            cards (list[tuple[str, str] | int]): Five distinct cards.
+
+        Returns:
+            float: Win probability plus half the tie probability.
+        """
+        wins, ties = self.counts(cards)
+        return (wins + ties / 2) / OPPONENT_HANDS
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self._map.close()
+
+    def __enter__(self) -> "Self":
+        """Return the table itself for use in a with statement."""
+        return self
+
+    def __exit__(self, exc_type: object, exc: object, traceback: object) -> None:
+        """Unmap the file when leaving a with statement."""
+        self.close()
+
+
+def main(argv: "list[str] | None" = None) -> None:
+    """Build the equity table from the command line.
+
+    Args:
+        argv (list[str] | None, optional): Arguments; defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="file to write")
+    build_equity_file(parser.parse_args(argv).path)
+
+
+if __name__ == "__main__":
+    main()
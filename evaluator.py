@@ -0,0 +1,231 @@
+"""Lookup-table evaluator for five-card poker hands.
+
+Every five-card hand falls into one of 7462 equivalence classes. The tables
+below are built once at import and map a hand to its class strength, an
+integer from 1 (7-5-4-3-2 offsuit) to 7462 (Royal Flush), in a handful of
+lookups:
+
+* hands with five different values are looked up by the bitmask of their
+  values, in FLUSH_TABLE when all cards share a suit and in UNIQUE_TABLE
+  otherwise,
+* hands with repeated values are looked up in PAIRED_TABLE by the product of
+  the primes assigned to their values, which is unique for every multiset.
+
+Higher strength always means a better hand, and the category numbers match
+the ones returned by main.evaluate_hand.
+"""
+from itertools import combinations
+
+from poker.cards import DECK_SIZE, encode_cards, reject_jokers, repeated_cards_error
+
+HIGH_CARD = 1
+ONE_PAIR = 2
+TWO_PAIRS = 3
+THREE_OF_A_KIND = 4
+STRAIGHT = 5
+FLUSH = 6
+FULL_HOUSE = 7
+FOUR_OF_A_KIND = 8
+STRAIGHT_FLUSH = 9
+ROYAL_FLUSH = 10
+
+CATEGORY_NAMES = {
+    HIGH_CARD: "High Card",
+    ONE_PAIR: "One Pair",
+    TWO_PAIRS: "Two Pairs",
+    THREE_OF_A_KIND: "Three of a Kind",
+    STRAIGHT: "Straight",
+    FLUSH: "Flush",
+    FULL_HOUSE: "Full House",
+    FOUR_OF_A_KIND: "Four of a Kind",
+    STRAIGHT_FLUSH: "Straight Flush",
+    ROYAL_FLUSH: "Royal Flush",
+}
+
+MAX_STRENGTH = 7462
+
+PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+# Straights from the lowest (A-2-3-4-5, five high) to the highest (10-J-Q-K-A),
+# as value bitmasks together with the rank index of their top card.
+STRAIGHTS = [(0b1000000001111, 3)] + [(0b11111 << low, low + 4) for low in range(9)]
+
+FLUSH_TABLE = [0] * (1 << 13)
+UNIQUE_TABLE = [0] * (1 << 13)
+PAIRED_TABLE = {}
+
+_CATEGORIES = [0]
+_KICKERS = [()]
+
+_CARD_BIT = tuple(1 << (card >> 2) for card in range(DECK_SIZE))
+_CARD_PRIME = tuple(PRIMES[card >> 2] for card in range(DECK_SIZE))
+_CARD_SUIT = tuple(1 << (card & 3) for card in range(DECK_SIZE))
+
+
+def _mask(ranks: tuple[int, ...]) -> int:
+    """Return the value bitmask of distinct rank indices."""
+    mask = 0
+    for rank in ranks:
+        mask |= 1 << rank
+    return mask
+
+
+def _prime_product(ranks: tuple[int, ...]) -> int:
+    """Return the product of the primes assigned to the rank indices."""
+    product = 1
+    for rank in ranks:
+        product *= PRIMES[rank]
+    return product
+
+
+def _build_tables() -> None:
+    """Fill the lookup tables with every equivalence class, weakest first."""
+    straight_masks = {mask for mask, _ in STRAIGHTS}
+    no_straight = sorted(
+        tuple(reversed(ranks))
+        for ranks in combinations(range(13), 5)
+        if _mask(ranks) not in straight_masks
+    )
+
+    def others(*used: int) -> list[int]:
+        return [rank for rank in range(13) if rank not in used]
+
+    pairs = sorted(
+        (pair, *reversed(kickers))
+        for pair in range(13)
+        for kickers in combinations(others(pair), 3)
+    )
+    two_pairs = sorted(
+        (high, low, kicker)
+        for low, high in combinations(range(13), 2)
+        for kicker in others(high, low)
+    )
+    trips = sorted(
+        (three, *reversed(kickers))
+        for three in range(13)
+        for kickers in combinations(others(three), 2)
+    )
+    full_houses = sorted(
+        (three, pair) for three in range(13) for pair in others(three)
+    )
+    quads = sorted((four, kicker) for four in range(13) for kicker in others(four))
+
+    def add(category: int, kickers: tuple[int, ...]) -> int:
+        _CATEGORIES.append(category)
+        _KICKERS.append(kickers)
+        return len(_KICKERS) - 1
+
+    for ranks in no_straight:
+        UNIQUE_TABLE[_mask(ranks)] = add(HIGH_CARD, ranks)
+    for pair, *kickers in pairs:
+        product = _prime_product((pair, pair, *kickers))
+        PAIRED_TABLE[product] = add(ONE_PAIR, (pair, *kickers))
+    for high, low, kicker in two_pairs:
+        product = _prime_product((high, high, low, low, kicker))
+        PAIRED_TABLE[product] = add(TWO_PAIRS, (high, low, kicker))
+    for three, *kickers in trips:
+        product = _prime_product((three, three, three, *kickers))
+        PAIRED_TABLE[product] = add(THREE_OF_A_KIND, (three, *kickers))
+    for mask, top in STRAIGHTS:
+        UNIQUE_TABLE[mask] = add(STRAIGHT, (top,))
+    for ranks in no_straight:
+        FLUSH_TABLE[_mask(ranks)] = add(FLUSH, ranks)
+    for three, pair in full_houses:
+        product = _prime_product((three, three, three, pair, pair))
+        PAIRED_TABLE[product] = add(FULL_HOUSE, (three, pair))
+    for four, kicker in quads:
+        product = _prime_product((four, four, four, four, kicker))
+        PAIRED_TABLE[product] = add(FOUR_OF_A_KIND, (four, kicker))
+    for mask, top in STRAIGHTS:
+        FLUSH_TABLE[mask] = add(STRAIGHT_FLUSH, (top,))
+    _CATEGORIES[-1] = ROYAL_FLUSH
+
+
+_build_tables()
+_CATEGORIES = bytes(_CATEGORIES)
+_KICKERS = tuple(_KICKERS)
+
+
+def evaluate5(c0: int, c1: int, c2: int, c3: int, c4: int) -> int:
+    """Return the strength of five encoded cards.
+
+    This is the hot path used by the simulators; it takes the cards as
+    separate arguments to avoid building a sequence per hand.
+
+    Args:
+        c0 (int): First encoded card.
+        c1 (int): Second encoded card.
+        c2 (int): Third encoded card.
+        c3 (int): Fourth encoded card.
+        c4 (int): Fifth encoded card.
+
+    Returns:
+        int: Hand strength from 1 (worst) to 7462 (Royal Flush).
+    """
+    bit = _CARD_BIT
+    mask = bit[c0] | bit[c1] | bit[c2] | bit[c3] | bit[c4]
+    suit = _CARD_SUIT
+    if suit[c0] & suit[c1] & suit[c2] & suit[c3] & suit[c4]:
+        return FLUSH_TABLE[mask]
+    strength = UNIQUE_TABLE[mask]
+    if strength:
+        return strength
+    prime = _CARD_PRIME
+    return PAIRED_TABLE[prime[c0] * prime[c1] * prime[c2] * prime[c3] * prime[c4]]
+
+
+def evaluate_rank(cards: list[tuple[str, str] | int]) -> int:
+    """Return the strength of a five-card hand.
+
+    Args:
+        cards (list[tuple[str, str] | int]): Five cards as (suit, value) tuples
+            or encoded ints.
+
+    Returns:
+        int: Hand strength from 1 (worst) to 7462 (Royal Flush).
+
+    Raises:
+        ValueError: If the hand holds a joker, or repeats cards in a way the
+            single-deck tables cannot score (five of a kind, or a flush with
+            a repeated value, as a multi-deck shoe can deal); such hands are
+            scored by poker.shoe.evaluate_shoe.
+    """
+    cards = encode_cards(cards)
+    try:
+        strength = evaluate5(*cards)
+    except IndexError:
+        reject_jokers(cards)
+        raise
+    except KeyError:
+        strength = 0
+    if not strength:
+        raise repeated_cards_error(cards)
+    return strength
+
+
+def hand_category(strength: int) -> int:
+    """Return the hand category of a strength.
+
+    Args:
+        strength (int): Hand strength returned by evaluate_rank.
+
+    Returns:
+        int: Category from HIGH_CARD (1) to ROYAL_FLUSH (10).
+    """
+    return _CATEGORIES[strength]
+
+
+def hand_kickers(strength: int) -> tuple[int, ...]:
+    """Return the rank indices that decide ties within the hand's category.
+
+    The ranks come in order of significance: the grouped value(s) first, then
+    the remaining cards from the highest down. Straights and straight
+    flushes are described by their top card only (3, i.e. "5", for A-2-3-4-5).
+
+    Args:
+        strength (int): Hand strength returned by evaluate_rank.
+
+    Returns:
+        tuple[int, ...]: Rank indices into poker.cards.RANKS.
+    """
+    return _KICKERS[strength]
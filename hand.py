@@ -0,0 +1,163 @@
+"""Five-card hand that keeps its evaluation state up to date.
+
+Hand stores, next to its cards, everything poker.evaluator derives from them:
+the number of cards of each rank and suit, the bitmask of ranks present and
+the product of the rank primes. Replacing a card adjusts these in O(1), and
+the strength is then a single table lookup, so a draw solver or simulator can
+swap cards in and out without rebuilding the hand or re-counting values.
+
+Hand supports indexing, so main.change_cards can draw into it directly.
+"""
+from typing import TYPE_CHECKING
+
+from poker.cards import decode_cards, encode_cards
+from poker.evaluator import (
+    FLUSH_TABLE,
+    PAIRED_TABLE,
+    PRIMES,
+    UNIQUE_TABLE,
+    hand_category,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class Hand:
+    """Five encoded cards with an incrementally maintained summary.
+
+    The summary attributes are kept in sync by replace(); treat them as
+    read-only.
+
+    Attributes:
+        ranks (list[int]): Number of cards of each rank index.
+        suits (list[int]): Number of cards of each suit index.
+        mask (int): Bitmask of the rank indices present.
+        product (int): Product of the primes of the five ranks.
+    """
+
+    __slots__ = ("_cards", "ranks", "suits", "mask", "product", "_strength")
+
+    def __init__(self, cards: "list[tuple[str, str] | int]") -> None:
+        """Create a hand from five distinct cards.
+
+        Args:
+            cards (list[tuple[str, str] | int]): Cards as (suit, value) tuples
+                or encoded ints.
+
+        Raises:
+            ValueError: If the cards are not five distinct cards.
+        """
+        cards = encode_cards(cards)
+        if len(cards) != 5 or len(set(cards)) != 5:
+            raise ValueError(f"Expected five distinct cards, got {cards}")
+        self._cards = cards
+        self.ranks = [0] * 13
+        self.suits = [0, 0, 0, 0]
+        self.mask = 0
+        self.product = 1
+        for card in cards:
+            rank = card >> 2
+            self.ranks[rank] += 1
+            self.suits[card & 3] += 1
+            self.mask |= 1 << rank
+            self.product *= PRIMES[rank]
+        self._strength = 0
+
+    def __len__(self) -> int:
+        """Return the number of cards, always five."""
+        return 5
+
+    def __getitem__(self, index: int) -> int:
+        """Return the encoded card at a position."""
+        return self._cards[index]
+
+    def __setitem__(self, index: int, card: int) -> None:
+        """Replace the card at a position; see replace()."""
+        self.replace(index, card)
+
+    def __iter__(self) -> "Iterator[int]":
+        """Iterate over the encoded cards."""
+        return iter(self._cards)
+
+    def __repr__(self) -> str:
+        """Return the hand with its cards decoded."""
+        return f"Hand({decode_cards(self._cards)})"
+
+    @property
+    def cards(self) -> list[int]:
+        """Copy of the encoded cards, in hand order."""
+        return self._cards[:]
+
+    def replace(self, index: int, card: int) -> int:
+        """Replace one card and update the summary in O(1).
+
+        Args:
+            index (int): Position of the card to replace.
+            card (int): Encoded card to put in its place.
+
+        Returns:
+            int: The card that was replaced.
+
+        Raises:
+            ValueError: If the card is already in the hand.
+        """
+        old = self._cards[index]
+        if card == old:
+            return old
+        if card in self._cards:
+            raise ValueError(f"Card {card} is already in the hand")
+        self._cards[index] = card
+
+        ranks = self.ranks
+        rank = old >> 2
+        ranks[rank] -= 1
+        if not ranks[rank]:
+            self.mask ^= 1 << rank
+        self.suits[old & 3] -= 1
+        new_rank = card >> 2
+        if not ranks[new_rank]:
+            self.mask |= 1 << new_rank
+        ranks[new_rank] += 1
+        self.suits[card & 3] += 1
+        self.product = self.product // PRIMES[rank] * PRIMES[new_rank]
+        self._strength = 0
+        return old
+
+    def copy(self) -> "Hand":
+        """Return an independent copy, e.g. to try several draws.
+
+        Returns:
+            Hand: A hand holding the same cards.
+        """
+        other = Hand.__new__(Hand)
+        other._cards = self._cards[:]
+        other.ranks = self.ranks[:]
+        other.suits = self.suits[:]
+        other.mask = self.mask
+        other.product = self.product
+        other._strength = self._strength
+        return other
+
+    def strength(self) -> int:
+        """Return the strength of the hand, computed once per change.
+
+        Returns:
+            int: Strength on the evaluator.evaluate_rank scale.
+        """
+        if not self._strength:
+            if 5 in self.suits:
+                self._strength = FLUSH_TABLE[self.mask]
+            else:
+                self._strength = (
+                    UNIQUE_TABLE[self.mask] or PAIRED_TABLE[self.product]
+                )
+        return self._strength
+
+    def category(self) -> int:
+        """Return the category of the hand.
+
+        Returns:
+            int: Category from HIGH_CARD (1) to ROYAL_FLUSH (10).
+        """
+        return hand_category(self.strength())
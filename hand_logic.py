@@ -36,6 +36,8 @@ def is_royal_flush(colors: list[str], values: list[str]) -> bool:
 def is_straight(values: list[str]) -> bool:
     """Check if the hand is a straight (five consecutive values).
 
+    The Ace also counts as the lowest card, so A-2-3-4-5 is a straight.
+
     Args:
         values (list[str]): List of card values.
 
@@ -43,6 +45,8 @@ def is_straight(values: list[str]) -> bool:
         bool: True if the hand forms a straight, False otherwise.
     """
     sorted_values = to_numbers(values)
+    if sorted_values == [2, 3, 4, 5, 14]:
+        return True
     return all(sorted_values[i] + 1 == sorted_values[i + 1] for i in range(4))
 
 
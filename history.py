@@ -0,0 +1,203 @@
+"""Compact binary hand-history files.
+
+A history file starts with an 8-byte header (magic b"PKHS", format version
+and number of seats) followed by fixed-width little-endian records, one per
+game:
+
+* seed: unsigned 64-bit,
+* per seat: the five dealt cards (1 byte each), a bitmask of the discarded
+  positions (1 byte), the five final cards (1 byte each) and the strength of
+  the final hand (unsigned 16-bit).
+
+A two-player game takes 34 bytes. Because every record has the same width,
+HistoryReader can memory-map a file and jump to any game by index, or stream
+through all of them, without loading the file into memory.
+"""
+import mmap
+import struct
+from typing import TYPE_CHECKING
+
+from poker.engine import GameResult
+from poker.showdown import rank_strengths
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import BinaryIO
+
+    from typing_extensions import Self
+
+MAGIC = b"PKHS"
+VERSION = 1
+HEADER = struct.Struct("<4sHH")
+
+
+def record_struct(players: int) -> struct.Struct:
+    """Return the record layout for a number of seats.
+
+    Args:
+        players (int): Number of seats per game.
+
+    Returns:
+        struct.Struct: The fixed-width record layout.
+    """
+    return struct.Struct("<Q" + "5sB5sH" * players)
+
+
+def _discard_mask(indices: "Iterable[int]") -> int:
+    """Return the bitmask of discarded positions."""
+    mask = 0
+    for idx in indices:
+        mask |= 1 << idx
+    return mask
+
+
+class HistoryWriter:
+    """Appends games to a binary history file.
+
+    Attributes:
+        players (int): Number of seats every written game must have.
+        written (int): Number of games written so far.
+    """
+
+    def __init__(self, sink: "BinaryIO", players: int) -> None:
+        """Start a history file on an open binary stream.
+
+        Args:
+            sink (BinaryIO): Stream opened for binary writing.
+            players (int): Number of seats per game.
+        """
+        self._sink = sink
+        self._record = record_struct(players)
+        self.players = players
+        self.written = 0
+        sink.write(HEADER.pack(MAGIC, VERSION, players))
+
+    def write(self, result: GameResult) -> None:
+        """Append one game.
+
+        Args:
+            result (GameResult): Game to record, e.g. from engine.run_games.
+
+        Raises:
+            ValueError: If the game has a different number of seats.
+        """
+        if len(result.final) != self.players:
+            raise ValueError(f"Expected {self.players} seats, got {len(result.final)}")
+        fields = [result.seed]
+        for seat in range(self.players):
+            fields += (
+                bytes(result.dealt[seat]),
+                _discard_mask(result.discards[seat]),
+                bytes(result.final[seat]),
+                result.strengths[seat],
+            )
+        self._sink.write(self._record.pack(*fields))
+        self.written += 1
+
+    def write_all(self, results: "Iterable[GameResult]") -> int:
+        """Append every game of an iterable.
+
+        Args:
+            results (Iterable[GameResult]): Games to record.
+
+        Returns:
+            int: Number of games written by this call.
+        """
+        before = self.written
+        for result in results:
+            self.write(result)
+        return self.written - before
+
+
+class HistoryReader:
+    """Memory-mapped, randomly indexable view of a history file.
+
+    Attributes:
+        players (int): Number of seats per game.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Open and map a history file.
+
+        Args:
+            path (str): Path of the file.
+
+        Raises:
+            ValueError: If the file is not a history file of this version.
+        """
+        with open(path, "rb") as source:
+            self._map = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < HEADER.size:
+            self._map.close()
+            raise ValueError(f"{path} is not a hand-history file")
+        magic, version, players = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a version {VERSION} hand-history file")
+        self.players = players
+        self._record = record_struct(players)
+        self._count = (len(self._map) - HEADER.size) // self._record.size
+
+    def __len__(self) -> int:
+        """Return the number of games in the file."""
+        return self._count
+
+    def __getitem__(self, index: int) -> GameResult:
+        """Return one game by position.
+
+        Args:
+            index (int): Position of the game; negative values count from
+                the end.
+
+        Returns:
+            GameResult: The recorded game.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(f"Game index out of range: {index}")
+        offset = HEADER.size + index * self._record.size
+        return self._to_result(self._record.unpack_from(self._map, offset))
+
+    def __iter__(self) -> "Iterator[GameResult]":
+        """Stream every game in file order."""
+        # Unpacking record by record holds no buffer export between games,
+        # so the reader can be closed while an iterator is still alive.
+        unpack = self._record.unpack_from
+        size = self._record.size
+        for index in range(self._count):
+            yield self._to_result(unpack(self._map, HEADER.size + index * size))
+
+    def _to_result(self, fields: tuple) -> GameResult:
+        """Rebuild a GameResult from unpacked record fields."""
+        dealt, discards, final, strengths = [], [], [], []
+        for start in range(1, len(fields), 4):
+            hand, mask, drawn, strength = fields[start:start + 4]
+            dealt.append(tuple(hand))
+            discards.append(tuple(idx for idx in range(5) if mask >> idx & 1))
+            final.append(tuple(drawn))
+            strengths.append(strength)
+        ranking = rank_strengths(dict(enumerate(strengths)))
+        return GameResult(
+            seed=fields[0],
+            dealt=tuple(dealt),
+            discards=tuple(discards),
+            final=tuple(final),
+            strengths=tuple(strengths),
+            ranking=tuple(tuple(group) for group in ranking),
+        )
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self._map.close()
+
+    def __enter__(self) -> "Self":
+        """Return the reader itself for use in a with statement."""
+        return self
+
+    def __exit__(self, exc_type: object, exc: object, traceback: object) -> None:
+        """Unmap the file when leaving a with statement."""
+        self.close()
@@ -0,0 +1,250 @@
+"""Best-five-of-seven evaluation for Texas Hold'em.
+
+A hand of five to seven cards is summarised by three numbers that are cheap
+to update one card at a time: the product of the primes of its values (as in
+poker.evaluator), the number of cards of each suit and the value bitmask of
+each suit. The best hand is then two lookups:
+
+* FLUSH7_TABLE maps the value bitmask of a suit holding five or more cards to
+  its best flush or straight flush,
+* the unsuited table maps the prime product to the best hand that ignores
+  suits, built once on first use for every multiset of five to seven values.
+
+The larger of the two is the strength of the best five cards, on the same
+1..7462 scale as evaluator.evaluate_rank, without trying the 21 combinations.
+"""
+from poker.cards import DECK_SIZE, encode_cards
+from poker.evaluator import (
+    FLUSH_TABLE,
+    PAIRED_TABLE,
+    PRIMES,
+    STRAIGHTS,
+    UNIQUE_TABLE,
+)
+
+_CARD_PRIME = tuple(PRIMES[card >> 2] for card in range(DECK_SIZE))
+
+FLUSH7_TABLE = [0] * (1 << 13)
+
+_UNSUITED_TABLE = {}
+
+
+def _top_bits(mask: int, n: int) -> int:
+    """Return the mask of the n highest set bits of a value bitmask."""
+    top = 0
+    for rank in range(12, -1, -1):
+        if mask >> rank & 1:
+            top |= 1 << rank
+            n -= 1
+            if not n:
+                break
+    return top
+
+
+def _best_straight(mask: int) -> int:
+    """Return the bitmask of the highest straight inside a mask, or 0."""
+    for straight, _ in reversed(STRAIGHTS):
+        if mask & straight == straight:
+            return straight
+    return 0
+
+
+def _build_flush7() -> None:
+    """Fill FLUSH7_TABLE for every suit mask holding five or more values."""
+    for mask in range(1 << 13):
+        if mask.bit_count() >= 5:
+            best = _best_straight(mask) or _top_bits(mask, 5)
+            FLUSH7_TABLE[mask] = FLUSH_TABLE[best]
+
+
+def _best_unsuited(counts: list[int]) -> int:
+    """Return the best suit-less strength of a multiset of five to seven values.
+
+    Args:
+        counts (list[int]): Number of cards of every rank index.
+
+    Returns:
+        int: Strength of the best five cards, ignoring flushes.
+    """
+    ranks = range(12, -1, -1)
+    quads = [rank for rank in ranks if counts[rank] == 4]
+    trips = [rank for rank in ranks if counts[rank] == 3]
+    pairs = [rank for rank in ranks if counts[rank] == 2]
+    present = [rank for rank in ranks if counts[rank]]
+
+    def kickers(used: tuple[int, ...], n: int) -> list[int]:
+        return [rank for rank in present if rank not in used][:n]
+
+    def paired(ranks: list[int]) -> int:
+        product = 1
+        for rank in ranks:
+            product *= PRIMES[rank]
+        return PAIRED_TABLE[product]
+
+    if quads:
+        four = quads[0]
+        return paired([four] * 4 + kickers((four,), 1))
+    if trips and (len(trips) > 1 or pairs):
+        three = trips[0]
+        pair = max(trips[1:2] + pairs[:1])
+        return paired([three] * 3 + [pair] * 2)
+
+    mask = 0
+    for rank in present:
+        mask |= 1 << rank
+    straight = _best_straight(mask)
+    if straight:
+        return UNIQUE_TABLE[straight]
+
+    if trips:
+        three = trips[0]
+        return paired([three] * 3 + kickers((three,), 2))
+    if len(pairs) > 1:
+        high, low = pairs[:2]
+        return paired([high, high, low, low] + kickers((high, low), 1))
+    if pairs:
+        pair = pairs[0]
+        return paired([pair, pair] + kickers((pair,), 3))
+    return UNIQUE_TABLE[_top_bits(mask, 5)]
+
+
+def _build_unsuited() -> dict[int, int]:
+    """Fill the unsuited table for every multiset of five to seven values."""
+    counts = [0] * 13
+
+    def visit(rank: int, size: int, product: int) -> None:
+        if rank == 13:
+            if size >= 5:
+                _UNSUITED_TABLE[product] = _best_unsuited(counts)
+            return
+        for count in range(min(4, 7 - size) + 1):
+            counts[rank] = count
+            visit(rank + 1, size + count, product * PRIMES[rank] ** count)
+        counts[rank] = 0
+
+    visit(0, 0, 1)
+    return _UNSUITED_TABLE
+
+
+_build_flush7()
+
+
+class HoldemHand:
+    """Incrementally updated summary of up to seven cards.
+
+    Adding a card is O(1); strength() can be asked for as soon as the hand
+    holds five cards, e.g. after the flop, turn and river in turn.
+
+    Attributes:
+        size (int): Number of cards in the hand.
+    """
+
+    __slots__ = ("size", "_product", "_suit_counts", "_suit_masks")
+
+    def __init__(self, cards: "list[tuple[str, str] | int]" = ()) -> None:
+        """Create a hand, optionally holding some cards already.
+
+        Args:
+            cards (list[tuple[str, str] | int], optional): Initial cards.
+        """
+        self.size = 0
+        self._product = 1
+        self._suit_counts = [0, 0, 0, 0]
+        self._suit_masks = [0, 0, 0, 0]
+        for card in encode_cards(cards):
+            self.add(card)
+
+    def add(self, card: int) -> None:
+        """Add one encoded card.
+
+        Args:
+            card (int): Encoded card.
+
+        Raises:
+            ValueError: If the hand already holds seven cards.
+        """
+        if self.size == 7:
+            raise ValueError("A Hold'em hand holds at most seven cards")
+        suit = card & 3
+        self.size += 1
+        self._product *= _CARD_PRIME[card]
+        self._suit_counts[suit] += 1
+        self._suit_masks[suit] |= 1 << (card >> 2)
+
+    def copy(self) -> "HoldemHand":
+        """Return an independent copy, e.g. to try several board cards.
+
+        Returns:
+            HoldemHand: A hand holding the same cards.
+        """
+        other = HoldemHand()
+        other.size = self.size
+        other._product = self._product
+        other._suit_counts = self._suit_counts[:]
+        other._suit_masks = self._suit_masks[:]
+        return other
+
+    def strength(self) -> int:
+        """Return the strength of the best five cards of the hand.
+
+        Returns:
+            int: Strength on the evaluator.evaluate_rank scale.
+
+        Raises:
+            ValueError: If the hand holds fewer than five cards.
+        """
+        if self.size < 5:
+            raise ValueError("At least five cards are needed to evaluate a hand")
+        table = _UNSUITED_TABLE or _build_unsuited()
+        best = table[self._product]
+        for suit, count in enumerate(self._suit_counts):
+            if count >= 5:
+                return max(best, FLUSH7_TABLE[self._suit_masks[suit]])
+        return best
+
+
+def evaluate7(cards: "list[tuple[str, str] | int]") -> int:
+    """Return the strength of the best five of five to seven cards.
+
+    Args:
+        cards (list[tuple[str, str] | int]): Cards as (suit, value) tuples or
+            encoded ints.
+
+    Returns:
+        int: Strength on the evaluator.evaluate_rank scale.
+
+    Raises:
+        ValueError: If fewer than five or more than seven cards are given.
+    """
+    cards = encode_cards(cards)
+    if not 5 <= len(cards) <= 7:
+        raise ValueError(f"Expected five to seven cards, got {len(cards)}")
+    product = 1
+    suit_counts = [0, 0, 0, 0]
+    suit_masks = [0, 0, 0, 0]
+    for card in cards:
+        product *= _CARD_PRIME[card]
+        suit_counts[card & 3] += 1
+        suit_masks[card & 3] |= 1 << (card >> 2)
+
+    table = _UNSUITED_TABLE or _build_unsuited()
+    best = table[product]
+    for suit, count in enumerate(suit_counts):
+        if count >= 5:
+            return max(best, FLUSH7_TABLE[suit_masks[suit]])
+    return best
+
+
+def evaluate_holdem(
+    hole: "list[tuple[str, str] | int]", board: "list[tuple[str, str] | int]"
+) -> int:
+    """Return the strength of a player's best hand from hole and board cards.
+
+    Args:
+        hole (list[tuple[str, str] | int]): The player's two hole cards.
+        board (list[tuple[str, str] | int]): Three to five community cards.
+
+    Returns:
+        int: Strength on the evaluator.evaluate_rank scale.
+    """
+    return evaluate7(list(hole) + list(board))
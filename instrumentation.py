@@ -0,0 +1,200 @@
+"""Opt-in instrumentation for the game and evaluation hot paths.
+
+The package records nothing until METRICS.enabled is switched on with
+enable(); instrumented code only checks that one flag, so the disabled cost is
+a single attribute lookup. When enabled it keeps:
+
+* a counter of evaluated hands per category,
+* latency histograms for the deal, draw, evaluate and showdown phases,
+* a counter of announced outcomes (winners and tie-break results),
+
+and passes every phase timing to an optional profiling hook. snapshot()
+renders everything in the Prometheus text format.
+
+Messages meant for players (who won, tie-break results) go through report(),
+which prints by default and can be redirected or silenced with
+set_reporter().
+"""
+from bisect import bisect_left
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from poker.evaluator import CATEGORY_NAMES
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+PHASES = ("deal", "draw", "evaluate", "showdown")
+
+# Categories above a royal flush, which only hands from a multi-deck
+# poker.shoe.Shoe reach (numbered as there); listed only once counted.
+EXTRA_CATEGORY_NAMES = {11: "Five of a Kind", 12: "Flush Five"}
+
+# Upper bounds of the latency buckets, in seconds.
+BUCKETS = (
+    1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+    1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2, 1e-1,
+)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram.
+
+    Attributes:
+        counts (list[int]): Observations per bucket; the last one counts
+            values above every bound.
+        total (float): Sum of all observed values.
+    """
+
+    __slots__ = ("counts", "total")
+
+    def __init__(self) -> None:
+        """Create an empty histogram."""
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one observation.
+
+        Args:
+            seconds (float): Observed latency.
+        """
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.total += seconds
+
+    @property
+    def count(self) -> int:
+        """Number of observations."""
+        return sum(self.counts)
+
+
+class Metrics:
+    """Counters and histograms collected while instrumentation is enabled.
+
+    Attributes:
+        enabled (bool): Whether instrumented code records anything.
+        hook (Callable[[str, float], None] | None): Called with the phase name
+            and its duration for every timed phase.
+        categories (list[int]): Evaluated hands per category.
+        phases (dict[str, Histogram]): Latency histogram per phase.
+        outcomes (dict[str, int]): Announced outcomes by message.
+    """
+
+    def __init__(self) -> None:
+        """Create disabled, empty metrics."""
+        self.enabled = False
+        self.hook = None
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear every counter and histogram."""
+        self.categories = [0] * (max(EXTRA_CATEGORY_NAMES) + 1)
+        self.phases = {phase: Histogram() for phase in PHASES}
+        self.outcomes = {}
+
+    def lap(self, phase: str, start: float) -> float:
+        """Record the time since start for a phase and restart the clock.
+
+        Args:
+            phase (str): Name of the phase that just finished.
+            start (float): perf_counter() value when the phase started.
+
+        Returns:
+            float: The current perf_counter() value, the start of the next phase.
+        """
+        now = perf_counter()
+        self.phases[phase].observe(now - start)
+        if self.hook is not None:
+            self.hook(phase, now - start)
+        return now
+
+    def count_category(self, category: int) -> None:
+        """Count one evaluated hand.
+
+        Args:
+            category (int): Hand category, as in poker.evaluator.
+        """
+        self.categories[category] += 1
+
+    def count_outcome(self, outcome: str) -> None:
+        """Count one announced outcome.
+
+        Args:
+            outcome (str): The announced message, e.g. "player0 won".
+        """
+        self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+
+    def snapshot(self) -> str:
+        """Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: The metrics, one sample per line.
+        """
+        lines = ["# TYPE poker_hands_total counter"]
+        for category, name in CATEGORY_NAMES.items():
+            count = self.categories[category]
+            lines.append(f'poker_hands_total{{category="{name}"}} {count}')
+        for category, name in EXTRA_CATEGORY_NAMES.items():
+            if count := self.categories[category]:
+                lines.append(f'poker_hands_total{{category="{name}"}} {count}')
+
+        lines.append("# TYPE poker_phase_seconds histogram")
+        for phase, histogram in self.phases.items():
+            label = f'phase="{phase}"'
+            cumulative = 0
+            for bound, count in zip((*BUCKETS, "+Inf"), histogram.counts):
+                cumulative += count
+                bucket = f'{label},le="{bound}"'
+                lines.append(f"poker_phase_seconds_bucket{{{bucket}}} {cumulative}")
+            lines.append(f"poker_phase_seconds_sum{{{label}}} {histogram.total}")
+            lines.append(f"poker_phase_seconds_count{{{label}}} {cumulative}")
+
+        lines.append("# TYPE poker_outcomes_total counter")
+        for outcome, count in sorted(self.outcomes.items()):
+            lines.append(f'poker_outcomes_total{{outcome="{outcome}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+
+METRICS = Metrics()
+
+_reporter = print
+
+
+def enable(hook: "Callable[[str, float], None] | None" = None) -> None:
+    """Start recording metrics.
+
+    Args:
+        hook (Callable[[str, float], None] | None, optional): Profiling hook
+            called with (phase, seconds) for every timed phase.
+    """
+    METRICS.hook = hook
+    METRICS.enabled = True
+
+
+def disable() -> None:
+    """Stop recording metrics; collected values are kept until reset."""
+    METRICS.enabled = False
+    METRICS.hook = None
+
+
+def set_reporter(reporter: "Callable[[str], object] | None") -> None:
+    """Choose where report() sends messages.
+
+    Args:
+        reporter (Callable[[str], object] | None): Function receiving every
+            message, or None to drop them. The default is print.
+    """
+    global _reporter
+    _reporter = reporter
+
+
+def report(message: str) -> None:
+    """Announce a game outcome through the current reporter.
+
+    Args:
+        message (str): Message for the players, e.g. "player0 won".
+    """
+    if METRICS.enabled:
+        METRICS.count_outcome(message)
+    if _reporter is not None:
+        _reporter(message)
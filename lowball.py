@@ -0,0 +1,144 @@
+"""Deuce-to-seven and ace-to-five lowball evaluation.
+
+Both low games rank the same equivalence classes as poker.evaluator, only in
+a different order, so a low hand is scored by the standard evaluator followed
+by one lookup in a remap array indexed by standard strength. The arrays hold
+7,463 small integers each; the card tables are not copied.
+
+* Deuce-to-seven: the reverse of the high ordering, except that the ace is
+  always high, so A-2-3-4-5 is an ace-high hand (or an ace-high flush), not
+  a straight. The best hand is 7-5-4-3-2 of mixed suits.
+* Ace-to-five: the ace is the lowest rank and straights and flushes do not
+  count, so only pairs and ranks matter. The best hand is 5-4-3-2-A, suited
+  or not.
+
+As everywhere in the package, a higher strength is a better hand; here that
+means a lower hand.
+"""
+from array import array
+
+from poker.cards import encode_cards
+from poker.evaluator import (
+    FLUSH_TABLE,
+    MAX_STRENGTH,
+    ROYAL_FLUSH,
+    STRAIGHT,
+    STRAIGHT_FLUSH,
+    STRAIGHTS,
+    UNIQUE_TABLE,
+    evaluate5,
+    hand_category,
+    hand_kickers,
+)
+
+MAX_DEUCE_TO_SEVEN = MAX_STRENGTH
+
+# Rank masks of A-2-3-4-5 and of A-6-4-3-2, the lowest ace-high hand that
+# is not a straight.
+_WHEEL = STRAIGHTS[0][0]
+_ACE_SIX = 0b1000000010111
+
+# Pair structure of every category, the first thing ace-to-five compares.
+_PAIR_LEVELS = (0, 0, 1, 2, 3, 0, 0, 4, 5, 0, 0)
+
+
+def _deuce_to_seven_table() -> array:
+    """Return the deuce-to-seven strength of every standard strength."""
+    def key(strength: int) -> float:
+        # Wheels sit just below the lowest ace-high hand of their kind.
+        if strength == UNIQUE_TABLE[_WHEEL]:
+            return UNIQUE_TABLE[_ACE_SIX] - 0.5
+        if strength == FLUSH_TABLE[_WHEEL]:
+            return FLUSH_TABLE[_ACE_SIX] - 0.5
+        return strength
+
+    order = sorted(range(1, MAX_STRENGTH + 1), key=key)
+    table = array("H", [0] * (MAX_STRENGTH + 1))
+    for position, strength in enumerate(order):
+        table[strength] = MAX_STRENGTH - position
+    return table
+
+
+def _ace_to_five_key(strength: int) -> tuple[int, ...]:
+    """Return how bad a class is in ace-to-five; smaller is a better low."""
+    category = hand_category(strength)
+    kickers = hand_kickers(strength)
+    if category in (STRAIGHT, STRAIGHT_FLUSH, ROYAL_FLUSH):
+        top = kickers[0]
+        ranks = [3, 2, 1, 0, 12] if top == 3 else range(top, top - 5, -1)
+    else:
+        ranks = kickers
+    # The ace becomes the lowest rank.
+    rotated = [(rank + 1) % 13 for rank in ranks]
+    level = _PAIR_LEVELS[category]
+    if level == 0:
+        return (0, *sorted(rotated, reverse=True))
+    if level == 2:
+        high, low, kicker = rotated
+        return (2, max(high, low), min(high, low), kicker)
+    grouped, *rest = rotated
+    return (level, grouped, *sorted(rest, reverse=True))
+
+
+def _ace_to_five_table() -> tuple[array, int]:
+    """Return the ace-to-five strength of every standard strength."""
+    keys = [()] + [_ace_to_five_key(s) for s in range(1, MAX_STRENGTH + 1)]
+    distinct = sorted(set(keys[1:]), reverse=True)
+    positions = {key: position for position, key in enumerate(distinct, start=1)}
+    table = array("H", [0] * (MAX_STRENGTH + 1))
+    for strength in range(1, MAX_STRENGTH + 1):
+        table[strength] = positions[keys[strength]]
+    return table, len(distinct)
+
+
+_DEUCE_TO_SEVEN = _deuce_to_seven_table()
+_ACE_TO_FIVE, MAX_ACE_TO_FIVE = _ace_to_five_table()
+
+
+def deuce_to_seven(cards: "list[tuple[str, str] | int]") -> int:
+    """Return the deuce-to-seven low strength of a five-card hand.
+
+    Args:
+        cards (list[tuple[str, str] | int]): Five cards as (suit, value) tuples
+            or encoded ints.
+
+    Returns:
+        int: Strength from 1 (worst low, a royal flush) to 7462 (7-5-4-3-2).
+    """
+    return _DEUCE_TO_SEVEN[evaluate5(*encode_cards(cards))]
+
+
+def ace_to_five(cards: "list[tuple[str, str] | int]") -> int:
+    """Return the ace-to-five low strength of a five-card hand.
+
+    Args:
+        cards (list[tuple[str, str] | int]): Five cards as (suit, value) tuples
+            or encoded ints.
+
+    Returns:
+        int: Strength from 1 (worst low, four kings) to MAX_ACE_TO_FIVE
+        (5-4-3-2-A). Hands that differ only by suits score the same.
+    """
+    return _ACE_TO_FIVE[evaluate5(*encode_cards(cards))]
+
+
+def low_strength(strength: int, game: str = "2-7") -> int:
+    """Convert a standard strength to a low strength.
+
+    Useful after batch.evaluate_hands_batch or a cached evaluation.
+
+    Args:
+        strength (int): Strength returned by evaluator.evaluate_rank.
+        game (str, optional): "2-7" or "A-5". Defaults to "2-7".
+
+    Returns:
+        int: The low strength, as deuce_to_seven or ace_to_five.
+
+    Raises:
+        ValueError: If the game is unknown.
+    """
+    if game == "2-7":
+        return _DEUCE_TO_SEVEN[strength]
+    if game == "A-5":
+        return _ACE_TO_FIVE[strength]
+    raise ValueError(f"Unknown lowball game: {game!r}")
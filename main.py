@@ -1,42 +1,80 @@
 """poker game."""
 import random
-from poker.hand_logic import is_royal_flush, is_straight, check_flush, find_three_of_a_kind, find_four_of_a_kind, has_full_house, high_card
-import poker.tie_break as tb
+from typing import TYPE_CHECKING
+from poker.cards import (
+    DECK_SIZE, JOKERS, RANKS, decode_cards, encode_cards, reject_jokers
+)
+from poker.deck import Deck
+from poker.evaluator import evaluate_rank
+from poker.instrumentation import METRICS, report
+from poker.showdown import showdown
 from collections import Counter
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
 
+    from poker.strategy import BatchStrategy
 
-def generate_deck() -> list[tuple[str, str]]:
+
+
+def generate_deck(encoded: bool = False, jokers: int = 0
+                  ) -> list[tuple[str, str]] | list[int]:
     """Generate a full deck of playing cards.
 
+    Args:
+        encoded (bool, optional): Return integer-encoded cards (see poker.cards)
+            instead of (suit, value) tuples. Defaults to False.
+        jokers (int, optional): Number of jokers (0 to 2) to add after the
+            regular cards, for wild-card games scored by poker.wild.
+            Defaults to 0.
+
     Returns:
-        list[tuple[str, str]]: A list of tuples where each tuple represents a card
-        with a suit and a value.
+        list[tuple[str, str]] | list[int]: A list of tuples where each tuple
+        represents a card with a suit and a value, or a list of encoded cards.
+
+    Raises:
+        ValueError: If more than two jokers are requested.
     """
+    if not 0 <= jokers <= len(JOKERS):
+        raise ValueError(f"A deck holds 0 to {len(JOKERS)} jokers, got {jokers}")
+    if encoded:
+        return list(range(DECK_SIZE + jokers))
     colors = ["Hearts", "Diamonds", "Clubs", "Spades"]
     values = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"]
-    return [(color, value) for color in colors for value in values]
+    return [(color, value) for color in colors for value in values] + JOKERS[:jokers]
 
 
-def deal_cards(deck: list[tuple[str, str]], n: int = 5, amount_of_users: int = 2) -> list[tuple[str, str]]:
+def deal_cards(deck: list[tuple[str, str]], n: int = 5, amount_of_users: int = 2,
+               rng: random.Random | None = None) -> dict[str, list[tuple[str, str]]]:
     """Draw a number of random cards from the deck without repetition.
 
     Args:
-        deck (list[tuple[str, str]]): The deck to draw cards from.
+        deck (list[tuple[str, str]]): The deck to draw cards from. Encoded
+            decks from generate_deck(encoded=True) are dealt the same way.
         n (int, optional): Number of cards to draw. Defaults to 5.
+        amount_of_users (int, optional): Number of players. Defaults to 2.
+        rng (random.Random | None, optional): Random generator used to shuffle
+            the deck. Defaults to the global random module.
 
     Returns:
-        list[tuple[str, str]]: A list of drawn card tuples.
+        dict[str, list[tuple[str, str]]]: The drawn cards of every player,
+        keyed "player0", "player1", ...
+
+    Raises:
+        ValueError: If the deck holds fewer than n * amount_of_users cards;
+            use a shoe.Shoe of several decks for large tables.
     """
-    random.shuffle(deck)
+    if n * amount_of_users > len(deck):
+        raise ValueError(
+            f"Cannot deal {n} cards to {amount_of_users} players from "
+            f"{len(deck)} cards"
+        )
+    (rng or random).shuffle(deck)
 
-    users_cards = {}
-    for i in range(amount_of_users):
-        player_cards = deck[:n]
-        del deck[:n]
-        users_cards[f"player{i}"] = player_cards
+    dealt = deck[:n * amount_of_users]
+    del deck[:n * amount_of_users]
 
-    return users_cards
+    return {f"player{i}": dealt[i * n:(i + 1) * n] for i in range(amount_of_users)}
 
 
 
@@ -61,114 +99,202 @@ def count_card_amount(n: int, card_values: dict) -> int:
 
 def evaluate_hand(user_cards):
     """Evaluate the hand for each user's cards.
+
+    Cards may be given as (suit, value) tuples or as encoded ints; tuples are
+    encoded once at the top so the rest of the evaluation works on integers.
+    Groups of equal values are ordered by size and then by value, so the result
+    does not depend on the order of the cards.
+
+    Hands dealt from a multi-deck poker.shoe.Shoe may repeat cards. A flush
+    with a repeated value stays a flush (unless it makes a full house or four
+    of a kind), and five cards of one value are five of a kind, which beats
+    a Royal Flush; poker.shoe.evaluate_shoe ranks such hands by strength.
+
     Args:
-    """
-    colors, values = extract_colors_and_values(user_cards)
+        user_cards (list[tuple[str, str] | int]): The five cards of the hand.
 
-    card_values = Counter(values)
-    value = list(card_values.values())
-    keys = list(card_values.keys())
+    Returns:
+        int | tuple: 10 for a Royal Flush, (11, value) for five of a kind,
+        (12, value) for five identical cards, otherwise a tuple starting with
+        the hand category (9 for Straight Flush down to 1 for High Card)
+        followed by the deciding card values.
+
+    Raises:
+        ValueError: If the hand holds a joker.
+    """
+    result = _evaluate_encoded(encode_cards(user_cards))
+    if METRICS.enabled:
+        METRICS.count_category(result if result == 10 else result[0])
+    return result
+
+
+def _evaluate_encoded(cards: list[int]) -> int | tuple:
+    """Classify five encoded cards; see evaluate_hand for the result format."""
+    reject_jokers(cards)
+    ranks = [card >> 2 for card in cards]
+
+    card_values = Counter(ranks)
+    groups = sorted(card_values, key=lambda r: (card_values[r], r), reverse=True)
+    shape = card_values[groups[0]]
+    flush = len({card & 3 for card in cards}) == 1
+    # A-2-3-4-5 is a straight with the Ace played low, so its top card is the 5.
+    wheel = groups == [12, 3, 2, 1, 0]
+    straight = len(groups) == 5 and (groups[0] - groups[4] == 4 or wheel)
+    top = 3 if wheel else groups[0]
+
+    # Checks for Five of a Kind, possible only with several decks; five
+    # identical cards make a Flush Five
+    if shape == 5:
+        return (12 if flush else 11, RANKS[groups[0]])
 
-    print("\n--- ANALYSIS ---")
     # Checks whether the hand is a Royal Flush (10, J, Q, K, A all in the same suit)
-    if is_royal_flush(colors, values):
+    elif straight and flush and top == len(RANKS) - 1:
         return 10
 
     # Checks whether the hand is a Straight Flush (five consecutive values in the same suit)
-    elif is_straight(values) and check_flush(colors):
-        return (9, high_card(keys))
+    elif straight and flush:
+        return (9, RANKS[top])
 
     # Checks whether the hand contains Four of a Kind (four cards of the same value)
-    elif find_four_of_a_kind(values):
-        card_value = count_card_amount(4, card_values)
-        max_card = high_card(keys[1:])
-        return (8, card_value, max_card)
+    elif shape == 4:
+        return (8, RANKS[groups[0]], RANKS[groups[1]])
 
     # Checks whether the hand is a Full House (three of a kind plus a pair)
-    elif has_full_house(values):
-        three = count_card_amount(3, card_values)
-        pair = count_card_amount(2, card_values)
-        return (7, three, pair)
+    elif shape == 3 and len(groups) == 2:
+        return (7, RANKS[groups[0]], RANKS[groups[1]])
 
     # Checks whether the hand is a Flush (all cards of the same suit, not in sequence)
-    elif check_flush(colors):
-        return (6, high_card(keys))
+    elif flush:
+        return (6, RANKS[groups[0]])
 
     # Checks whether the hand is a Straight (five consecutive values, suits ignored)
-    elif is_straight(values):
-        return (5, high_card(keys))
+    elif straight:
+        return (5, RANKS[top])
 
     # Checks whether the hand contains Three of a Kind (three cards of the same value)
-    elif find_three_of_a_kind(values):
-        card_value = count_card_amount(3, card_values)
-        max_card = high_card(keys[1:])
-        return (4, card_value, max_card)
+    elif shape == 3:
+        return (4, RANKS[groups[0]], RANKS[groups[1]])
 
     # Checks whether the hand contains Two Pairs (two different pairs plus one kicker)
-    elif len(value) == 3:
-        return (3, keys[0], keys[1], keys[2])
+    elif len(groups) == 3:
+        return (3, RANKS[groups[0]], RANKS[groups[1]], RANKS[groups[2]])
 
     # Checks whether the hand contains One Pair (one pair plus three kickers)
-    elif len(value) == 4:
-        card_value = count_card_amount(2, card_values)
-        max_card = high_card(keys[1:])
-        return (2, card_value, max_card)
+    elif len(groups) == 4:
+        return (2, RANKS[groups[0]], RANKS[groups[1]])
 
     # Checks for High Card when no other poker hand is present
-    elif high_card(values):
-        return (1, high_card(values))
+    else:
+        return (1, RANKS[groups[0]])
 
 
 def change_cards(cards: list[tuple[str, str]],
-                 deck: list[tuple[str, str]],
+                 deck: list[tuple[str, str]] | Deck,
                  indices: list[int] | None = None) -> None:
+    """Replace the cards at the given indices with cards from the top of the deck.
+
+    Works the same for (suit, value) tuples and encoded ints, as long as the
+    hand and the deck use the same representation. Encoded hands can also
+    draw from a poker.deck.Deck.
+
+    Args:
+        cards (list[tuple[str, str]]): The player's hand, modified in place.
+        deck (list[tuple[str, str]] | Deck): The deck to draw replacement
+            cards from.
+        indices (list[int] | None, optional): Positions in the hand to replace.
+
+    Raises:
+        IndexError: If any index is outside the hand.
+        ValueError: If the deck holds fewer cards than requested.
+    """
     if not indices:
         return
 
     for idx in indices:
         if idx < 0 or idx >= len(cards):
             raise IndexError(f"Invalid card index: {idx}")
-
-        new_card = deck.pop(0)
+    if len(deck) < len(indices):
+        raise ValueError(f"Cannot draw {len(indices)} cards, only {len(deck)} left")
+
+    if isinstance(deck, Deck):
+        new_cards = deck.deal(len(indices))
+    else:
+        new_cards = deck[:len(indices)]
+        del deck[:len(indices)]
+    for idx, new_card in zip(indices, new_cards):
         cards[idx] = new_card
 
-def evaluate_result(game_result):
-    player0_result = game_result[0]['result']
-    player1_result = game_result[1]['result']
-
-    if player0_result[0] > player1_result[0]:
-        print("player with index 0 won")
-    elif player0_result[0] < player1_result[0]:
-        print("player with index 1 won")
-
-    elif player0_result[0] == player1_result[0]:
-        match player0_result[0]:
-            case 1 | 5 | 6 | 9:
-                tb.high_card_tie_break(player0_result[1], player1_result[1])
-            case 2:
-                tb.pair_tie_break(player0_result, player1_result)
-            case 3:
-                tb.two_paris_tie_break(player0_result, player1_result)
-            case 4 | 7 | 8:
-                tb.gorouped_cards_tie_break(player0_result, player1_result)
-
-def main() -> None:
-    """Main function to generate a deck, deal cards, and analyze the hand."""
-    deck = generate_deck()
-    users_cards = deal_cards(deck)
-
-    print(users_cards)
+def evaluate_result(game_result: list[dict],
+                    evaluate: "Callable[[Sequence], int]" = evaluate_rank
+                    ) -> list[list[int]]:
+    """Announce the winner of a game with any number of players.
+
+    Args:
+        game_result (list[dict]): One dict per player with at least the 'hand'
+            key, in seat order.
+        evaluate (Callable, optional): Function returning the strength of a
+            hand, passed on to showdown. Defaults to evaluator.evaluate_rank;
+            pass shoe.evaluate_shoe for tables dealt from a multi-deck shoe.
+
+    Returns:
+        list[list[int]]: Seat indices grouped by hand strength, best first;
+        players in the same group split the pot.
+    """
+    ranking = showdown([player['hand'] for player in game_result], evaluate)
+    winners = ranking[0]
+
+    if len(winners) == 1:
+        report(f"player with index {winners[0]} won")
+    else:
+        report(f"draw between players with index {', '.join(map(str, winners))}")
+    return ranking
+
+def ask_for_discards(seat: int, cards: list[int]) -> list[int] | None:
+    """Show a player's hand and read the indices of the cards to replace.
+
+    Args:
+        seat (int): Index of the player.
+        cards (list[int]): The player's encoded cards.
+
+    Returns:
+        list[int] | None: Indices typed by the player, or None to stand pat.
+    """
+    print(f"player{seat} before change: {decode_cards(cards)}")
+    indices_to_change = input("pass in card indexes form 0-4 to replace card or press enter to ommit: "
+    ).strip()
+    return list(map(int, indices_to_change.split())) if indices_to_change else None
+
+
+def main(strategy: "BatchStrategy | None" = None) -> None:
+    """Main function to generate a deck, deal cards, and analyze the hand.
+
+    Args:
+        strategy (BatchStrategy | None, optional): Batched discard strategy
+            from poker.strategy that plays every seat instead of asking on
+            the terminal; it is called once with the hands of the whole
+            table. Defaults to asking.
+    """
+    # Imported here because the engine and the cache are built on this module.
+    from poker.canonical import evaluate_hand_cached
+    from poker.engine import play_game
+
+    if strategy is None:
+        hands = play_game(policy=ask_for_discards).final
+    else:
+        # Imported here so that the console game never needs NumPy.
+        from poker.strategy import play_batch
+
+        # A batch of one table asks the strategy once, with every seat's hand.
+        hands = play_batch(1, strategy=strategy).final[0].tolist()
     game_result = []
 
-    for player, cards in users_cards.items():
-        print(f"{player} before change: {cards}")
-        indices_to_change = input("pass in card indexes form 0-4 to replace card or press enter to ommit: "
-        ).strip()
-        indices = list(map(int, indices_to_change.split())) if indices_to_change else None
-        change_cards(cards, deck, indices)
+    for seat, final in enumerate(hands):
+        player = f"player{seat}"
+        cards = decode_cards(final)
         print(f"{player} after change: {cards}")
 
-        result = evaluate_hand(cards)
+        print("\n--- ANALYSIS ---")
+        result = evaluate_hand_cached(cards)
         player_dict = {'player_name':player, 'hand':cards, 'result': result}
         game_result.append(player_dict)
         print(f"{player} has {cards} with {result}")
@@ -0,0 +1,167 @@
+"""Percentile of a five-card hand among all hands.
+
+A PercentileIndex holds, for every strength, the number of hands that are
+strictly weaker, so the percentile of a hand is one lookup and the strength
+at a given percentile is one bisection.
+
+The index over all 2,598,960 hands needs no enumeration: every strength is
+one equivalence class of poker.evaluator, and the number of hands in a class
+depends only on its category (4 for a flush, 1,020 for a high card, 384 for
+a pair, ...). PercentileIndex.excluding builds the index of the hands that
+avoid a set of dead cards, which does need the full list of hands and NumPy
+(``pip install poker[fast]``).
+"""
+from bisect import bisect_left
+from functools import cache
+from itertools import accumulate, combinations
+from typing import TYPE_CHECKING
+
+from poker import evaluator
+from poker.cards import DECK_SIZE, encode_cards
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Number of hands in one equivalence class of each category: the ways to
+# pick suits for the ranks of the class.
+CLASS_SIZES = {
+    evaluator.HIGH_CARD: 4 ** 5 - 4,
+    evaluator.ONE_PAIR: 6 * 4 ** 3,
+    evaluator.TWO_PAIRS: 6 * 6 * 4,
+    evaluator.THREE_OF_A_KIND: 4 * 4 ** 2,
+    evaluator.STRAIGHT: 4 ** 5 - 4,
+    evaluator.FLUSH: 4,
+    evaluator.FULL_HOUSE: 4 * 6,
+    evaluator.FOUR_OF_A_KIND: 4,
+    evaluator.STRAIGHT_FLUSH: 4,
+    evaluator.ROYAL_FLUSH: 4,
+}
+
+
+class PercentileIndex:
+    """Cumulative hand counts by strength.
+
+    Attributes:
+        total (int): Number of hands in the index.
+    """
+
+    def __init__(self, counts: "list[int]") -> None:
+        """Build the index from the number of hands of every strength.
+
+        Args:
+            counts (list[int]): Hands per strength, indexed by strength
+                (index 0 is unused).
+        """
+        # _below[s] is the number of hands weaker than strength s.
+        self._below = [0, *accumulate(counts)]
+        self.total = self._below[-1]
+
+    @classmethod
+    def excluding(cls, dead: "list[tuple[str, str] | int]") -> "PercentileIndex":
+        """Build the index of the hands that hold none of the dead cards.
+
+        Args:
+            dead (list[tuple[str, str] | int]): Cards known to be out of play,
+                e.g. the player's own cards or exposed discards.
+
+        Returns:
+            PercentileIndex: Index over the remaining hands.
+        """
+        # Imported here so that the full index never needs NumPy.
+        import numpy as np
+
+        strengths, masks = _all_hands()
+        dead_mask = 0
+        for card in encode_cards(dead):
+            dead_mask |= 1 << card
+        alive = strengths[(masks & np.uint64(dead_mask)) == 0]
+        counts = np.bincount(alive, minlength=evaluator.MAX_STRENGTH + 1)
+        return cls(counts.tolist())
+
+    def percentile(self, hand: "list[tuple[str, str] | int] | int") -> float:
+        """Return the percentile rank of a hand.
+
+        Ties count half, so the weakest hand is close to 0, the strongest
+        close to 100 and a hand in the middle of its class of equals sits at
+        its middle.
+
+        Args:
+            hand (list[tuple[str, str] | int] | int): Five cards, or a
+                strength returned by evaluator.evaluate_rank.
+
+        Returns:
+            float: Percentage of hands that are weaker, plus half the
+            percentage of hands of equal strength.
+        """
+        strength = hand if isinstance(hand, int) else evaluator.evaluate_rank(hand)
+        below = self._below[strength]
+        equal = self._below[strength + 1] - below
+        return 100 * (below + equal / 2) / self.total
+
+    def weaker(self, strength: int) -> int:
+        """Return the number of hands in the index weaker than a strength.
+
+        Args:
+            strength (int): Strength returned by evaluator.evaluate_rank.
+
+        Returns:
+            int: Number of strictly weaker hands.
+        """
+        return self._below[strength]
+
+    def strength_at(self, percent: float) -> int:
+        """Return the weakest strength at or above a percentile.
+
+        Args:
+            percent (float): Percentile between 0 and 100.
+
+        Returns:
+            int: The lowest strength whose hands, together with all weaker
+            ones, make up at least percent of the index.
+
+        Raises:
+            ValueError: If percent is outside 0..100.
+        """
+        if not 0 <= percent <= 100:
+            raise ValueError(f"Percentile must be between 0 and 100, got {percent}")
+        target = percent / 100 * self.total
+        strength = bisect_left(self._below, target, 2) - 1
+        return min(strength, evaluator.MAX_STRENGTH)
+
+
+@cache
+def _all_hands() -> "tuple[np.ndarray, np.ndarray]":
+    """Return the strength and 52-bit card mask of every hand."""
+    import numpy as np
+
+    from poker.batch import evaluate_hands_batch
+
+    cards = np.array(list(combinations(range(DECK_SIZE), 5)), dtype=np.uint8)
+    bits = np.left_shift(np.uint64(1), cards.astype(np.uint64))
+    masks = np.bitwise_or.reduce(bits, axis=1)
+    return evaluate_hands_batch(cards), masks
+
+
+INDEX = PercentileIndex([0] + [
+    CLASS_SIZES[evaluator.hand_category(strength)]
+    for strength in range(1, evaluator.MAX_STRENGTH + 1)
+])
+
+
+def hand_percentile(
+    cards: "list[tuple[str, str] | int]",
+    dead: "list[tuple[str, str] | int] | None" = None,
+) -> float:
+    """Return the percentile of a hand among all hands or the live hands.
+
+    Args:
+        cards (list[tuple[str, str] | int]): Five cards.
+        dead (list[tuple[str, str] | int] | None, optional): Cards out of
+            play; only hands avoiding them are compared. Repeated queries with
+            the same dead cards should build PercentileIndex.excluding once.
+
+    Returns:
+        float: Percentile between 0 and 100, see PercentileIndex.percentile.
+    """
+    index = INDEX if not dead else PercentileIndex.excluding(dead)
+    return index.percentile(cards)
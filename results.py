@@ -0,0 +1,329 @@
+"""Compact storage and streaming aggregation of simulated games.
+
+ResultStore keeps game results column by column in typed arrays, about ten
+bytes per seat instead of a dict of tuples and strings per player, for runs
+whose individual games need to be kept.
+
+Runs that only need statistics do not have to keep games at all. The
+aggregators below consume GameResults one at a time into fixed-size
+counters, so their memory does not depend on the number of games:
+
+* CategoryWinRate: wins and splits by category of the final hand,
+* SplitFrequency: how often the pot is split, and between how many seats,
+* DrawEffect: results and improvement rate by number of cards drawn.
+
+Aggregators from separate processes can be merged, and each exports a summary
+table (a header and rows) that write_tables writes as CSV.
+"""
+import csv
+from array import array
+from typing import TYPE_CHECKING
+
+from poker.evaluator import CATEGORY_NAMES, evaluate5, hand_category
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import TextIO
+
+    from poker.engine import GameResult
+
+LOSS, WIN, SPLIT = 0, 1, 2
+
+
+def seat_outcomes(result: "GameResult") -> list[int]:
+    """Return LOSS, WIN or SPLIT for every seat of a game.
+
+    Args:
+        result (GameResult): The game.
+
+    Returns:
+        list[int]: The outcome of each seat.
+    """
+    winners = result.ranking[0]
+    outcomes = [LOSS] * len(result.final)
+    for seat in winners:
+        outcomes[seat] = WIN if len(winners) == 1 else SPLIT
+    return outcomes
+
+
+class ResultStore:
+    """Column-oriented store of per-seat game results.
+
+    Every seat of every game is one row; the columns are typed arrays.
+
+    Attributes:
+        players (int): Number of seats per game.
+        seeds (array): Seed of every game.
+        dealt (array): Strength of every seat's dealt hand.
+        final (array): Strength of every seat's final hand.
+        draws (array): Number of cards every seat drew.
+        outcomes (array): LOSS, WIN or SPLIT for every seat.
+    """
+
+    def __init__(self, players: int) -> None:
+        """Create an empty store.
+
+        Args:
+            players (int): Number of seats per game.
+        """
+        self.players = players
+        self.seeds = array("Q")
+        self.dealt = array("H")
+        self.final = array("H")
+        self.draws = array("B")
+        self.outcomes = array("B")
+
+    def __len__(self) -> int:
+        """Return the number of stored games."""
+        return len(self.seeds)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory taken by the stored values, in bytes."""
+        columns = (self.seeds, self.dealt, self.final, self.draws, self.outcomes)
+        return sum(len(column) * column.itemsize for column in columns)
+
+    def append(self, result: "GameResult") -> None:
+        """Store one game.
+
+        Args:
+            result (GameResult): Game to store.
+
+        Raises:
+            ValueError: If the game has a different number of seats.
+        """
+        if len(result.final) != self.players:
+            raise ValueError(f"Expected {self.players} seats, got {len(result.final)}")
+        self.seeds.append(result.seed)
+        self.dealt.extend(evaluate5(*cards) for cards in result.dealt)
+        self.final.extend(result.strengths)
+        self.draws.extend(len(indices) for indices in result.discards)
+        self.outcomes.extend(seat_outcomes(result))
+
+    def extend(self, results: "Iterable[GameResult]") -> None:
+        """Store every game of an iterable.
+
+        Args:
+            results (Iterable[GameResult]): Games to store.
+        """
+        for result in results:
+            self.append(result)
+
+    def seats(self) -> "Iterator[tuple[int, int, int, int]]":
+        """Iterate over (dealt, final, draws, outcome) of every stored seat.
+
+        Yields:
+            tuple[int, int, int, int]: One row per seat, game by game.
+        """
+        yield from zip(self.dealt, self.final, self.draws, self.outcomes)
+
+
+class CategoryWinRate:
+    """Wins and splits by category of the final hand.
+
+    Attributes:
+        seats (list[int]): Seats that ended with each category.
+        wins (list[int]): Of those, seats that won alone.
+        splits (list[int]): Of those, seats that split the pot.
+    """
+
+    def __init__(self) -> None:
+        """Create empty counters."""
+        size = max(CATEGORY_NAMES) + 1
+        self.seats = [0] * size
+        self.wins = [0] * size
+        self.splits = [0] * size
+
+    def add(self, result: "GameResult") -> None:
+        """Count the seats of one game.
+
+        Args:
+            result (GameResult): The game.
+        """
+        for strength, outcome in zip(result.strengths, seat_outcomes(result)):
+            category = hand_category(strength)
+            self.seats[category] += 1
+            if outcome == WIN:
+                self.wins[category] += 1
+            elif outcome == SPLIT:
+                self.splits[category] += 1
+
+    def merge(self, other: "CategoryWinRate") -> None:
+        """Add the counts of another aggregator, e.g. from another process.
+
+        Args:
+            other (CategoryWinRate): Aggregator to merge in.
+        """
+        for name in ("seats", "wins", "splits"):
+            mine = getattr(self, name)
+            for category, count in enumerate(getattr(other, name)):
+                mine[category] += count
+
+    def table(self) -> tuple[list[str], list[tuple]]:
+        """Return the summary table, one row per category seen.
+
+        Returns:
+            tuple[list[str], list[tuple]]: Column names and rows.
+        """
+        header = ["category", "seats", "wins", "splits", "win_rate", "split_rate"]
+        rows = [
+            (name, seats, self.wins[category], self.splits[category],
+             self.wins[category] / seats, self.splits[category] / seats)
+            for category, name in CATEGORY_NAMES.items()
+            if (seats := self.seats[category])
+        ]
+        return header, rows
+
+
+class SplitFrequency:
+    """How often games end in a split pot, and between how many seats.
+
+    Attributes:
+        games (int): Games counted.
+        winners (dict[int, int]): Games by number of winning seats.
+    """
+
+    def __init__(self) -> None:
+        """Create empty counters."""
+        self.games = 0
+        self.winners = {}
+
+    def add(self, result: "GameResult") -> None:
+        """Count one game.
+
+        Args:
+            result (GameResult): The game.
+        """
+        self.games += 1
+        count = len(result.ranking[0])
+        self.winners[count] = self.winners.get(count, 0) + 1
+
+    def merge(self, other: "SplitFrequency") -> None:
+        """Add the counts of another aggregator.
+
+        Args:
+            other (SplitFrequency): Aggregator to merge in.
+        """
+        self.games += other.games
+        for count, games in other.winners.items():
+            self.winners[count] = self.winners.get(count, 0) + games
+
+    @property
+    def split_rate(self) -> float:
+        """Fraction of games won by more than one seat."""
+        return 1 - self.winners.get(1, 0) / self.games if self.games else 0.0
+
+    def table(self) -> tuple[list[str], list[tuple]]:
+        """Return the summary table, one row per number of winners.
+
+        Returns:
+            tuple[list[str], list[tuple]]: Column names and rows.
+        """
+        header = ["winners", "games", "rate"]
+        rows = [
+            (count, games, games / self.games)
+            for count, games in sorted(self.winners.items())
+        ]
+        return header, rows
+
+
+class DrawEffect:
+    """Results and hand improvement by number of cards drawn.
+
+    Attributes:
+        seats (list[int]): Seats that drew each number of cards.
+        wins (list[int]): Of those, seats that won alone.
+        splits (list[int]): Of those, seats that split the pot.
+        improved (list[int]): Of those, seats whose category went up.
+    """
+
+    def __init__(self) -> None:
+        """Create empty counters."""
+        self.seats = [0] * 6
+        self.wins = [0] * 6
+        self.splits = [0] * 6
+        self.improved = [0] * 6
+
+    def add(self, result: "GameResult") -> None:
+        """Count the seats of one game.
+
+        Args:
+            result (GameResult): The game.
+        """
+        rows = zip(result.dealt, result.strengths, result.discards,
+                   seat_outcomes(result))
+        for dealt, final, discards, outcome in rows:
+            draws = len(discards)
+            self.seats[draws] += 1
+            if outcome == WIN:
+                self.wins[draws] += 1
+            elif outcome == SPLIT:
+                self.splits[draws] += 1
+            if draws and hand_category(final) > hand_category(evaluate5(*dealt)):
+                self.improved[draws] += 1
+
+    def merge(self, other: "DrawEffect") -> None:
+        """Add the counts of another aggregator.
+
+        Args:
+            other (DrawEffect): Aggregator to merge in.
+        """
+        for name in ("seats", "wins", "splits", "improved"):
+            mine = getattr(self, name)
+            for draws, count in enumerate(getattr(other, name)):
+                mine[draws] += count
+
+    def table(self) -> tuple[list[str], list[tuple]]:
+        """Return the summary table, one row per number of cards drawn.
+
+        Returns:
+            tuple[list[str], list[tuple]]: Column names and rows; improved
+            counts seats whose final category beats the dealt one.
+        """
+        header = ["draws", "seats", "wins", "splits", "win_rate", "improve_rate"]
+        rows = [
+            (draws, seats, self.wins[draws], self.splits[draws],
+             self.wins[draws] / seats, self.improved[draws] / seats)
+            for draws, seats in enumerate(self.seats)
+            if seats
+        ]
+        return header, rows
+
+
+def aggregate(results: "Iterable[GameResult]", aggregators: list) -> int:
+    """Feed a stream of games to aggregators without keeping the games.
+
+    Args:
+        results (Iterable[GameResult]): Games, e.g. from engine.run_games.
+        aggregators (list): Objects with an add(result) method.
+
+    Returns:
+        int: Number of games consumed.
+    """
+    games = 0
+    adders = [aggregator.add for aggregator in aggregators]
+    for result in results:
+        for add in adders:
+            add(result)
+        games += 1
+    return games
+
+
+def write_tables(aggregators: list, sink: "TextIO") -> None:
+    """Write the summary table of every aggregator as CSV.
+
+    Tables are written one after another, each preceded by a line naming
+    the aggregator and separated by a blank line.
+
+    Args:
+        aggregators (list): Objects with a table() method.
+        sink (TextIO): Open text file to write to.
+    """
+    writer = csv.writer(sink, lineterminator="\n")
+    for number, aggregator in enumerate(aggregators):
+        if number:
+            sink.write("\n")
+        header, rows = aggregator.table()
+        writer.writerow([f"# {type(aggregator).__name__}"])
+        writer.writerow(header)
+        writer.writerows(rows)
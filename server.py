@@ -0,0 +1,302 @@
+"""Asyncio game server hosting many tables over a local socket.
+
+Clients talk to the server in line-delimited JSON: every request is one JSON
+object on one line and is answered by exactly one JSON object on one line.
+Tables are addressed by the id returned when they are dealt. A connection
+can only act on the tables it dealt itself, and a table still open when that
+connection closes is dropped. The operations are:
+
+* {"op": "deal", "players": 2, "seed": 7} opens a table and deals five
+  cards to every seat; players defaults to 2 and seed to a random one.
+  Answer: {"ok": true, "table": 1, "seed": 7, "hands": [[...], [...]]}.
+* {"op": "discard", "table": 1, "seat": 0, "indices": [0, 3]} replaces
+  the cards at the given positions of one seat, once per seat.
+  Answer: {"ok": true, "table": 1, "seat": 0, "cards": [...]}.
+* {"op": "showdown", "table": 1} evaluates every hand and closes the table.
+  Answer: {"ok": true, "table": 1, "strengths": [...], "categories": [...],
+  "ranking": [[...], ...], "winners": [...]}.
+
+Cards are encoded ints as in poker.cards. Failed requests are answered with
+{"ok": false, "error": "..."} and leave the connection open.
+
+Dealing and drawing are a handful of swaps and run on the event loop;
+evaluation is sent to an executor (a process pool when started with serve()),
+so a burst of showdowns never stalls the other tables.
+"""
+import argparse
+import asyncio
+import json
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+from poker.deck import Deck
+from poker.evaluator import CATEGORY_NAMES, evaluate5, hand_category
+from poker.main import change_cards
+from poker.showdown import rank_strengths
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+MAX_PLAYERS = 10
+
+
+class Table:
+    """One game in progress.
+
+    Attributes:
+        seed (int): Seed of the table's deck.
+        hands (list[list[int]]): Encoded cards of every seat.
+        drawn (list[bool]): Whether each seat has already discarded.
+    """
+
+    __slots__ = ("seed", "hands", "drawn", "_deck")
+
+    def __init__(self, players: int, seed: int) -> None:
+        """Shuffle a new deck and deal five cards to every seat.
+
+        Args:
+            players (int): Number of seats.
+            seed (int): Seed of the deck.
+        """
+        self.seed = seed
+        self._deck = Deck(seed)
+        self.hands = self._deck.deal_hands(players)
+        self.drawn = [False] * players
+
+    def discard(self, seat: int, indices: list[int]) -> list[int]:
+        """Replace cards of one seat.
+
+        Args:
+            seat (int): Index of the seat.
+            indices (list[int]): Positions of the cards to replace.
+
+        Returns:
+            list[int]: The seat's cards after the draw.
+
+        Raises:
+            ValueError: If the seat does not exist or has already drawn, or an
+                index is not an int.
+        """
+        for idx in indices:
+            # Checked before drawing: change_cards would take cards from the
+            # deck before a float index failed.
+            if not isinstance(idx, int) or isinstance(idx, bool):
+                raise ValueError(f"Card indices must be integers, got {idx!r}")
+        if not 0 <= seat < len(self.hands):
+            raise ValueError(f"No seat {seat} at this table")
+        if self.drawn[seat]:
+            raise ValueError(f"Seat {seat} has already drawn")
+        change_cards(self.hands[seat], self._deck, indices)
+        self.drawn[seat] = True
+        return self.hands[seat]
+
+
+def score_hands(hands: list[list[int]]) -> tuple[list[int], list[list[int]]]:
+    """Evaluate the hands of a table; runs in the executor.
+
+    Args:
+        hands (list[list[int]]): Encoded cards of every seat.
+
+    Returns:
+        tuple[list[int], list[list[int]]]: Strength of every hand and the
+        seats grouped by strength, best first.
+    """
+    strengths = [evaluate5(*cards) for cards in hands]
+    return strengths, rank_strengths(dict(enumerate(strengths)))
+
+
+class PokerServer:
+    """Serves the line-delimited JSON protocol for any number of tables.
+
+    Attributes:
+        tables (dict[int, Table]): Open tables by id.
+    """
+
+    def __init__(self, executor: "Executor | None" = None) -> None:
+        """Create a server without any tables.
+
+        Args:
+            executor (Executor | None, optional): Where hands are evaluated.
+                Defaults to the event loop's default executor.
+        """
+        self.tables = {}
+        self._executor = executor
+        self._next_id = 1
+
+    async def handle(self, request: dict, opened: "set[int] | None" = None) -> dict:
+        """Answer one decoded request.
+
+        Args:
+            request (dict): The request object.
+            opened (set[int] | None, optional): Ids of the open tables the
+                connection has dealt; deals add to it and showdowns remove.
+                When given, the request may only refer to these tables.
+                Defaults to no restriction, for in-process callers.
+
+        Returns:
+            dict: The answer object.
+        """
+        try:
+            op = request.get("op")
+            if op == "deal":
+                answer = self._deal(request)
+                if opened is not None:
+                    opened.add(answer["table"])
+                return answer
+            if op == "discard":
+                return self._discard(request, opened)
+            if op == "showdown":
+                answer = await self._showdown(request, opened)
+                if opened is not None:
+                    opened.discard(answer["table"])
+                return answer
+            raise ValueError(f"Unknown op: {op!r}")
+        except (KeyError, TypeError, ValueError, IndexError) as exc:
+            return {"ok": False, "error": str(exc)}
+
+    def _table(
+        self, request: dict, opened: "set[int] | None"
+    ) -> tuple[int, Table]:
+        """Look up the table a request refers to, among those it may use."""
+        table_id = request["table"]
+        # Another connection's table answers as if it did not exist.
+        if table_id not in self.tables or (
+            opened is not None and table_id not in opened
+        ):
+            raise ValueError(f"No open table {table_id}")
+        return table_id, self.tables[table_id]
+
+    def _deal(self, request: dict) -> dict:
+        """Open a table and deal every seat."""
+        players = request.get("players", 2)
+        if not isinstance(players, int) or not 2 <= players <= MAX_PLAYERS:
+            raise ValueError(f"players must be between 2 and {MAX_PLAYERS}")
+        seed = request.get("seed")
+        if seed is None:
+            seed = random.getrandbits(64)
+        table = Table(players, seed)
+        table_id = self._next_id
+        self._next_id += 1
+        self.tables[table_id] = table
+        hands = [list(cards) for cards in table.hands]
+        return {"ok": True, "table": table_id, "seed": seed, "hands": hands}
+
+    def _discard(self, request: dict, opened: "set[int] | None") -> dict:
+        """Replace cards of one seat."""
+        table_id, table = self._table(request, opened)
+        seat = request["seat"]
+        cards = list(table.discard(seat, list(request.get("indices", ()))))
+        return {"ok": True, "table": table_id, "seat": seat, "cards": cards}
+
+    async def _showdown(self, request: dict, opened: "set[int] | None") -> dict:
+        """Evaluate a table in the executor and close it."""
+        table_id, table = self._table(request, opened)
+        # Closed before awaiting so no discard can slip in meanwhile.
+        del self.tables[table_id]
+        loop = asyncio.get_running_loop()
+        strengths, ranking = await loop.run_in_executor(
+            self._executor, score_hands, table.hands
+        )
+        return {
+            "ok": True,
+            "table": table_id,
+            "strengths": strengths,
+            "categories": [CATEGORY_NAMES[hand_category(s)] for s in strengths],
+            "ranking": ranking,
+            "winners": ranking[0],
+        }
+
+    async def serve_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer requests from one connection until it closes.
+
+        Tables the connection dealt and did not close are dropped when it
+        ends, so clients that disconnect mid-game do not leak tables.
+
+        Args:
+            reader (asyncio.StreamReader): Incoming side of the connection.
+            writer (asyncio.StreamWriter): Outgoing side of the connection.
+        """
+        opened = set()
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                except json.JSONDecodeError as exc:
+                    answer = {"ok": False, "error": f"Invalid JSON: {exc.msg}"}
+                else:
+                    if isinstance(request, dict):
+                        answer = await self.handle(request, opened)
+                    else:
+                        answer = {"ok": False, "error": "Expected a JSON object"}
+                writer.write(json.dumps(answer).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for table_id in opened:
+                self.tables.pop(table_id, None)
+            writer.close()
+
+    async def start(
+        self, host: str = "127.0.0.1", port: int = 0, path: str | None = None
+    ) -> asyncio.AbstractServer:
+        """Start listening on a TCP port or a Unix socket.
+
+        Args:
+            host (str, optional): TCP address. Defaults to "127.0.0.1".
+            port (int, optional): TCP port; 0 picks a free one. Defaults to 0.
+            path (str | None, optional): Listen on this Unix socket instead
+                of TCP.
+
+        Returns:
+            asyncio.AbstractServer: The listening server.
+        """
+        if path is not None:
+            return await asyncio.start_unix_server(self.serve_client, path)
+        return await asyncio.start_server(self.serve_client, host, port)
+
+
+async def serve(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    path: str | None = None,
+    workers: int | None = None,
+) -> None:
+    """Run a server with a process pool for evaluation until cancelled.
+
+    Args:
+        host (str, optional): TCP address. Defaults to "127.0.0.1".
+        port (int, optional): TCP port. Defaults to 8765.
+        path (str | None, optional): Listen on this Unix socket instead.
+        workers (int | None, optional): Evaluation processes; None uses
+            every core.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        server = await PokerServer(pool).start(host, port, path)
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv: "list[str] | None" = None) -> None:
+    """Run the server from the command line.
+
+    Args:
+        argv (list[str] | None, optional): Arguments; defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", metavar="PATH", help="listen on a Unix socket")
+    parser.add_argument("--workers", type=int, help="evaluation processes")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.workers))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+"""Evaluation tables shared by every process of a pool.
+
+poker.evaluator and poker.holdem build their lookup tables as Python lists
+and dicts in every process that imports them, so a pool of 64 workers holds
+64 copies. This module packs the same tables into one flat block of memory:
+
+* publish_tables puts the block into multiprocessing.shared_memory, once,
+  in the parent process; write_tables saves it to a file instead,
+* SharedTables attaches to a shared block by name, or memory-maps the file,
+  and reads the tables through memoryviews without copying them.
+
+Workers only need the block name, e.g.
+ProcessPoolExecutor(initializer=init_worker, initargs=(shm.name,)), and then
+call worker_tables(). Attaching imports neither poker.evaluator nor
+poker.holdem, so a worker's memory stays flat however many cores run.
+Paired hands are found by binary search over sorted prime products, which
+is a little slower than the dict lookups of poker.evaluator.
+"""
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from multiprocessing import shared_memory
+
+from poker.cards import DECK_SIZE, repeated_cards_error
+
+MAGIC = b"PKTB"
+VERSION = 1
+# Magic, version, padding, number of paired keys, number of unsuited keys.
+HEADER = struct.Struct("<4sHHII")
+
+# Strengths run from 1 to 7462 (evaluator.MAX_STRENGTH).
+_STRENGTHS = 7463
+
+_CARD_BIT = tuple(1 << (card >> 2) for card in range(DECK_SIZE))
+_CARD_SUIT = tuple(1 << (card & 3) for card in range(DECK_SIZE))
+
+_attached = None
+
+
+def _sections(paired: int, unsuited: int) -> list[tuple[str, str, int]]:
+    """Return (name, array typecode, length) of every section, in order."""
+    return [
+        ("card_primes", "I", DECK_SIZE),
+        ("flush", "H", 1 << 13),
+        ("unique", "H", 1 << 13),
+        ("categories", "B", _STRENGTHS),
+        ("paired_keys", "I", paired),
+        ("paired_values", "H", paired),
+        ("flush7", "H", 1 << 13),
+        ("unsuited_keys", "Q", unsuited),
+        ("unsuited_values", "H", unsuited),
+    ]
+
+
+def _layout(paired: int, unsuited: int) -> tuple[dict, int]:
+    """Return the (start, end) byte range of every section and the total size."""
+    ranges = {}
+    offset = HEADER.size
+    for name, typecode, length in _sections(paired, unsuited):
+        offset = -(-offset // 8) * 8
+        end = offset + length * array(typecode).itemsize
+        ranges[name] = (offset, end)
+        offset = end
+    return ranges, offset
+
+
+def table_bytes() -> bytes:
+    """Pack the evaluator and Hold'em tables into one block.
+
+    Returns:
+        bytes: The block, in the layout read by SharedTables.
+    """
+    # Imported here so that processes attaching to the block never build
+    # the tables themselves.
+    from poker import evaluator, holdem
+
+    paired_keys = sorted(evaluator.PAIRED_TABLE)
+    unsuited = holdem._UNSUITED_TABLE or holdem._build_unsuited()
+    unsuited_keys = sorted(unsuited)
+    strengths = range(1, evaluator.MAX_STRENGTH + 1)
+    contents = {
+        "card_primes": [evaluator.PRIMES[card >> 2] for card in range(DECK_SIZE)],
+        "flush": evaluator.FLUSH_TABLE,
+        "unique": evaluator.UNIQUE_TABLE,
+        "categories": [0, *map(evaluator.hand_category, strengths)],
+        "paired_keys": paired_keys,
+        "paired_values": [evaluator.PAIRED_TABLE[key] for key in paired_keys],
+        "flush7": holdem.FLUSH7_TABLE,
+        "unsuited_keys": unsuited_keys,
+        "unsuited_values": [unsuited[key] for key in unsuited_keys],
+    }
+
+    counts = len(paired_keys), len(unsuited_keys)
+    ranges, size = _layout(*counts)
+    block = bytearray(size)
+    HEADER.pack_into(block, 0, MAGIC, VERSION, 0, *counts)
+    for name, typecode, _ in _sections(*counts):
+        start, end = ranges[name]
+        block[start:end] = array(typecode, contents[name]).tobytes()
+    return bytes(block)
+
+
+def publish_tables(name: str | None = None) -> shared_memory.SharedMemory:
+    """Copy the tables into a new shared memory block.
+
+    The caller owns the block: keep it open while workers use it, then
+    close() and unlink() it.
+
+    Args:
+        name (str | None, optional): Name of the block. Defaults to a unique
+            name chosen by the system.
+
+    Returns:
+        shared_memory.SharedMemory: The block; pass its name to workers.
+    """
+    data = table_bytes()
+    block = shared_memory.SharedMemory(name, create=True, size=len(data))
+    block.buf[:len(data)] = data
+    return block
+
+
+def write_tables(path: str) -> None:
+    """Write the tables to a file for SharedTables.open.
+
+    Args:
+        path (str): Where to write the file.
+    """
+    with open(path, "wb") as sink:
+        sink.write(table_bytes())
+
+
+class SharedTables:
+    """Zero-copy view of a packed table block, with evaluators on top of it."""
+
+    def __init__(self, buffer: "memoryview | mmap.mmap") -> None:
+        """Read the tables from a block without copying them.
+
+        Args:
+            buffer (memoryview | mmap.mmap): Block written by table_bytes.
+
+        Raises:
+            ValueError: If the buffer does not hold a table block.
+        """
+        view = memoryview(buffer)
+        magic, version, _, paired, unsuited = HEADER.unpack_from(view)
+        if magic != MAGIC or version != VERSION:
+            view.release()
+            raise ValueError(f"Not a version {VERSION} table block")
+        ranges, _ = _layout(paired, unsuited)
+        self._view = view
+        self._handle = None
+        self._views = [
+            view[slice(*ranges[name])].cast(typecode)
+            for name, typecode, _ in _sections(paired, unsuited)
+        ]
+        (
+            self._card_primes, self._flush, self._unique, self._categories,
+            self._paired_keys, self._paired_values, self._flush7,
+            self._unsuited_keys, self._unsuited_values,
+        ) = self._views
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedTables":
+        """Attach to a block published by publish_tables.
+
+        Args:
+            name (str): Name of the shared memory block.
+
+        Returns:
+            SharedTables: Tables reading straight from the block.
+        """
+        if sys.version_info >= (3, 13):
+            block = shared_memory.SharedMemory(name, track=False)
+        else:
+            # Pool workers share the publisher's resource tracker, which
+            # keeps one registration per name, so exiting never unlinks it.
+            block = shared_memory.SharedMemory(name)
+        tables = cls(block.buf)
+        tables._handle = block
+        return tables
+
+    @classmethod
+    def open(cls, path: str) -> "SharedTables":
+        """Memory-map a file written by write_tables.
+
+        Args:
+            path (str): Path of the file.
+
+        Returns:
+            SharedTables: Tables reading straight from the mapped file.
+        """
+        with open(path, "rb") as source:
+            mapped = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        tables = cls(mapped)
+        tables._handle = mapped
+        return tables
+
+    def evaluate5(self, c0: int, c1: int, c2: int, c3: int, c4: int) -> int:
+        """Return the strength of five encoded cards.
+
+        Args:
+            c0 (int): First encoded card.
+            c1 (int): Second encoded card.
+            c2 (int): Third encoded card.
+            c3 (int): Fourth encoded card.
+            c4 (int): Fifth encoded card.
+
+        Returns:
+            int: Strength as returned by evaluator.evaluate5.
+
+        Raises:
+            ValueError: If the hand repeats cards in a way one deck's tables
+                cannot score (see poker.shoe.evaluate_shoe).
+        """
+        bit = _CARD_BIT
+        mask = bit[c0] | bit[c1] | bit[c2] | bit[c3] | bit[c4]
+        suit = _CARD_SUIT
+        if suit[c0] & suit[c1] & suit[c2] & suit[c3] & suit[c4]:
+            strength = self._flush[mask]
+        else:
+            strength = self._unique[mask]
+            if not strength:
+                prime = self._card_primes
+                product = prime[c0] * prime[c1] * prime[c2] * prime[c3] * prime[c4]
+                keys = self._paired_keys
+                index = bisect_left(keys, product)
+                if index < len(keys) and keys[index] == product:
+                    strength = self._paired_values[index]
+        if not strength:
+            raise repeated_cards_error([c0, c1, c2, c3, c4])
+        return strength
+
+    def evaluate7(self, cards: list[int]) -> int:
+        """Return the strength of the best five of five to seven encoded cards.
+
+        Args:
+            cards (list[int]): Five to seven encoded cards.
+
+        Returns:
+            int: Strength as returned by holdem.evaluate7.
+
+        Raises:
+            ValueError: If fewer than five or more than seven cards are given.
+        """
+        if not 5 <= len(cards) <= 7:
+            raise ValueError(f"Expected five to seven cards, got {len(cards)}")
+        prime = self._card_primes
+        product = 1
+        suit_counts = [0, 0, 0, 0]
+        suit_masks = [0, 0, 0, 0]
+        for card in cards:
+            product *= prime[card]
+            suit_counts[card & 3] += 1
+            suit_masks[card & 3] |= 1 << (card >> 2)
+        best = self._unsuited_values[bisect_left(self._unsuited_keys, product)]
+        for suit, count in enumerate(suit_counts):
+            if count >= 5:
+                return max(best, self._flush7[suit_masks[suit]])
+        return best
+
+    def category(self, strength: int) -> int:
+        """Return the hand category of a strength, as evaluator.hand_category."""
+        return self._categories[strength]
+
+    def close(self) -> None:
+        """Release the views and detach from the block or file."""
+        for view in self._views:
+            view.release()
+        self._view.release()
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+def init_worker(name: str) -> None:
+    """Attach a pool worker to published tables; use as a pool initializer.
+
+    Args:
+        name (str): Name of the block returned by publish_tables.
+    """
+    global _attached
+    _attached = SharedTables.attach(name)
+
+
+def worker_tables() -> SharedTables:
+    """Return the tables the current worker attached to with init_worker.
+
+    Returns:
+        SharedTables: The attached tables.
+
+    Raises:
+        RuntimeError: If init_worker has not run in this process.
+    """
+    if _attached is None:
+        raise RuntimeError("init_worker has not attached this process to tables")
+    return _attached
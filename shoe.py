@@ -0,0 +1,237 @@
+"""Multi-deck shoes and evaluation of hands that may repeat cards.
+
+A Shoe is a Deck holding several 52-card decks, for tables with more than
+ten players. It deals by the same partial Fisher-Yates shuffle and also
+tracks how many copies of each card are still in the shoe.
+
+With two or more decks a hand can hold the same card twice, which
+poker.evaluator does not handle. Two kinds of hands can appear that one deck
+cannot deal:
+
+* five cards of one suit with a repeated rank, e.g. two ace of spades and
+  three other spades: a flush, compared with the other flushes card by card
+  from the highest (unless its pairs make a full house or better),
+* five of a kind, which ranks above a straight flush, and five identical
+  cards (a flush five, five decks or more), which ranks above that.
+
+evaluate_shoe scores hands on an extended scale that orders every class of
+both kinds together with the standard ones, so its strengths are not those
+of evaluator.evaluate_rank. Hands one deck can deal keep their relative
+order: a table maps each standard strength to the extended scale. Pass
+evaluate=evaluate_shoe to showdown.showdown or main.evaluate_result to rank
+the hands of a shoe table.
+"""
+from array import array
+from itertools import combinations_with_replacement
+
+from poker.cards import DECK_SIZE, encode_cards
+from poker.deck import Deck
+from poker.evaluator import (
+    CATEGORY_NAMES,
+    FLUSH,
+    FULL_HOUSE,
+    MAX_STRENGTH,
+    PAIRED_TABLE,
+    PRIMES,
+    evaluate5,
+    hand_category,
+    hand_kickers,
+)
+
+FIVE_OF_A_KIND = 11
+FLUSH_FIVE = 12
+
+SHOE_CATEGORY_NAMES = {
+    **CATEGORY_NAMES, FIVE_OF_A_KIND: "Five of a Kind", FLUSH_FIVE: "Flush Five"
+}
+
+
+class Shoe(Deck):
+    """Several shuffled decks dealt as one, with a remaining-card tracker.
+
+    Attributes:
+        decks (int): Number of 52-card decks in the shoe.
+    """
+
+    __slots__ = ("decks", "_counts")
+
+    def __init__(self, decks: int = 2, seed: int | None = None) -> None:
+        """Create a full shoe.
+
+        Args:
+            decks (int, optional): Number of decks. Defaults to 2.
+            seed (int | None, optional): Seed of the shoe's random generator.
+                Defaults to a random seed.
+
+        Raises:
+            ValueError: If decks is not positive.
+        """
+        if decks < 1:
+            raise ValueError(f"A shoe needs at least one deck, got {decks}")
+        super().__init__(seed, list(range(DECK_SIZE)) * decks)
+        self.decks = decks
+        self._counts = array("I", [decks] * DECK_SIZE)
+
+    def reset(self) -> None:
+        """Return every dealt card to the shoe."""
+        super().reset()
+        self._counts[:] = array("I", [self.decks] * DECK_SIZE)
+
+    def draw(self) -> int:
+        """Deal a single card.
+
+        Returns:
+            int: The encoded card.
+
+        Raises:
+            ValueError: If the shoe is empty.
+        """
+        card = super().draw()
+        self._counts[card] -= 1
+        return card
+
+    def deal(
+        self, n: int, out: "list[int] | bytearray | None" = None, start: int = 0
+    ) -> "list[int] | bytearray":
+        """Deal n cards, optionally into a preallocated buffer.
+
+        Args:
+            n (int): Number of cards to deal.
+            out (list[int] | bytearray | None, optional): Buffer to write the
+                cards into. Defaults to a new list.
+            start (int, optional): First position in out to fill. Defaults to 0.
+
+        Returns:
+            list[int] | bytearray: The buffer holding the dealt cards.
+
+        Raises:
+            ValueError: If fewer than n cards are left.
+        """
+        out = super().deal(n, out, start)
+        counts = self._counts
+        for card in out[start:start + n]:
+            counts[card] -= 1
+        return out
+
+    def remaining(self, card: "tuple[str, str] | int") -> int:
+        """Return how many copies of a card are still in the shoe.
+
+        Args:
+            card (tuple[str, str] | int): The card.
+
+        Returns:
+            int: Copies not yet dealt, from 0 to decks.
+        """
+        return self._counts[encode_cards([card])[0]]
+
+    def remaining_rank(self, rank: int) -> int:
+        """Return how many cards of a rank are still in the shoe.
+
+        Args:
+            rank (int): Rank index (0 for "2", 12 for "A").
+
+        Returns:
+            int: Undealt cards of that rank, over all suits.
+        """
+        return sum(self._counts[rank << 2:(rank << 2) + 4])
+
+
+def _paired_category(ranks: tuple[int, ...]) -> tuple[int, int]:
+    """Return the standard category and strength of five repeated ranks."""
+    product = 1
+    for rank in ranks:
+        product *= PRIMES[rank]
+    strength = PAIRED_TABLE[product]
+    return hand_category(strength), strength
+
+
+def _build_tables() -> None:
+    """Order every class of the extended scale and fill the lookup tables."""
+    # Sort keys: category, then how the class compares within it. Flushes
+    # compare their ranks from the highest, repeated or not; other standard
+    # classes keep their order.
+    classes = []
+    for strength in range(1, MAX_STRENGTH + 1):
+        category = hand_category(strength)
+        within = hand_kickers(strength) if category == FLUSH else (strength,)
+        classes.append(((category, within), ("standard", strength)))
+    for ranks in combinations_with_replacement(range(12, -1, -1), 5):
+        if len(set(ranks)) == 1:
+            classes.append(((FIVE_OF_A_KIND, ranks), ("five", ranks[0])))
+            classes.append(((FLUSH_FIVE, ranks), ("flush five", ranks[0])))
+        elif len(set(ranks)) < 5:
+            category, _ = _paired_category(ranks)
+            if category < FULL_HOUSE:
+                key = tuple(sorted(ranks, reverse=True))
+                classes.append(((FLUSH, key), ("suited", ranks)))
+
+    classes.sort()
+    for position, (key, (kind, value)) in enumerate(classes, start=1):
+        _CATEGORIES.append(key[0])
+        if kind == "standard":
+            _STANDARD[value] = position
+        elif kind == "five":
+            _FIVE[value] = position
+        elif kind == "flush five":
+            _FLUSH_FIVE[value] = position
+        else:
+            product = 1
+            for rank in value:
+                product *= PRIMES[rank]
+            _SUITED_PAIRED[product] = position
+
+
+_STANDARD = array("H", [0] * (MAX_STRENGTH + 1))
+_FIVE = [0] * 13
+_FLUSH_FIVE = [0] * 13
+_SUITED_PAIRED = {}
+_CATEGORIES = [0]
+_build_tables()
+_CATEGORIES = bytes(_CATEGORIES)
+
+MAX_SHOE_STRENGTH = len(_CATEGORIES) - 1
+
+
+def evaluate_shoe(cards: "list[tuple[str, str] | int]") -> int:
+    """Return the strength of five cards that may repeat.
+
+    Args:
+        cards (list[tuple[str, str] | int]): Five cards as (suit, value)
+            tuples or encoded ints, e.g. dealt from a Shoe.
+
+    Returns:
+        int: Strength from 1 to MAX_SHOE_STRENGTH on the extended scale.
+
+    Raises:
+        ValueError: If the hand does not hold five cards.
+    """
+    cards = encode_cards(cards)
+    if len(cards) != 5:
+        raise ValueError(f"Expected five cards, got {len(cards)}")
+    c0, c1, c2, c3, c4 = cards
+    rank = c0 >> 2
+    suited = c0 & 3 == c1 & 3 == c2 & 3 == c3 & 3 == c4 & 3
+    if rank == c1 >> 2 == c2 >> 2 == c3 >> 2 == c4 >> 2:
+        return _FLUSH_FIVE[rank] if suited else _FIVE[rank]
+    if suited and len(set(cards)) < 5:
+        product = 1
+        for card in cards:
+            product *= PRIMES[card >> 2]
+        position = _SUITED_PAIRED.get(product)
+        if position:
+            return position
+        # A suited full house or four of a kind ranks as itself.
+        return _STANDARD[PAIRED_TABLE[product]]
+    return _STANDARD[evaluate5(c0, c1, c2, c3, c4)]
+
+
+def shoe_category(strength: int) -> int:
+    """Return the category of a strength returned by evaluate_shoe.
+
+    Args:
+        strength (int): Strength on the extended scale.
+
+    Returns:
+        int: Category from HIGH_CARD (1) to FLUSH_FIVE (12).
+    """
+    return _CATEGORIES[strength]
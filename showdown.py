@@ -0,0 +1,51 @@
+"""Showdown ranking for any number of players.
+
+Every hand is reduced to one comparable key, its evaluator strength, so
+ranking a table is a single sort. Players whose hands have the same strength
+end up in the same group and split that part of the pot.
+"""
+from itertools import groupby
+from typing import TYPE_CHECKING, TypeVar
+
+from poker.evaluator import evaluate_rank
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Mapping, Sequence
+
+P = TypeVar("P", bound="Hashable")
+
+
+def rank_strengths(strengths: "Mapping[P, int]") -> list[list[P]]:
+    """Group players by strength, strongest group first.
+
+    Args:
+        strengths (Mapping[P, int]): Hand strength of every player.
+
+    Returns:
+        list[list[P]]: Groups of players with equal hands, best first. Players
+        keep their original order inside a group.
+    """
+    ordered = sorted(strengths, key=strengths.__getitem__, reverse=True)
+    return [list(group) for _, group in groupby(ordered, key=strengths.__getitem__)]
+
+
+def showdown(
+    hands: "Mapping[P, Sequence] | Sequence[Sequence]",
+    evaluate: "Callable[[Sequence], int]" = evaluate_rank,
+) -> list[list[P]]:
+    """Rank the hands of any number of players.
+
+    Args:
+        hands (Mapping | Sequence): Five cards per player, either keyed by
+            player name or as a list indexed by seat.
+        evaluate (Callable, optional): Function returning the strength of a
+            hand. Defaults to evaluator.evaluate_rank; pass
+            shoe.evaluate_shoe for tables dealt from a multi-deck shoe.
+
+    Returns:
+        list[list[P]]: Split-pot groups of player names (or seat indices),
+        best first; the first group holds the winners.
+    """
+    if not hasattr(hands, "items"):
+        hands = dict(enumerate(hands))
+    return rank_strengths({player: evaluate(cards) for player, cards in hands.items()})
@@ -0,0 +1,158 @@
+"""Headless Monte Carlo simulator for five-card draw.
+
+For a starting hand and a discard choice the simulator draws the replacement
+cards and the opponents' hands from the rest of the deck, scores everything
+with poker.evaluator and counts how often the hand wins, ties or loses.
+Opponents stand pat on the five cards they are dealt.
+
+Trials are split into chunks, and every chunk deals from its own Deck
+seeded from the master seed and the chunk number, so a simulation gives the
+same result for the same seed no matter how many worker processes run it.
+"""
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from poker.cards import encode_cards
+from poker.deck import Deck
+from poker.evaluator import evaluate5
+from poker.main import generate_deck
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+    """Outcome counts of a simulation.
+
+    Attributes:
+        wins (int): Trials in which the hand beat every opponent.
+        ties (int): Trials in which the hand split the pot.
+        losses (int): Trials in which an opponent had a better hand.
+    """
+
+    wins: int
+    ties: int
+    losses: int
+
+    @property
+    def trials(self) -> int:
+        """Total number of simulated trials."""
+        return self.wins + self.ties + self.losses
+
+    @property
+    def win_rate(self) -> float:
+        """Fraction of trials won outright."""
+        return self.wins / self.trials
+
+    @property
+    def tie_rate(self) -> float:
+        """Fraction of trials ending in a split pot."""
+        return self.ties / self.trials
+
+    @property
+    def loss_rate(self) -> float:
+        """Fraction of trials lost."""
+        return self.losses / self.trials
+
+
+def chunk_seeds(seed: int, chunks: int) -> list[int]:
+    """Derive independent per-chunk seeds from a master seed.
+
+    Args:
+        seed (int): Master seed of the simulation.
+        chunks (int): Number of chunks.
+
+    Returns:
+        list[int]: One 64-bit seed per chunk.
+    """
+    master = random.Random(seed)
+    return [master.getrandbits(64) for _ in range(chunks)]
+
+
+def _run_chunk(
+    held: tuple[int, ...],
+    remaining: tuple[int, ...],
+    draws: int,
+    opponents: int,
+    trials: int,
+    seed: int,
+) -> tuple[int, int, int]:
+    """Play ``trials`` draws and return the (wins, ties, losses) counts."""
+    deck = Deck(seed, remaining)
+    needed = draws + 5 * opponents
+    cards = [0] * needed
+    wins = ties = 0
+    for _ in range(trials):
+        deck.reset()
+        deck.deal(needed, cards)
+        mine = evaluate5(*held, *cards[:draws])
+        best = 0
+        for start in range(draws, needed, 5):
+            strength = evaluate5(*cards[start:start + 5])
+            if strength > best:
+                best = strength
+        if mine > best:
+            wins += 1
+        elif mine == best:
+            ties += 1
+    return wins, ties, trials - wins - ties
+
+
+def simulate_draw(
+    hand: list[tuple[str, str] | int],
+    discard: list[int] | None = None,
+    opponents: int = 1,
+    trials: int = 100_000,
+    seed: int = 0,
+    workers: int | None = 1,
+    chunk_size: int = 50_000,
+) -> SimulationResult:
+    """Estimate how a draw decision fares against a number of opponents.
+
+    Args:
+        hand (list[tuple[str, str] | int]): The five starting cards.
+        discard (list[int] | None, optional): Indices of the cards to replace,
+            as passed to main.change_cards. Defaults to standing pat.
+        opponents (int, optional): Number of opponents. Defaults to 1.
+        trials (int, optional): Number of simulated deals. Defaults to 100_000.
+        seed (int, optional): Master seed. Defaults to 0.
+        workers (int | None, optional): Worker processes to use; 1 runs in
+            the current process and None uses every core. Defaults to 1.
+        chunk_size (int, optional): Trials per seeded chunk. Defaults to 50_000.
+
+    Returns:
+        SimulationResult: Win, tie and loss counts.
+
+    Raises:
+        IndexError: If a discard index is outside the hand.
+        ValueError: If trials is not positive or the deck is too small for
+            the requested opponents.
+    """
+    if trials <= 0:
+        raise ValueError("trials must be positive")
+    cards = encode_cards(hand)
+    discard = set(discard or ())
+    for idx in discard:
+        if idx < 0 or idx >= len(cards):
+            raise IndexError(f"Invalid card index: {idx}")
+
+    held = tuple(card for idx, card in enumerate(cards) if idx not in discard)
+    remaining = tuple(card for card in generate_deck(encoded=True) if card not in cards)
+    if len(discard) + 5 * opponents > len(remaining):
+        raise ValueError(f"Not enough cards for {opponents} opponents")
+
+    chunks = [chunk_size] * (trials // chunk_size)
+    if trials % chunk_size:
+        chunks.append(trials % chunk_size)
+    tasks = [
+        (held, remaining, len(discard), opponents, size, chunk_seed)
+        for size, chunk_seed in zip(chunks, chunk_seeds(seed, len(chunks)))
+    ]
+
+    if workers == 1:
+        outcomes = [_run_chunk(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(pool.map(_run_chunk, *zip(*tasks)))
+
+    wins, ties, losses = (sum(column) for column in zip(*outcomes))
+    return SimulationResult(wins, ties, losses)
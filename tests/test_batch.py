@@ -0,0 +1,74 @@
+import random
+
+import pytest
+from poker import evaluator
+
+np = pytest.importorskip("numpy")
+batch = pytest.importorskip("poker.batch")
+
+
+def test_batch_agrees_with_scalar_evaluator() -> None:
+    rng = random.Random(7)
+    hands = [rng.sample(range(52), 5) for _ in range(20000)]
+
+    strengths = batch.evaluate_hands_batch(np.array(hands, dtype=np.uint8))
+
+    assert strengths.tolist() == [evaluator.evaluate5(*hand) for hand in hands]
+
+
+def test_batch_covers_every_category() -> None:
+    hands = np.array([
+        [32, 36, 40, 44, 48],  # royal flush
+        [48, 1, 6, 11, 12],    # A-2-3-4-5 straight
+        [44, 45, 46, 47, 0],   # four kings
+        [0, 5, 10, 15, 21],    # 7 high
+    ])
+
+    strengths = batch.evaluate_hands_batch(hands)
+
+    assert strengths.tolist() == [evaluator.evaluate5(*hand) for hand in hands.tolist()]
+    assert batch.hand_categories_batch(strengths).tolist() == [
+        evaluator.ROYAL_FLUSH,
+        evaluator.STRAIGHT,
+        evaluator.FOUR_OF_A_KIND,
+        evaluator.HIGH_CARD,
+    ]
+
+
+def test_batch_rejects_wrong_shape() -> None:
+    with pytest.raises(ValueError):
+        batch.evaluate_hands_batch(np.zeros((3, 4), dtype=np.uint8))
+
+
+@pytest.mark.parametrize("hand", [
+    [44, 45, 46, 47, 44],   # five kings
+    [48, 48, 20, 12, 4],    # hearts with two aces of hearts
+    [51, 51, 51, 51, 51],   # five aces of spades
+])
+def test_batch_rejects_shoe_hands(hand: list[int]) -> None:
+    hands = np.array([[0, 5, 10, 15, 20], hand], dtype=np.uint8)
+
+    with pytest.raises(ValueError, match="evaluate_shoe"):
+        batch.evaluate_hands_batch(hands)
+
+
+def test_batch_scores_shoe_pairs_like_evaluate_rank() -> None:
+    hand = [48, 48, 21, 14, 7]
+
+    assert batch.evaluate_hands_batch(np.array([hand]))[0] == evaluator.evaluate_rank(hand)
+
+
+def test_batch_agrees_with_evaluate_rank_on_shoe_hands() -> None:
+    from poker.shoe import Shoe
+
+    shoe = Shoe(decks=8, seed=3)
+    hands = shoe.deal_hands(80)
+    hands += [[card & ~3 for card in hand] for hand in hands]   # all hearts
+    for hand in hands:
+        try:
+            expected = evaluator.evaluate_rank(hand)
+        except ValueError:
+            with pytest.raises(ValueError, match="evaluate_shoe"):
+                batch.evaluate_hands_batch(np.array([hand]))
+        else:
+            assert batch.evaluate_hands_batch(np.array([hand]))[0] == expected
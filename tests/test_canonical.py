@@ -0,0 +1,119 @@
+import random
+
+import pytest
+from poker import instrumentation
+from poker.canonical import (
+    HAND_CACHE,
+    CanonicalCache,
+    canonicalize,
+    evaluate_hand_cached,
+    evaluate_rank_cached,
+    strength_key,
+)
+from poker.cards import encode_cards
+from poker.evaluator import evaluate_rank
+from poker.main import evaluate_hand
+
+
+def test_suit_permutations_share_a_canonical_form() -> None:
+    hearts = encode_cards([("Hearts", "A"), ("Hearts", "K"), ("Spades", "A"), ("Clubs", "2"), ("Clubs", "9")])
+    swapped = encode_cards([("Diamonds", "A"), ("Diamonds", "K"), ("Clubs", "A"), ("Spades", "2"), ("Spades", "9")])
+
+    assert canonicalize(hearts)[0] == canonicalize(swapped)[0]
+    assert canonicalize(hearts[::-1])[0] == canonicalize(hearts)[0]
+
+
+def test_different_suit_structure_is_kept_apart() -> None:
+    flush = encode_cards([("Hearts", v) for v in ["2", "5", "7", "9", "J"]])
+    offsuit = encode_cards([("Hearts", "2"), ("Hearts", "5"), ("Hearts", "7"), ("Hearts", "9"), ("Spades", "J")])
+
+    assert canonicalize(flush)[0] != canonicalize(offsuit)[0]
+
+
+def test_suit_map_relabels_the_cards() -> None:
+    cards = encode_cards([("Spades", "A"), ("Spades", "K"), ("Hearts", "2"), ("Diamonds", "3"), ("Clubs", "4")])
+
+    canonical, suit_map = canonicalize(cards)
+
+    assert sorted(card & ~3 | suit_map[card & 3] for card in cards) == list(canonical)
+    assert suit_map[3] == 0
+
+
+def test_cache_counts_hits_misses_and_evictions() -> None:
+    calls = []
+    cache = CanonicalCache(lambda cards: calls.append(cards) or len(calls), maxsize=2)
+    pair_hearts = [("Hearts", "A"), ("Spades", "A"), ("Clubs", "2"), ("Clubs", "9"), ("Clubs", "J")]
+    pair_diamonds = [("Diamonds", "A"), ("Spades", "A"), ("Hearts", "2"), ("Hearts", "9"), ("Hearts", "J")]
+    other = [("Hearts", "3"), ("Spades", "4"), ("Clubs", "5"), ("Clubs", "9"), ("Clubs", "J")]
+    third = [("Hearts", "3"), ("Spades", "3"), ("Clubs", "5"), ("Clubs", "9"), ("Clubs", "J")]
+
+    assert cache(pair_hearts) == cache(pair_diamonds) == 1
+    cache(other)
+    cache(third)
+
+    assert cache.stats() == {"hits": 1, "misses": 3, "evictions": 1, "size": 2}
+    assert len(calls) == 3
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    cache = CanonicalCache(lambda cards: cards[0], maxsize=2)
+    first, second, third = ([card + 4 * i for card in (0, 8, 16, 24, 36)] for i in range(3))
+
+    cache(first)
+    cache(second)
+    cache(first)
+    cache(third)
+    cache(first)
+
+    assert cache.hits == 2
+    assert cache.misses == 3
+
+
+def test_cached_evaluators_match_uncached(capsys) -> None:
+    cards = [("Spades", "K"), ("Hearts", "K"), ("Clubs", "7"), ("Diamonds", "7"), ("Spades", "2")]
+
+    assert evaluate_hand_cached(cards) == evaluate_hand(cards) == (3, "K", "7", "2")
+    assert evaluate_rank_cached(cards) == evaluate_rank(cards)
+    assert evaluate_rank_cached(cards[::-1]) == evaluate_rank(cards)
+
+
+def test_cache_rejects_non_positive_size() -> None:
+    with pytest.raises(ValueError):
+        CanonicalCache(len, maxsize=0)
+
+
+def test_strength_key_identifies_the_strength() -> None:
+    rng = random.Random(2)
+    hands = [rng.sample(range(52), 5) for _ in range(5000)]
+
+    by_key = {}
+    for hand in hands:
+        by_key.setdefault(strength_key(hand), set()).add(evaluate_rank(hand))
+
+    assert all(len(strengths) == 1 for strengths in by_key.values())
+    assert len({next(iter(s)) for s in by_key.values()}) == len(by_key)
+
+
+def test_cache_calls_the_function_with_the_original_cards() -> None:
+    seen = []
+    cache = CanonicalCache(lambda cards: seen.append(cards), key=strength_key)
+
+    cache([("Hearts", "A"), ("Spades", "A"), ("Clubs", "2"), ("Clubs", "9"), ("Clubs", "J")])
+
+    assert seen == [[48, 51, 2, 30, 38]]
+
+
+def test_cached_hands_still_count_categories() -> None:
+    cards = [("Spades", "Q"), ("Hearts", "Q"), ("Clubs", "7"), ("Diamonds", "4"), ("Spades", "2")]
+    instrumentation.METRICS.reset()
+    instrumentation.enable()
+    try:
+        evaluate_hand_cached(cards)
+        evaluate_hand_cached(cards[::-1])
+        categories = instrumentation.METRICS.categories
+    finally:
+        instrumentation.disable()
+        instrumentation.METRICS.reset()
+
+    assert categories[2] == 2
+    assert HAND_CACHE.hits >= 1
@@ -0,0 +1,41 @@
+import pytest
+from poker import cards, main
+
+
+def test_encode_decode_roundtrip_for_whole_deck() -> None:
+    deck = main.generate_deck()
+    encoded = cards.encode_cards(deck)
+
+    assert sorted(encoded) == list(range(52))
+    assert cards.decode_cards(encoded) == deck
+
+
+@pytest.mark.parametrize("card, rank, suit", [
+    (("Hearts", "2"), 0, 0),
+    (("Spades", "A"), 12, 3),
+    (("Clubs", "10"), 8, 2),
+])
+def test_card_rank_and_suit(card, rank, suit) -> None:
+    encoded = cards.encode_card(card)
+
+    assert cards.card_rank(encoded) == rank
+    assert cards.card_suit(encoded) == suit
+    assert cards.make_card(rank, suit) == encoded
+
+
+def test_encode_card_passes_ints_through() -> None:
+    assert cards.encode_card(17) == 17
+    assert cards.encode_cards([("Hearts", "3"), 5]) == [4, 5]
+
+
+def test_encode_card_invalid_raises() -> None:
+    with pytest.raises(ValueError):
+        cards.encode_card(("Hearts", "1"))
+
+
+@pytest.mark.parametrize("card", [-1, 54, 255])
+def test_out_of_range_ints_raise(card: int) -> None:
+    with pytest.raises(ValueError, match="Invalid card"):
+        cards.encode_card(card)
+    with pytest.raises(ValueError, match="Invalid card"):
+        cards.encode_cards([0, card])
@@ -0,0 +1,51 @@
+import io
+
+import pytest
+from poker import cli
+from poker.cards import encode_cards
+from poker.evaluator import MAX_STRENGTH, evaluate_rank
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("AhKdQs10cJh", [("Hearts", "A"), ("Diamonds", "K"), ("Spades", "Q"),
+                     ("Clubs", "10"), ("Hearts", "J")]),
+    ("ah kd, qs TC jh", [("Hearts", "A"), ("Diamonds", "K"), ("Spades", "Q"),
+                         ("Clubs", "10"), ("Hearts", "J")]),
+    ("2s3s4s5s6s", [("Spades", "2"), ("Spades", "3"), ("Spades", "4"),
+                    ("Spades", "5"), ("Spades", "6")]),
+])
+def test_parse_hand(text: str, expected: list[tuple[str, str]]) -> None:
+    assert cli.parse_hand(text) == encode_cards(expected)
+
+
+@pytest.mark.parametrize("text", [
+    "AhKdQs10c", "AhKdQs10cJhJh", "AhAhQs10cJh", "AxKdQs10cJh", "1hKdQs10cJh",
+])
+def test_parse_hand_rejects_invalid_hands(text: str) -> None:
+    with pytest.raises(ValueError):
+        cli.parse_hand(text)
+
+
+def test_evaluate_stream_writes_one_line_per_hand() -> None:
+    lines = ["AsKsQsJsTs\n", "\n", "bad\n", "7h5d4c3s2h\n"] * 3
+    out, errors = io.StringIO(), io.StringIO()
+
+    invalid = cli.evaluate_stream(lines, out, "hands.txt", chunk_size=2, errors=errors)
+
+    assert invalid == 3
+    assert out.getvalue().splitlines() == [
+        f"AsKsQsJsTs\t{MAX_STRENGTH}\tRoyal Flush",
+        "7h5d4c3s2h\t1\tHigh Card",
+    ] * 3
+    assert errors.getvalue().splitlines()[0].startswith("hands.txt:3: ")
+
+
+def test_main_reads_files(tmp_path, capsys) -> None:
+    path = tmp_path / "hands.txt"
+    path.write_text("Ah Ad Ac Kh Kd\n")
+
+    assert cli.main([str(path)]) == 0
+
+    hand, strength, category = capsys.readouterr().out.rstrip("\n").split("\t")
+    assert int(strength) == evaluate_rank(cli.parse_hand(hand))
+    assert category == "Full House"
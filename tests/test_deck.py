@@ -0,0 +1,47 @@
+import pytest
+from poker.deck import Deck
+
+
+def test_deck_deals_every_card_once() -> None:
+    deck = Deck(seed=1)
+
+    cards = deck.deal(52)
+
+    assert sorted(cards) == list(range(52))
+    assert len(deck) == 0
+
+
+def test_same_seed_replays_the_same_deal() -> None:
+    assert Deck(seed=42).deal_hands(4) == Deck(seed=42).deal_hands(4)
+    assert Deck(seed=42).deal(10) != Deck(seed=43).deal(10)
+
+
+def test_deal_into_preallocated_buffer() -> None:
+    buffer = bytearray(10)
+    deck = Deck(seed=5)
+
+    deck.deal(5, buffer)
+    deck.deal(5, buffer, start=5)
+
+    assert len(set(buffer)) == 10
+    assert len(deck) == 42
+
+
+def test_draw_and_reset() -> None:
+    deck = Deck(seed=0, cards=[3, 7, 9])
+
+    drawn = {deck.draw() for _ in range(3)}
+
+    assert drawn == {3, 7, 9}
+    with pytest.raises(ValueError):
+        deck.draw()
+    deck.reset()
+    assert len(deck) == 3
+
+
+def test_dealing_too_many_cards_raises() -> None:
+    deck = Deck(seed=0)
+    deck.deal(50)
+
+    with pytest.raises(ValueError):
+        deck.deal(3)
@@ -0,0 +1,62 @@
+import pytest
+from poker import evaluator
+
+pytest.importorskip("numpy")
+from poker import draw_solver  # noqa: E402
+
+FOUR_TO_A_ROYAL = [
+    ("Hearts", "10"),
+    ("Hearts", "J"),
+    ("Clubs", "2"),
+    ("Hearts", "Q"),
+    ("Hearts", "K"),
+]
+
+
+def test_royal_flush_stands_pat() -> None:
+    hand = [("Spades", v) for v in ["10", "J", "Q", "K", "A"]]
+
+    best = draw_solver.solve_draw(hand)
+
+    assert best.discard == ()
+    assert best.expected_value == draw_solver.DEFAULT_PAYOUTS[evaluator.ROYAL_FLUSH]
+
+
+def test_four_to_a_royal_has_exact_distribution() -> None:
+    best = draw_solver.solve_draw(FOUR_TO_A_ROYAL)
+
+    assert best.discard == (2,)
+    assert best.total == 47
+    assert best.counts[evaluator.ROYAL_FLUSH] == 1
+    assert best.counts[evaluator.STRAIGHT_FLUSH] == 1
+    assert best.counts[evaluator.FLUSH] == 7
+    assert best.counts[evaluator.STRAIGHT] == 6
+    assert best.counts[evaluator.ONE_PAIR] == 12
+    assert best.counts[evaluator.HIGH_CARD] == 20
+
+
+def test_options_cover_every_discard_with_full_counts() -> None:
+    options = draw_solver.draw_options(FOUR_TO_A_ROYAL)
+
+    assert len({option.discard for option in options}) == 32
+    draws = {option.discard: option.total for option in options}
+    assert draws[()] == 1
+    assert draws[(0, 1, 2, 3, 4)] == 1533939
+
+
+def test_suit_permuted_hand_maps_discard_back() -> None:
+    permuted = [("Spades", "K"), ("Diamonds", "2"), ("Spades", "Q"), ("Spades", "J"), ("Spades", "10")]
+
+    best = draw_solver.solve_draw(permuted)
+
+    assert best.discard == (1,)
+    assert best.expected_value == draw_solver.solve_draw(FOUR_TO_A_ROYAL).expected_value
+
+
+def test_payout_table_changes_the_decision() -> None:
+    pairs_only = {evaluator.ONE_PAIR: 1}
+
+    best = draw_solver.solve_draw(FOUR_TO_A_ROYAL, pairs_only)
+
+    assert best.counts[evaluator.ONE_PAIR] / best.total == best.expected_value
+    assert best.discard != (2,)
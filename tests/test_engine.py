@@ -0,0 +1,60 @@
+import io
+import json
+
+import pytest
+from poker import engine
+from poker.evaluator import evaluate5
+
+
+def discard_first_two(seat, cards):
+    return [0, 1]
+
+
+def test_play_game_is_reproducible_for_a_seed() -> None:
+    first = engine.play_game(players=4, policy=discard_first_two, seed=11)
+    second = engine.play_game(players=4, policy=discard_first_two, seed=11)
+
+    assert first == second
+    assert first.seed == 11
+
+
+def test_play_game_records_every_phase() -> None:
+    result = engine.play_game(players=3, policy=[engine.stand_pat, discard_first_two, engine.stand_pat], seed=2)
+
+    assert result.discards == ((), (0, 1), ())
+    assert result.final[0] == result.dealt[0]
+    assert result.final[1][2:] == result.dealt[1][2:]
+    assert result.final[1][:2] != result.dealt[1][:2]
+    assert len({card for hand in result.dealt + result.final for card in hand}) == 17
+    assert result.strengths == tuple(evaluate5(*hand) for hand in result.final)
+    assert sorted(seat for group in result.ranking for seat in group) == [0, 1, 2]
+    assert all(result.strengths[seat] == max(result.strengths) for seat in result.winners)
+
+
+def test_play_game_does_not_print(capsys) -> None:
+    engine.play_game(players=2, seed=0)
+
+    assert capsys.readouterr().out == ""
+
+
+def test_run_games_streams_seeded_games() -> None:
+    games = list(engine.run_games(5, players=2, seed=3))
+
+    assert len(games) == 5
+    assert games == list(engine.run_games(5, players=2, seed=3))
+    assert engine.play_game(2, seed=games[4].seed) == games[4]
+
+
+def test_write_results_writes_json_lines() -> None:
+    sink = io.StringIO()
+
+    written = engine.write_results(engine.run_games(3, seed=1), sink)
+
+    lines = sink.getvalue().splitlines()
+    assert written == len(lines) == 3
+    assert set(json.loads(lines[0])) == {"seed", "dealt", "discards", "final", "strengths", "ranking"}
+
+
+def test_invalid_policy_index_raises() -> None:
+    with pytest.raises(IndexError):
+        engine.play_game(policy=lambda seat, cards: [7], seed=0)
@@ -0,0 +1,36 @@
+from poker import enumeration, evaluator
+
+
+def test_count_hands_gives_exact_category_frequencies() -> None:
+    counts = enumeration.count_hands(workers=2)
+
+    assert counts.total == enumeration.TOTAL_HANDS
+    assert counts.categories == {
+        evaluator.HIGH_CARD: 1302540,
+        evaluator.ONE_PAIR: 1098240,
+        evaluator.TWO_PAIRS: 123552,
+        evaluator.THREE_OF_A_KIND: 54912,
+        evaluator.STRAIGHT: 10200,
+        evaluator.FLUSH: 5108,
+        evaluator.FULL_HOUSE: 3744,
+        evaluator.FOUR_OF_A_KIND: 624,
+        evaluator.STRAIGHT_FLUSH: 36,
+        evaluator.ROYAL_FLUSH: 4,
+    }
+    assert all(counts.strengths[1:])
+    assert counts.strengths[evaluator.MAX_STRENGTH] == 4
+
+
+def test_prefixes_restrict_the_sweep() -> None:
+    counts = enumeration.count_hands(workers=1, prefixes=[(0, 1), (50, 51)])
+
+    # 50 cards rank above the first pair; nothing ranks above the last one.
+    assert counts.total == 19600
+
+
+def test_reference_code_agrees_on_sampled_prefixes() -> None:
+    # Hands with two low cards of the same suit cover wheels, flushes and
+    # straight flushes as well as every paired category.
+    prefixes = [(0, 4), (1, 6), (0, 1), (44, 45)]
+
+    assert enumeration.verify_reference(workers=1, prefixes=prefixes) == []
@@ -0,0 +1,82 @@
+from itertools import combinations
+
+import pytest
+from poker import equity, evaluator
+from poker.cards import make_card
+
+ROYAL_FLUSH = [make_card(rank, 3) for rank in range(8, 13)]
+# 7-5-4-3-2 of mixed suits, the worst hand in the deck.
+WORST = [make_card(5, 0), make_card(3, 1), make_card(2, 0), make_card(1, 0),
+         make_card(0, 0)]
+
+
+def test_hand_index_is_colexicographic_and_order_free() -> None:
+    first = list(combinations(range(6), 5))
+
+    assert [equity.hand_index(hand) for hand in first] == [0, 1, 2, 3, 4, 5]
+    assert equity.hand_index([51, 50, 49, 48, 47]) == equity.TOTAL_HANDS - 1
+    assert equity.hand_index(ROYAL_FLUSH) == equity.hand_index(ROYAL_FLUSH[::-1])
+
+
+def test_hand_index_rejects_repeated_cards() -> None:
+    with pytest.raises(ValueError):
+        equity.hand_index([1, 1, 2, 3, 4])
+
+
+@pytest.mark.parametrize("hand, expected", [
+    (ROYAL_FLUSH, (equity.OPPONENT_HANDS - 3, 3)),
+    (WORST, (0, 241)),
+])
+def test_hand_equity_extremes(hand: list[int], expected: tuple[int, int]) -> None:
+    assert equity.hand_equity(hand) == expected
+
+
+def test_table_reads_records_by_hand(tmp_path) -> None:
+    path = tmp_path / "equity.bin"
+    records = bytearray(equity.TOTAL_HANDS * equity.RECORD.size)
+    equity.RECORD.pack_into(
+        records, equity.hand_index(ROYAL_FLUSH) * equity.RECORD.size,
+        equity.OPPONENT_HANDS - 3, 3,
+    )
+    with open(path, "wb") as sink:
+        sink.write(equity.HEADER.pack(equity.MAGIC, equity.VERSION))
+        sink.write(records)
+
+    with equity.EquityTable(str(path)) as table:
+        assert len(table) == equity.TOTAL_HANDS
+        assert table.counts(ROYAL_FLUSH[::-1]) == (equity.OPPONENT_HANDS - 3, 3)
+        assert table.equity(ROYAL_FLUSH) == pytest.approx(1 - 1.5 / 1533939)
+        assert table.counts(WORST) == (0, 0)
+
+
+def test_truncated_file_is_rejected(tmp_path) -> None:
+    path = tmp_path / "equity.bin"
+    path.write_bytes(equity.HEADER.pack(equity.MAGIC, equity.VERSION))
+
+    with pytest.raises(ValueError):
+        equity.EquityTable(str(path))
+
+
+def test_compute_equity_matches_direct_counting_on_a_small_deck() -> None:
+    pytest.importorskip("numpy")
+    # Twos to sixes: every category from high card to a straight flush.
+    hands = list(combinations(range(20), 5))
+    strengths = [evaluator.evaluate5(*hand) for hand in hands]
+    masks = [sum(1 << card for card in hand) for hand in hands]
+
+    wins, ties = equity.compute_equity(deck_size=20)
+
+    assert len(wins) == len(hands)
+    for number in range(0, len(hands), 97):
+        hand, mask = hands[number], masks[number]
+        others = [s for s, m in zip(strengths, masks) if not m & mask]
+        expected = (sum(s < strengths[number] for s in others),
+                    sum(s == strengths[number] for s in others))
+        index = equity.hand_index(hand)
+        assert (wins[index], ties[index]) == expected
+
+
+def test_compute_equity_rejects_tiny_decks() -> None:
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        equity.compute_equity(deck_size=9)
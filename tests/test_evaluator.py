@@ -0,0 +1,85 @@
+import random
+from collections import Counter
+from itertools import combinations
+
+import pytest
+from poker import evaluator, main
+
+
+def _hand(text):
+    suits = {"h": "Hearts", "d": "Diamonds", "c": "Clubs", "s": "Spades"}
+    return [(suits[card[-1]], card[:-1]) for card in text.split()]
+
+
+def test_tables_cover_every_equivalence_class() -> None:
+    categories = Counter(
+        evaluator.hand_category(strength) for strength in range(1, evaluator.MAX_STRENGTH + 1)
+    )
+
+    assert categories == {
+        evaluator.HIGH_CARD: 1277,
+        evaluator.ONE_PAIR: 2860,
+        evaluator.TWO_PAIRS: 858,
+        evaluator.THREE_OF_A_KIND: 858,
+        evaluator.STRAIGHT: 10,
+        evaluator.FLUSH: 1277,
+        evaluator.FULL_HOUSE: 156,
+        evaluator.FOUR_OF_A_KIND: 156,
+        evaluator.STRAIGHT_FLUSH: 9,
+        evaluator.ROYAL_FLUSH: 1,
+    }
+
+
+def test_all_distinct_flush_hands_are_known() -> None:
+    deck = main.generate_deck(encoded=True)
+    hearts = [card for card in deck if card & 3 == 0]
+
+    assert all(evaluator.evaluate_rank(list(hand)) for hand in combinations(hearts, 5))
+
+
+@pytest.mark.parametrize("text, strength, category, kickers", [
+    ("7h 5d 4c 3s 2h", 1, evaluator.HIGH_CARD, (5, 3, 2, 1, 0)),
+    ("10h Jh Qh Kh Ah", 7462, evaluator.ROYAL_FLUSH, (12,)),
+    ("Ah 2h 3h 4h 5h", 7453, evaluator.STRAIGHT_FLUSH, (3,)),
+    ("Ad 2h 3h 4h 5h", None, evaluator.STRAIGHT, (3,)),
+    ("Kd Ks Kh 2c Kc", None, evaluator.FOUR_OF_A_KIND, (11, 0)),
+    ("3d 3s 9h 9c 3c", None, evaluator.FULL_HOUSE, (1, 7)),
+    ("Qd 2s Qh 9c 2c", None, evaluator.TWO_PAIRS, (10, 0, 7)),
+])
+def test_strength_category_and_kickers(text, strength, category, kickers) -> None:
+    result = evaluator.evaluate_rank(_hand(text))
+
+    if strength is not None:
+        assert result == strength
+    assert evaluator.hand_category(result) == category
+    assert evaluator.hand_kickers(result) == kickers
+
+
+@pytest.mark.parametrize("better, worse", [
+    ("Ah Ad Kc Qs Js", "Kh Kd Ac Qs Js"),
+    ("Ah Ad Kc Qs 3s", "Ah Ad Kc Js 10s"),
+    ("2h 3h 4h 5h 7h", "Ah Kd Qc Js 10s"),
+    ("6h 5d 4c 3s 2h", "Ah 2d 3c 4s 5h"),
+    ("Ah 2d 3c 4s 5h", "Ah Ad Ac Ks Qh"),
+    ("2h 2d 2c 3s 3h", "Ah Kh Qh Jh 9h"),
+])
+def test_stronger_hand_has_higher_strength(better, worse) -> None:
+    assert evaluator.evaluate_rank(_hand(better)) > evaluator.evaluate_rank(_hand(worse))
+
+
+def test_categories_agree_with_evaluate_hand(capsys) -> None:
+    rng = random.Random(1)
+    deck = main.generate_deck(encoded=True)
+
+    for _ in range(2000):
+        hand = rng.sample(deck, 5)
+        strength = evaluator.evaluate_rank(hand)
+        result = main.evaluate_hand(hand)
+        expected = result if result == 10 else result[0]
+        assert evaluator.hand_category(strength) == expected
+
+
+@pytest.mark.parametrize("hand", [[-1, 0, 4, 8, 12], [0, 4, 8, 12, 60]])
+def test_out_of_range_cards_raise(hand: list[int]) -> None:
+    with pytest.raises(ValueError, match="Invalid card"):
+        evaluator.evaluate_rank(hand)
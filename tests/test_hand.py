@@ -0,0 +1,69 @@
+import random
+
+import pytest
+from poker import evaluator
+from poker.deck import Deck
+from poker.hand import Hand
+from poker.main import change_cards
+
+
+def summary(hand: Hand) -> tuple:
+    return hand.ranks, hand.suits, hand.mask, hand.product
+
+
+def test_replacements_keep_summary_and_strength_in_sync() -> None:
+    rng = random.Random(3)
+    cards = rng.sample(range(52), 5)
+    hand = Hand(cards)
+    for _ in range(5000):
+        card = rng.choice([card for card in range(52) if card not in cards])
+        index = rng.randrange(5)
+        assert hand.replace(index, card) == cards[index]
+        cards[index] = card
+
+        assert hand.cards == cards
+        assert summary(hand) == summary(Hand(cards))
+        assert hand.strength() == evaluator.evaluate5(*cards)
+
+
+@pytest.mark.parametrize("cards, category", [
+    ([("Spades", value) for value in ["10", "J", "Q", "K", "A"]],
+     evaluator.ROYAL_FLUSH),
+    ([("Hearts", "A"), ("Spades", "2"), ("Clubs", "3"), ("Hearts", "4"),
+      ("Hearts", "5")], evaluator.STRAIGHT),
+    ([("Hearts", "9"), ("Spades", "9"), ("Clubs", "9"), ("Diamonds", "9"),
+      ("Hearts", "5")], evaluator.FOUR_OF_A_KIND),
+])
+def test_category(cards: list[tuple[str, str]], category: int) -> None:
+    assert Hand(cards).category() == category
+
+
+def test_change_cards_draws_into_a_hand() -> None:
+    deck = Deck(5)
+    hand = Hand(deck.deal(5))
+    kept = hand[1], hand[3]
+
+    change_cards(hand, deck, [0, 2, 4])
+
+    assert (hand[1], hand[3]) == kept
+    assert summary(hand) == summary(Hand(list(hand)))
+
+
+def test_copy_is_independent() -> None:
+    hand = Hand([0, 1, 2, 3, 4])
+    other = hand.copy()
+    other.replace(0, 51)
+
+    assert list(hand) == [0, 1, 2, 3, 4]
+    assert other.strength() != hand.strength()
+
+
+@pytest.mark.parametrize("cards", [[0, 1, 2, 3], [0, 1, 2, 3, 3]])
+def test_rejects_invalid_hands(cards: list[int]) -> None:
+    with pytest.raises(ValueError):
+        Hand(cards)
+
+
+def test_rejects_duplicate_replacement() -> None:
+    with pytest.raises(ValueError):
+        Hand([0, 1, 2, 3, 4]).replace(0, 4)
@@ -22,6 +22,8 @@ def test_is_royal_flush(colors, values, expected) -> None:
     (["9", "10", "J", "Q", "K"], True),
     (["7", "8", "3", "Q", "K"], False),
     (["2", "3", "Q", "K", "10"], False),
+    (["A", "2", "3", "4", "5"], True),
+    (["A", "2", "3", "4", "6"], False),
 
 ])
 def test_is_straight(values, expected) -> None:
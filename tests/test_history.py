@@ -0,0 +1,86 @@
+import pytest
+from poker import engine
+from poker.history import HistoryReader, HistoryWriter, record_struct
+
+
+def discard_pairs_of_positions(seat, cards):
+    return [0, 3] if seat % 2 else []
+
+
+@pytest.fixture
+def games():
+    return list(engine.run_games(50, players=3, policy=discard_pairs_of_positions, seed=8))
+
+
+def test_roundtrip_through_file(tmp_path, games) -> None:
+    path = tmp_path / "games.bin"
+    with open(path, "wb") as sink:
+        writer = HistoryWriter(sink, players=3)
+        assert writer.write_all(games) == 50
+
+    with HistoryReader(str(path)) as reader:
+        assert len(reader) == 50
+        assert list(reader) == games
+        assert reader[17] == games[17]
+        assert reader[-1] == games[-1]
+
+
+def test_records_are_fixed_width(tmp_path, games) -> None:
+    path = tmp_path / "games.bin"
+    with open(path, "wb") as sink:
+        HistoryWriter(sink, players=3).write_all(games)
+
+    assert record_struct(2).size == 34
+    assert path.stat().st_size == 8 + 50 * record_struct(3).size
+
+
+def test_out_of_range_index_raises(tmp_path, games) -> None:
+    path = tmp_path / "games.bin"
+    with open(path, "wb") as sink:
+        HistoryWriter(sink, players=3).write(games[0])
+
+    with HistoryReader(str(path)) as reader, pytest.raises(IndexError):
+        reader[1]
+
+
+def test_wrong_seat_count_raises(tmp_path, games) -> None:
+    with open(tmp_path / "games.bin", "wb") as sink:
+        writer = HistoryWriter(sink, players=2)
+        with pytest.raises(ValueError):
+            writer.write(games[0])
+
+
+def test_foreign_file_is_rejected(tmp_path) -> None:
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a history file")
+
+    with pytest.raises(ValueError):
+        HistoryReader(str(path))
+
+
+def test_reader_closes_while_iterating(tmp_path, games) -> None:
+    path = tmp_path / "games.bin"
+    with open(path, "wb") as sink:
+        HistoryWriter(sink, players=3).write_all(games)
+
+    reader = HistoryReader(str(path))
+    stream = iter(reader)
+    assert next(stream) == games[0]
+
+    reader.close()
+
+    with pytest.raises(ValueError):
+        next(stream)
+
+
+def test_roundtrip_with_out_of_order_discards(tmp_path) -> None:
+    games = list(engine.run_games(20, policy=lambda seat, cards: [3, 1, 3], seed=2))
+    path = tmp_path / "games.bin"
+    with open(path, "wb") as sink:
+        HistoryWriter(sink, players=2).write_all(games)
+
+    with HistoryReader(str(path)) as reader:
+        assert list(reader) == games
+    assert games[0].discards == ((1, 3), (1, 3))
+    replayed = engine.play_game(policy=lambda seat, cards: [1, 3], seed=games[0].seed)
+    assert replayed == games[0]
@@ -0,0 +1,66 @@
+import random
+from itertools import combinations
+
+import pytest
+from poker import evaluator, holdem
+
+
+def _brute_force(cards):
+    return max(evaluator.evaluate5(*five) for five in combinations(cards, 5))
+
+
+@pytest.mark.parametrize("size", [5, 6, 7])
+def test_evaluate7_matches_best_of_all_combinations(size) -> None:
+    rng = random.Random(size)
+
+    for _ in range(3000):
+        cards = rng.sample(range(52), size)
+        assert holdem.evaluate7(cards) == _brute_force(cards)
+
+
+def test_flush_and_straight_edge_cases() -> None:
+    suited_wheel = [48, 0, 4, 8, 12, 45, 41]  # A-2-3-4-5 of hearts + two kings
+    six_hearts = [0, 8, 16, 24, 32, 44, 49]   # six hearts and an ace of diamonds
+
+    assert evaluator.hand_category(holdem.evaluate7(suited_wheel)) == evaluator.STRAIGHT_FLUSH
+    assert holdem.evaluate7(six_hearts) == _brute_force(six_hearts)
+
+
+def test_incremental_hand_follows_the_board() -> None:
+    rng = random.Random(3)
+    cards = rng.sample(range(52), 7)
+    hand = holdem.HoldemHand(cards[:2])
+
+    for size in range(3, 8):
+        hand.add(cards[size - 1])
+        if size >= 5:
+            assert hand.strength() == holdem.evaluate7(cards[:size])
+
+
+def test_copy_is_independent() -> None:
+    hand = holdem.HoldemHand([0, 4, 8, 12, 25])
+    river = hand.copy()
+
+    river.add(48)
+
+    assert hand.size == 5
+    assert river.strength() > hand.strength()
+
+
+def test_evaluate_holdem_with_tuples() -> None:
+    hole = [("Hearts", "A"), ("Spades", "A")]
+    board = [("Clubs", "A"), ("Diamonds", "K"), ("Hearts", "K"), ("Spades", "2"), ("Clubs", "3")]
+
+    strength = holdem.evaluate_holdem(hole, board)
+
+    assert evaluator.hand_category(strength) == evaluator.FULL_HOUSE
+    assert evaluator.hand_kickers(strength) == (12, 11)
+
+
+def test_invalid_sizes_raise() -> None:
+    with pytest.raises(ValueError):
+        holdem.evaluate7([0, 1, 2, 3])
+    with pytest.raises(ValueError):
+        holdem.HoldemHand([0, 1, 2, 3]).strength()
+    with pytest.raises(ValueError):
+        holdem.HoldemHand(list(range(7))).add(8)
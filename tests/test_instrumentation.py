@@ -0,0 +1,71 @@
+import pytest
+from poker import engine, instrumentation, main, tie_break
+from poker.evaluator import CATEGORY_NAMES, ONE_PAIR
+
+
+@pytest.fixture
+def metrics():
+    instrumentation.METRICS.reset()
+    yield instrumentation.METRICS
+    instrumentation.disable()
+    instrumentation.METRICS.reset()
+    instrumentation.set_reporter(print)
+
+
+def test_disabled_metrics_record_nothing(metrics) -> None:
+    list(engine.run_games(5, seed=1))
+
+    assert sum(metrics.categories) == 0
+    assert all(histogram.count == 0 for histogram in metrics.phases.values())
+
+
+def test_enabled_metrics_time_every_phase(metrics) -> None:
+    calls = []
+    instrumentation.enable(hook=lambda phase, seconds: calls.append(phase))
+
+    list(engine.run_games(10, players=3, seed=1))
+
+    assert sum(metrics.categories) == 30
+    assert {phase: h.count for phase, h in metrics.phases.items()} == dict.fromkeys(instrumentation.PHASES, 10)
+    assert calls[:4] == ["deal", "draw", "evaluate", "showdown"]
+
+
+def test_evaluate_hand_counts_categories(metrics) -> None:
+    instrumentation.enable()
+
+    main.evaluate_hand([("Hearts", "3"), ("Spades", "3"), ("Clubs", "9"), ("Diamonds", "J"), ("Hearts", "K")])
+
+    assert metrics.categories[ONE_PAIR] == 1
+
+
+def test_tie_break_reports_through_reporter(metrics, capsys) -> None:
+    messages = []
+    instrumentation.set_reporter(messages.append)
+    instrumentation.enable()
+
+    outcome = tie_break.pair_tie_break((2, "K", "4"), (2, "K", "9"))
+
+    assert outcome == "player1 won"
+    assert messages == ["player1 won"]
+    assert metrics.outcomes == {"player1 won": 1}
+    assert capsys.readouterr().out == ""
+
+
+def test_silenced_reporter_drops_messages(metrics, capsys) -> None:
+    instrumentation.set_reporter(None)
+
+    assert tie_break.high_card_tie_break("A", "A") == "draw"
+    assert capsys.readouterr().out == ""
+
+
+def test_snapshot_renders_prometheus_text(metrics) -> None:
+    instrumentation.enable()
+    engine.play_game(players=2, seed=4)
+    tie_break.high_card_tie_break("A", "K")
+
+    snapshot = metrics.snapshot()
+
+    assert snapshot.count("poker_hands_total{") == len(CATEGORY_NAMES)
+    assert 'poker_phase_seconds_count{phase="deal"} 1' in snapshot
+    assert 'poker_phase_seconds_bucket{phase="deal",le="+Inf"} 1' in snapshot
+    assert 'poker_outcomes_total{outcome="player0 won"} 1' in snapshot
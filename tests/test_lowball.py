@@ -0,0 +1,86 @@
+import random
+from collections import Counter
+
+import pytest
+from poker import lowball
+from poker.cards import encode_cards
+from poker.evaluator import evaluate5
+
+PATTERNS = {(1, 1, 1, 1, 1): 0, (2, 1, 1, 1): 1, (2, 2, 1): 2, (3, 1, 1): 3,
+            (3, 2): 5, (4, 1): 6}
+
+
+def grouped(ranks: list[int]) -> tuple[tuple[int, ...], list[int]]:
+    groups = sorted(Counter(ranks).items(), key=lambda item: (item[1], item[0]),
+                    reverse=True)
+    return tuple(count for _, count in groups), [rank for rank, _ in groups]
+
+
+def deuce_to_seven_badness(cards: list[int]) -> tuple:
+    """High-hand key with the ace always high: larger is a worse low."""
+    pattern, ranks = grouped([card >> 2 for card in cards])
+    straight = len(pattern) == 5 and ranks[0] - ranks[4] == 4
+    flush = len({card & 3 for card in cards}) == 1
+    if straight and flush:
+        level = 8
+    elif flush and pattern == (1, 1, 1, 1, 1):
+        level = 4.5
+    elif straight:
+        level = 4
+    else:
+        level = PATTERNS[pattern]
+    return level, ranks
+
+
+def ace_to_five_badness(cards: list[int]) -> tuple:
+    """Pairs and ranks only, with the ace lowest: larger is a worse low."""
+    pattern, ranks = grouped([(card >> 2) + 1 for card in cards if card >> 2 != 12]
+                             + [0 for card in cards if card >> 2 == 12])
+    return PATTERNS[pattern], ranks
+
+
+@pytest.mark.parametrize("evaluate, badness", [
+    (lowball.deuce_to_seven, deuce_to_seven_badness),
+    (lowball.ace_to_five, ace_to_five_badness),
+])
+def test_order_matches_reference(evaluate, badness) -> None:
+    rng = random.Random(7)
+    for _ in range(20000):
+        first, second = rng.sample(range(52), 5), rng.sample(range(52), 5)
+        first_is_lower = badness(first) < badness(second)
+        tied = badness(first) == badness(second)
+        assert (evaluate(first) > evaluate(second)) == first_is_lower
+        assert (evaluate(first) == evaluate(second)) == tied
+
+
+def hand(text: str, suits: str = "HDCSH") -> list[int]:
+    names = {"H": "Hearts", "D": "Diamonds", "C": "Clubs", "S": "Spades"}
+    values = ["10" if value == "T" else value for value in text]
+    return encode_cards([(names[suit], value) for suit, value in zip(suits, values)])
+
+
+def test_deuce_to_seven_extremes() -> None:
+    assert lowball.deuce_to_seven(hand("75432")) == lowball.MAX_DEUCE_TO_SEVEN
+    assert lowball.deuce_to_seven(hand("AKQJT", "SSSSS")) == 1
+    # The wheel is an ace-high hand, between K-high and A-6-4-3-2.
+    assert (lowball.deuce_to_seven(hand("KQJT8"))
+            > lowball.deuce_to_seven(hand("A5432"))
+            > lowball.deuce_to_seven(hand("A6432")))
+
+
+def test_ace_to_five_extremes() -> None:
+    best = lowball.ace_to_five(hand("A2345"))
+
+    assert best == lowball.MAX_ACE_TO_FIVE
+    assert lowball.ace_to_five(hand("A2345", "SSSSS")) == best
+    assert lowball.ace_to_five(hand("KKKKQ", "HDCSH")) == 1
+
+
+def test_low_strength_converts_standard_strengths() -> None:
+    cards = hand("9742A")
+    strength = evaluate5(*cards)
+
+    assert lowball.low_strength(strength) == lowball.deuce_to_seven(cards)
+    assert lowball.low_strength(strength, "A-5") == lowball.ace_to_five(cards)
+    with pytest.raises(ValueError):
+        lowball.low_strength(strength, "Badugi")
@@ -1,5 +1,7 @@
 import pytest
 from poker import main
+from poker.cards import encode_cards
+from poker.deck import Deck
 
 
 def test_generate_deck_has_52_unique_cards() -> None:
@@ -23,6 +25,14 @@ def test_deal_cards_removes_cards_from_deck() -> None:
 
     assert len(deck) == original_len - 10
 
+def test_deal_cards_rejects_more_players_than_the_deck_holds() -> None:
+    deck = main.generate_deck()
+
+    with pytest.raises(ValueError, match="11 players"):
+        main.deal_cards(deck, amount_of_users=11)
+
+    assert len(deck) == 52
+
 def extract_colors_and_values(
     cards: list[tuple[str, str]],
 ) -> tuple[list[str], list[str]]:
@@ -98,3 +108,91 @@ def test_change_cards_invalid_index_raises() -> None:
 
     with pytest.raises(IndexError):
         main.change_cards(cards, deck, indices=[10])
+
+
+def test_generate_deck_encoded() -> None:
+    deck = main.generate_deck(encoded=True)
+
+    assert sorted(deck) == list(range(52))
+
+
+def test_evaluate_hand_accepts_encoded_cards() -> None:
+    cards = [
+        ("Hearts", "K"),
+        ("Spades", "3"),
+        ("Clubs", "K"),
+        ("Diamonds", "3"),
+        ("Hearts", "9"),
+    ]
+
+    result = main.evaluate_hand(encode_cards(cards))
+
+    assert result == main.evaluate_hand(cards)
+    assert result == (3, "K", "3", "9")
+
+
+def test_evaluate_hand_does_not_depend_on_card_order() -> None:
+    cards = [
+        ("Hearts", "2"),
+        ("Spades", "A"),
+        ("Clubs", "A"),
+        ("Diamonds", "A"),
+        ("Hearts", "A"),
+    ]
+
+    assert main.evaluate_hand(cards) == (8, "A", "2")
+    assert main.evaluate_hand(cards[::-1]) == (8, "A", "2")
+
+
+def test_change_cards_with_encoded_deck() -> None:
+    deck = main.generate_deck(encoded=True)
+    users_cards = main.deal_cards(deck, amount_of_users=1)
+    cards = users_cards["player0"]
+    top = deck[:2]
+
+    main.change_cards(cards, deck, indices=[0, 4])
+
+    assert cards[0] == top[0]
+    assert cards[4] == top[1]
+    assert len(deck) == 52 - 5 - 2
+
+
+def test_main_plays_interactive_game(monkeypatch, capsys) -> None:
+    monkeypatch.setattr("builtins.input", lambda prompt: "0 1")
+
+    main.main()
+
+    out = capsys.readouterr().out
+    assert "player0 before change" in out
+    assert "player1 after change" in out
+    assert "--- ANALYSIS ---" in out
+
+
+def test_change_cards_draws_from_deck_object() -> None:
+    deck = Deck(seed=9)
+    cards = deck.deal(5)
+
+    main.change_cards(cards, deck, indices=[2])
+
+    assert len(set(cards)) == 5
+    assert len(deck) == 46
+
+
+def test_change_cards_with_too_few_cards_raises() -> None:
+    cards = [("Hearts", "2")] * 5
+
+    with pytest.raises(ValueError):
+        main.change_cards(cards, [("Spades", "A")], indices=[0, 1])
+
+
+def test_evaluate_hand_wheel_straight() -> None:
+    cards = [
+        ("Hearts", "A"),
+        ("Spades", "2"),
+        ("Clubs", "3"),
+        ("Diamonds", "4"),
+        ("Hearts", "5"),
+    ]
+
+    assert main.evaluate_hand(cards) == (5, "5")
+    assert main.evaluate_hand([("Clubs", value) for _, value in cards]) == (9, "5")
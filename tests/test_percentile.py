@@ -0,0 +1,53 @@
+from itertools import combinations
+
+import pytest
+from poker import enumeration, evaluator, percentile
+from poker.percentile import INDEX, PercentileIndex
+
+
+def test_class_sizes_match_exhaustive_counts() -> None:
+    counts = enumeration.count_hands(workers=1)
+
+    assert INDEX.total == enumeration.TOTAL_HANDS
+    assert [INDEX.weaker(s + 1) - INDEX.weaker(s) for s in range(1, 7463)] == list(
+        counts.strengths[1:]
+    )
+
+
+@pytest.mark.parametrize("cards, low, high", [
+    ([("Spades", value) for value in ["10", "J", "Q", "K", "A"]], 99.9999, 100),
+    ([("Hearts", "7"), ("Spades", "5"), ("Clubs", "4"), ("Hearts", "3"),
+      ("Hearts", "2")], 0, 0.02),
+    ([("Hearts", "2"), ("Spades", "2"), ("Clubs", "4"), ("Hearts", "3"),
+      ("Hearts", "5")], 50.1, 50.2),
+])
+def test_percentile(cards: list[tuple[str, str]], low: float, high: float) -> None:
+    assert low <= INDEX.percentile(cards) <= high
+    assert percentile.hand_percentile(cards) == INDEX.percentile(cards)
+
+
+def test_strength_at_inverts_percentile() -> None:
+    assert INDEX.strength_at(0) == 1
+    assert INDEX.strength_at(100) == evaluator.MAX_STRENGTH
+    for percent in (1, 25, 50, 75, 99, 99.9):
+        strength = INDEX.strength_at(percent)
+        assert INDEX.weaker(strength) < percent / 100 * INDEX.total
+        assert INDEX.weaker(strength + 1) >= percent / 100 * INDEX.total
+
+    with pytest.raises(ValueError):
+        INDEX.strength_at(101)
+
+
+def test_dead_cards_match_brute_force() -> None:
+    pytest.importorskip("numpy")
+    live = [0, 4, 8, 12, 17, 30, 51]
+    dead = [card for card in range(52) if card not in live]
+    strengths = sorted(evaluator.evaluate5(*hand) for hand in combinations(live, 5))
+
+    index = PercentileIndex.excluding(dead)
+
+    assert index.total == 21
+    for strength in strengths:
+        assert index.weaker(strength) == sum(s < strength for s in strengths)
+    hand = live[:5]
+    assert percentile.hand_percentile(hand, dead) == index.percentile(hand)
@@ -0,0 +1,93 @@
+import gc
+import io
+import tracemalloc
+
+import pytest
+from poker import engine, results
+from poker.evaluator import hand_category
+
+
+def draw_some(seat: int, cards: list[int]) -> list[int]:
+    return list(range(seat % 4))
+
+
+@pytest.fixture
+def games() -> list[engine.GameResult]:
+    return list(engine.run_games(400, players=3, policy=draw_some, seed=5))
+
+
+def test_store_keeps_columns(games) -> None:
+    store = results.ResultStore(players=3)
+    store.extend(games)
+
+    assert len(store) == 400
+    assert list(store.seeds) == [game.seed for game in games]
+    assert list(store.final) == [s for game in games for s in game.strengths]
+    assert list(store.draws[:3]) == [0, 1, 2]
+    assert store.nbytes == 400 * 8 + 1200 * 6
+    assert sum(outcome == results.WIN for *_, outcome in store.seats()) == sum(
+        len(game.winners) == 1 for game in games
+    )
+
+
+def test_store_rejects_other_table_sizes(games) -> None:
+    with pytest.raises(ValueError):
+        results.ResultStore(players=2).append(games[0])
+
+
+def test_aggregators_count_every_seat(games) -> None:
+    by_category = results.CategoryWinRate()
+    splits = results.SplitFrequency()
+    draws = results.DrawEffect()
+
+    assert results.aggregate(games, [by_category, splits, draws]) == 400
+
+    assert sum(by_category.seats) == sum(draws.seats) == 1200
+    assert sum(by_category.wins) + sum(by_category.splits) == sum(
+        len(game.winners) for game in games
+    )
+    assert splits.games == 400
+    assert splits.split_rate == sum(len(g.winners) > 1 for g in games) / 400
+    assert draws.seats[:4] == [400, 400, 400, 0]
+    best = max(games[0].strengths)
+    assert by_category.seats[hand_category(best)] > 0
+
+
+def test_merge_equals_one_pass(games) -> None:
+    whole, first, second = (results.DrawEffect() for _ in range(3))
+    results.aggregate(games, [whole])
+    results.aggregate(games[:150], [first])
+    results.aggregate(games[150:], [second])
+    first.merge(second)
+
+    assert first.table() == whole.table()
+
+
+def test_write_tables(games) -> None:
+    aggregators = [results.CategoryWinRate(), results.SplitFrequency()]
+    results.aggregate(games, aggregators)
+    sink = io.StringIO()
+
+    results.write_tables(aggregators, sink)
+
+    lines = sink.getvalue().splitlines()
+    assert lines[0] == "# CategoryWinRate"
+    assert lines[1] == "category,seats,wins,splits,win_rate,split_rate"
+    assert "# SplitFrequency" in lines
+    assert "winners,games,rate" in lines
+
+
+def test_aggregation_memory_does_not_grow() -> None:
+    aggregators = [results.CategoryWinRate(), results.SplitFrequency(),
+                   results.DrawEffect()]
+
+    def retained(games: int) -> int:
+        tracemalloc.start()
+        results.aggregate(engine.run_games(games, seed=1), aggregators)
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return size
+
+    retained(100)  # first use allocates caches
+    assert retained(5000) < retained(200) + 4096
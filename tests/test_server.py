@@ -0,0 +1,164 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from poker import engine
+from poker.server import PokerServer
+
+
+def test_deal_discard_showdown_matches_engine() -> None:
+    server = PokerServer()
+
+    async def game() -> list[dict]:
+        dealt = await server.handle({"op": "deal", "players": 3, "seed": 11})
+        table = dealt["table"]
+        drawn = await server.handle(
+            {"op": "discard", "table": table, "seat": 1, "indices": [0, 4]}
+        )
+        result = await server.handle({"op": "showdown", "table": table})
+        return [dealt, drawn, result]
+
+    dealt, drawn, result = asyncio.run(game())
+    expected = engine.play_game(
+        3, [engine.stand_pat, lambda seat, cards: [0, 4], engine.stand_pat], seed=11
+    )
+
+    assert [tuple(hand) for hand in dealt["hands"]] == list(expected.dealt)
+    assert tuple(drawn["cards"]) == expected.final[1]
+    assert tuple(result["strengths"]) == expected.strengths
+    assert tuple(result["winners"]) == expected.winners
+    assert server.tables == {}
+
+
+@pytest.mark.parametrize("request_, error", [
+    ({"op": "fold"}, "Unknown op"),
+    ({"op": "deal", "players": 1}, "players must be"),
+    ({"op": "discard", "table": 99, "seat": 0}, "No open table"),
+    ({"op": "showdown"}, "table"),
+])
+def test_bad_requests_are_answered_with_errors(request_: dict, error: str) -> None:
+    answer = asyncio.run(PokerServer().handle(request_))
+
+    assert answer["ok"] is False
+    assert error in answer["error"]
+
+
+def test_seat_draws_only_once() -> None:
+    server = PokerServer()
+
+    async def game() -> dict:
+        table = (await server.handle({"op": "deal", "seed": 1}))["table"]
+        discard = {"op": "discard", "table": table, "seat": 0, "indices": [2]}
+        await server.handle(discard)
+        return await server.handle(discard)
+
+    assert "already drawn" in asyncio.run(game())["error"]
+
+
+def test_concurrent_tables_over_a_socket() -> None:
+    async def client(port: int, seed: int) -> list[dict]:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+        async def send(line: bytes) -> dict:
+            writer.write(line + b"\n")
+            return json.loads(await reader.readline())
+
+        dealt = await send(json.dumps({"op": "deal", "seed": seed}).encode())
+        invalid = await send(b"{oops")
+        showdown = {"op": "showdown", "table": dealt["table"]}
+        result = await send(json.dumps(showdown).encode())
+        writer.close()
+        await writer.wait_closed()
+        return [dealt, invalid, result]
+
+    async def session() -> list[list[dict]]:
+        with ThreadPoolExecutor(2) as pool:
+            server = await PokerServer(pool).start(port=0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                return await asyncio.gather(*(client(port, s) for s in range(20)))
+
+    sessions = asyncio.run(session())
+
+    assert len({answers[0]["table"] for answers in sessions}) == 20
+    for seed, (dealt, invalid, result) in enumerate(sessions):
+        assert invalid["ok"] is False
+        assert result["ok"] is True
+        assert tuple(result["strengths"]) == engine.play_game(seed=seed).strengths
+
+
+def test_non_integer_indices_draw_nothing() -> None:
+    server = PokerServer()
+
+    async def game() -> tuple[dict, dict]:
+        dealt = await server.handle({"op": "deal", "seed": 3})
+        discard = {"op": "discard", "table": dealt["table"], "seat": 0}
+        bad = [await server.handle({**discard, "indices": indices})
+               for indices in ([0.5], [True], ["1"])]
+        good = await server.handle({**discard, "indices": [1]})
+        return bad, good
+
+    bad, good = asyncio.run(game())
+    expected = engine.play_game(2, lambda seat, cards: [1] if seat == 0 else [], 3)
+
+    assert all("must be integers" in answer["error"] for answer in bad)
+    assert tuple(good["cards"]) == expected.final[0]
+
+
+def test_disconnect_drops_open_tables() -> None:
+    server = PokerServer()
+
+    async def session() -> tuple[int, int]:
+        listener = await server.start(port=0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            for seed in range(3):
+                writer.write(json.dumps({"op": "deal", "seed": seed}).encode() + b"\n")
+                await reader.readline()
+            open_tables = len(server.tables)
+            writer.close()
+            await writer.wait_closed()
+            for _ in range(100):
+                if not server.tables:
+                    break
+                await asyncio.sleep(0.01)
+            return open_tables, len(server.tables)
+
+    assert asyncio.run(session()) == (3, 0)
+
+
+def test_other_connections_cannot_use_a_table() -> None:
+    server = PokerServer()
+
+    async def session() -> tuple[list[dict], dict]:
+        listener = await server.start(port=0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            connections = [
+                await asyncio.open_connection("127.0.0.1", port) for _ in range(2)
+            ]
+
+            async def send(connection: int, request: dict) -> dict:
+                reader, writer = connections[connection]
+                writer.write(json.dumps(request).encode() + b"\n")
+                return json.loads(await reader.readline())
+
+            table = (await send(0, {"op": "deal", "seed": 5}))["table"]
+            refused = [
+                await send(1, {"op": "discard", "table": table, "seat": 0,
+                               "indices": [0]}),
+                await send(1, {"op": "showdown", "table": table}),
+            ]
+            result = await send(0, {"op": "showdown", "table": table})
+            for _, writer in connections:
+                writer.close()
+                await writer.wait_closed()
+            return refused, result
+
+    refused, result = asyncio.run(session())
+
+    assert all("No open table" in answer["error"] for answer in refused)
+    assert tuple(result["strengths"]) == engine.play_game(seed=5).strengths
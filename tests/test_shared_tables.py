@@ -0,0 +1,104 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from poker import evaluator, holdem, shared_tables
+from poker.shared_tables import SharedTables
+
+
+@pytest.fixture(scope="module")
+def block():
+    block = shared_tables.publish_tables()
+    yield block
+    block.close()
+    block.unlink()
+
+
+def sample_hands(size: int, count: int, seed: int) -> list[list[int]]:
+    rng = random.Random(seed)
+    return [rng.sample(range(52), size) for _ in range(count)]
+
+
+def test_attached_tables_agree_with_evaluators(block) -> None:
+    tables = SharedTables.attach(block.name)
+    try:
+        for cards in sample_hands(5, 5000, 1):
+            strength = tables.evaluate5(*cards)
+            assert strength == evaluator.evaluate5(*cards)
+            assert tables.category(strength) == evaluator.hand_category(strength)
+        for size in (5, 6, 7):
+            for cards in sample_hands(size, 2000, size):
+                assert tables.evaluate7(cards) == holdem.evaluate7(cards)
+    finally:
+        tables.close()
+
+
+def paired_hand(product: int) -> list[int]:
+    """Return five cards whose rank primes multiply to product."""
+    cards = []
+    for rank, prime in enumerate(evaluator.PRIMES):
+        suit = 0
+        while product % prime == 0:
+            product //= prime
+            cards.append(rank << 2 | suit)
+            suit += 1
+    return cards
+
+
+def test_every_paired_class_is_found(block) -> None:
+    tables = SharedTables.attach(block.name)
+    try:
+        for product, strength in evaluator.PAIRED_TABLE.items():
+            assert tables.evaluate5(*paired_hand(product)) == strength
+    finally:
+        tables.close()
+
+
+def score(hands: list[list[int]]) -> list[int]:
+    tables = shared_tables.worker_tables()
+    return [tables.evaluate5(*cards) for cards in hands]
+
+
+def test_pool_workers_attach_by_name(block) -> None:
+    hands = sample_hands(5, 200, 2)
+    with ProcessPoolExecutor(
+        2, initializer=shared_tables.init_worker, initargs=(block.name,)
+    ) as pool:
+        chunks = list(pool.map(score, [hands[:100], hands[100:]]))
+
+    assert chunks[0] + chunks[1] == [evaluator.evaluate5(*cards) for cards in hands]
+
+
+def test_tables_from_a_file(tmp_path) -> None:
+    path = tmp_path / "tables.bin"
+    shared_tables.write_tables(str(path))
+
+    tables = SharedTables.open(str(path))
+    try:
+        assert tables.evaluate5(48, 44, 40, 36, 32) == evaluator.MAX_STRENGTH
+    finally:
+        tables.close()
+
+
+def test_rejects_other_data() -> None:
+    with pytest.raises(ValueError):
+        SharedTables(bytes(64))
+
+
+def test_worker_tables_needs_init_worker() -> None:
+    with pytest.raises(RuntimeError):
+        shared_tables.worker_tables()
+
+
+@pytest.mark.parametrize("hand", [
+    [44, 45, 46, 47, 44],
+    [48, 48, 20, 12, 4],
+    [51, 51, 51, 51, 51],
+])
+def test_shoe_hands_are_rejected(block, hand: list[int]) -> None:
+    tables = SharedTables.attach(block.name)
+    try:
+        with pytest.raises(ValueError, match="evaluate_shoe"):
+            tables.evaluate5(*hand)
+    finally:
+        tables.close()
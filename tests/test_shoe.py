@@ -0,0 +1,191 @@
+import random
+from collections import Counter
+
+import pytest
+from poker import instrumentation, main
+from poker.evaluator import MAX_STRENGTH, evaluate5, evaluate_rank
+from poker.shoe import (
+    FIVE_OF_A_KIND,
+    FLUSH_FIVE,
+    MAX_SHOE_STRENGTH,
+    SHOE_CATEGORY_NAMES,
+    Shoe,
+    evaluate_shoe,
+    shoe_category,
+)
+from poker.showdown import showdown
+
+
+def card(rank: int, suit: int = 0) -> int:
+    return rank << 2 | suit
+
+
+def reference_key(cards: list[int]) -> tuple:
+    ranks = sorted((c >> 2 for c in cards), reverse=True)
+    counts = Counter(ranks)
+    grouped = sorted(counts, key=lambda r: (counts[r], r), reverse=True)
+    shape = sorted(counts.values(), reverse=True)
+    flush = len({c & 3 for c in cards}) == 1
+    distinct = sorted(set(ranks), reverse=True)
+    straight = len(distinct) == 5 and (
+        distinct[0] - distinct[4] == 4 or distinct == [12, 3, 2, 1, 0]
+    )
+    top = 3 if distinct == [12, 3, 2, 1, 0] else distinct[0]
+    if shape == [5]:
+        return (12 if len(set(cards)) == 1 else 11, ranks[0])
+    if straight and flush:
+        return (9, top)
+    if shape == [4, 1]:
+        return (8, *grouped)
+    if shape == [3, 2]:
+        return (7, *grouped)
+    if flush:
+        return (6, *ranks)
+    if straight:
+        return (5, top)
+    levels = {(3, 1, 1): 4, (2, 2, 1): 3, (2, 1, 1, 1): 2, (1, 1, 1, 1, 1): 1}
+    return (levels[tuple(shape)], *grouped)
+
+
+def test_shoe_deals_every_card_of_every_deck() -> None:
+    shoe = Shoe(decks=3, seed=1)
+
+    cards = shoe.deal(len(shoe))
+
+    assert len(cards) == 156
+    assert Counter(cards) == {c: 3 for c in range(52)}
+
+
+def test_shoe_tracks_remaining_copies() -> None:
+    shoe = Shoe(decks=2, seed=7)
+    hands = shoe.deal_hands(12)
+    dealt = Counter(c for hand in hands for c in hand)
+    dealt[shoe.draw()] += 1
+
+    assert len(shoe) == 104 - 61
+    assert all(shoe.remaining(c) == 2 - dealt[c] for c in range(52) if dealt[c])
+    assert sum(shoe.remaining(c) for c in range(52)) == len(shoe)
+    assert sum(shoe.remaining_rank(r) for r in range(13)) == len(shoe)
+    assert shoe.remaining(("Spades", "A")) == shoe.remaining(card(12, 3))
+
+    shoe.reset()
+
+    assert len(shoe) == 104
+    assert all(shoe.remaining(c) == 2 for c in range(52))
+
+
+def test_shoe_needs_a_deck() -> None:
+    with pytest.raises(ValueError):
+        Shoe(decks=0)
+    with pytest.raises(ValueError, match="only 52 left"):
+        Shoe(decks=1, seed=0).deal(53)
+
+
+def test_standard_hands_keep_their_order() -> None:
+    rng = random.Random(3)
+    hands = [rng.sample(range(52), 5) for _ in range(2000)]
+
+    pairs = sorted((evaluate5(*hand), evaluate_shoe(hand)) for hand in hands)
+
+    assert [s for _, s in pairs] == sorted(s for _, s in pairs)
+    assert len({s for s, _ in pairs}) == len({s for _, s in pairs})
+
+
+def test_hands_with_repeated_cards_match_the_reference() -> None:
+    shoe = Shoe(decks=6, seed=11)
+    hands = []
+    for _ in range(400):
+        shoe.reset()
+        hands.append(shoe.deal(5))
+    # Single-suit hands, which hold repeated cards far more often.
+    rng = random.Random(5)
+    hands += [[card(rng.randrange(13), 1) for _ in range(5)] for _ in range(1500)]
+    hands += [[card(rng.randrange(13), rng.randrange(2)) for _ in range(5)]
+              for _ in range(1500)]
+
+    by_strength = sorted(hands, key=evaluate_shoe)
+    keys = [reference_key(hand) for hand in by_strength]
+
+    assert keys == sorted(keys)
+    for a, b in zip(by_strength, by_strength[1:]):
+        same = reference_key(a) == reference_key(b)
+        assert same == (evaluate_shoe(a) == evaluate_shoe(b))
+
+
+@pytest.mark.parametrize(
+    ("cards", "category"),
+    [
+        ([card(12, s) for s in (0, 1, 2, 3, 0)], FIVE_OF_A_KIND),
+        ([card(0, 2)] * 5, FLUSH_FIVE),
+        ([card(12)] * 2 + [card(11), card(10), card(9)], 6),
+        ([card(12)] * 3 + [card(11)] * 2, 7),
+        ([card(12)] * 4 + [card(0)], 8),
+    ],
+)
+def test_shoe_categories(cards: list[int], category: int) -> None:
+    assert shoe_category(evaluate_shoe(cards)) == category
+
+
+def test_extended_scale_ends_with_flush_fives() -> None:
+    royal = [card(r, 0) for r in range(8, 13)]
+    five_aces = [card(12, s) for s in (0, 1, 2, 3, 0)]
+
+    assert evaluate_shoe([card(12, 0)] * 5) == MAX_SHOE_STRENGTH
+    assert evaluate_shoe(royal) < evaluate_shoe([card(0, s) for s in (0, 1, 2, 3, 0)])
+    assert evaluate_shoe(five_aces) < evaluate_shoe([card(0, 0)] * 5)
+    assert MAX_SHOE_STRENGTH == MAX_STRENGTH + 26 + 4888 - 13 * 12 - 13 * 12
+    assert SHOE_CATEGORY_NAMES[shoe_category(MAX_SHOE_STRENGTH)] == "Flush Five"
+
+
+def test_evaluate_shoe_needs_five_cards() -> None:
+    with pytest.raises(ValueError):
+        evaluate_shoe([card(0)] * 4)
+
+
+def test_shoe_of_many_decks() -> None:
+    shoe = Shoe(decks=300, seed=1)
+    card_ = shoe.draw()
+
+    assert len(shoe) == 300 * 52 - 1
+    assert shoe.remaining(card_) == 299
+    assert shoe.remaining_rank(card_ >> 2) == 4 * 300 - 1
+
+
+def test_showdown_of_a_shoe_table() -> None:
+    five_aces = [card(12, s) for s in (0, 1, 2, 3, 0)]
+    royal = [card(r, 0) for r in range(8, 13)]
+
+    assert showdown([royal, five_aces], evaluate=evaluate_shoe) == [[1], [0]]
+    with pytest.raises(ValueError, match="evaluate_shoe"):
+        showdown([royal, five_aces])
+
+
+@pytest.mark.parametrize(
+    ("cards", "expected"),
+    [
+        ([card(12, s) for s in (0, 1, 2, 3, 0)], (11, "A")),
+        ([card(0, 2)] * 5, (12, "2")),
+        ([card(12)] * 2 + [card(11), card(10), card(9)], (6, "A")),
+        ([card(12)] * 3 + [card(11)] * 2, (7, "A", "K")),
+    ],
+)
+def test_evaluate_hand_with_repeated_cards(cards: list[int], expected: tuple) -> None:
+    assert main.evaluate_hand(cards) == expected
+
+
+def test_evaluate_rank_rejects_what_one_deck_cannot_score() -> None:
+    with pytest.raises(ValueError, match="evaluate_shoe"):
+        evaluate_rank([card(12)] * 2 + [card(11), card(10), card(9)])
+
+
+def test_metrics_count_five_of_a_kind() -> None:
+    instrumentation.METRICS.reset()
+    instrumentation.enable()
+    try:
+        main.evaluate_hand([card(12, s) for s in (0, 1, 2, 3, 0)])
+        snapshot = instrumentation.METRICS.snapshot()
+    finally:
+        instrumentation.disable()
+        instrumentation.METRICS.reset()
+
+    assert 'poker_hands_total{category="Five of a Kind"} 1' in snapshot
@@ -0,0 +1,68 @@
+import pytest
+from poker import main
+from poker.showdown import rank_strengths, showdown
+
+
+def _hand(text):
+    suits = {"h": "Hearts", "d": "Diamonds", "c": "Clubs", "s": "Spades"}
+    return [(suits[card[-1]], card[:-1]) for card in text.split()]
+
+
+def test_showdown_orders_ten_players() -> None:
+    texts = [
+        "2h 3d 4c 5s 7h",      # 7 high
+        "Ah Ad Kc Qs Js",      # pair of aces
+        "2c 2d 2s 9h 9d",      # full house
+        "10h Jh Qh Kh Ah",     # royal flush
+        "3h 3c 8d 8s Kd",      # two pairs
+        "4h 5h 6d 7c 8c",      # straight
+        "Kc Ks Kh 4d 6s",      # three of a kind
+        "2s 5s 9s Js Qs",      # flush
+        "Ac As Ah Ad 5c",      # four of a kind
+        "2d 3s 4d 5c 7d",      # 7 high, same values as seat 0
+    ]
+    hands = [_hand(text) for text in texts]
+
+    assert showdown(hands) == [[3], [8], [2], [7], [5], [6], [4], [1], [0, 9]]
+
+
+def test_showdown_accepts_named_players() -> None:
+    hands = {
+        "alice": _hand("Ah Kd Qc Js 9h"),
+        "bob": _hand("As Kc Qd Jh 9s"),
+        "carol": _hand("Ac Kh Qh Jd 8c"),
+    }
+
+    assert showdown(hands) == [["alice", "bob"], ["carol"]]
+
+
+@pytest.mark.parametrize("strengths, expected", [
+    ({"a": 5, "b": 9, "c": 5}, [["b"], ["a", "c"]]),
+    ({0: 1}, [[0]]),
+    ({}, []),
+])
+def test_rank_strengths(strengths, expected) -> None:
+    assert rank_strengths(strengths) == expected
+
+
+def test_evaluate_result_prints_winner(capsys) -> None:
+    game_result = [
+        {"player_name": "player0", "hand": _hand("2h 3d 4c 5s 7h")},
+        {"player_name": "player1", "hand": _hand("Kh Kd 2c 5c 9s")},
+    ]
+
+    ranking = main.evaluate_result(game_result)
+
+    assert ranking == [[1], [0]]
+    assert capsys.readouterr().out.strip() == "player with index 1 won"
+
+
+def test_evaluate_result_prints_draw(capsys) -> None:
+    game_result = [
+        {"player_name": "player0", "hand": _hand("Kh Kd 2c 5c 9s")},
+        {"player_name": "player1", "hand": _hand("Ks Kc 2d 5h 9h")},
+    ]
+
+    main.evaluate_result(game_result)
+
+    assert capsys.readouterr().out.strip() == "draw between players with index 0, 1"
@@ -0,0 +1,53 @@
+import pytest
+from poker import simulator
+
+ROYAL_FLUSH = [("Hearts", v) for v in ["10", "J", "Q", "K", "A"]]
+HIGH_CARD = [
+    ("Hearts", "2"),
+    ("Spades", "5"),
+    ("Clubs", "9"),
+    ("Diamonds", "J"),
+    ("Hearts", "K"),
+]
+
+
+def test_royal_flush_standing_pat_never_loses() -> None:
+    result = simulator.simulate_draw(ROYAL_FLUSH, opponents=3, trials=2000)
+
+    assert result.trials == 2000
+    assert result.losses == 0
+    assert result.win_rate == 1.0
+
+
+def test_simulation_is_reproducible_for_a_seed() -> None:
+    first = simulator.simulate_draw(HIGH_CARD, [0, 1, 2], trials=3000, seed=5, chunk_size=1000)
+    second = simulator.simulate_draw(HIGH_CARD, [0, 1, 2], trials=3000, seed=5, chunk_size=1000)
+
+    assert first == second
+    assert 0 < first.win_rate < 1
+
+
+def test_simulation_does_not_depend_on_worker_count() -> None:
+    single = simulator.simulate_draw(HIGH_CARD, [0], trials=2000, seed=3, chunk_size=500)
+    parallel = simulator.simulate_draw(
+        HIGH_CARD, [0], trials=2000, seed=3, chunk_size=500, workers=2
+    )
+
+    assert single == parallel
+
+
+def test_more_opponents_lower_the_win_rate() -> None:
+    heads_up = simulator.simulate_draw(HIGH_CARD, trials=4000, seed=1)
+    full_table = simulator.simulate_draw(HIGH_CARD, opponents=6, trials=4000, seed=1)
+
+    assert full_table.win_rate < heads_up.win_rate
+
+
+def test_invalid_discard_index_raises() -> None:
+    with pytest.raises(IndexError):
+        simulator.simulate_draw(HIGH_CARD, [5], trials=10)
+
+
+def test_too_many_opponents_raises() -> None:
+    with pytest.raises(ValueError):
+        simulator.simulate_draw(HIGH_CARD, opponents=10, trials=10)
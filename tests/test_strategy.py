@@ -0,0 +1,139 @@
+import pytest
+from poker import main
+
+np = pytest.importorskip("numpy")
+from poker.batch import evaluate_hands_batch  # noqa: E402
+from poker.showdown import showdown  # noqa: E402
+from poker.strategy import (  # noqa: E402
+    as_policy,
+    draw_to_pairs,
+    play_batch,
+    stand_pat,
+)
+
+
+def discard_all(hands: np.ndarray) -> np.ndarray:
+    return np.ones(hands.shape, dtype=bool)
+
+
+def test_strategy_is_called_once_per_batch() -> None:
+    calls = []
+
+    def recording(hands: np.ndarray) -> np.ndarray:
+        calls.append(hands.shape)
+        return stand_pat(hands)
+
+    play_batch(1000, players=4, strategy=recording, seed=1)
+
+    assert calls == [(4000, 5)]
+
+
+def test_stand_pat_keeps_the_dealt_hands() -> None:
+    result = play_batch(200, players=3, seed=2)
+
+    assert (result.final == result.dealt).all()
+    assert not result.discards.any()
+    for table in result.dealt:
+        assert len(set(table.ravel().tolist())) == 15
+
+
+def test_drawn_cards_come_from_the_rest_of_the_deck() -> None:
+    result = play_batch(200, players=5, strategy=discard_all, seed=3)
+
+    for dealt, final in zip(result.dealt, result.final):
+        cards = set(dealt.ravel().tolist()) | set(final.ravel().tolist())
+        assert len(cards) == 50
+
+
+def test_strengths_and_winners() -> None:
+    result = play_batch(300, players=3, strategy=draw_to_pairs, seed=4)
+
+    expected = evaluate_hands_batch(result.final.reshape(-1, 5)).reshape(300, 3)
+    assert (result.strengths == expected).all()
+    assert result.winners.any(axis=1).all()
+    best = result.strengths.max(axis=1)
+    assert (result.strengths[result.winners] == np.repeat(
+        best, result.winners.sum(axis=1))).all()
+
+
+def test_one_strategy_per_seat() -> None:
+    result = play_batch(100, players=2, strategy=[stand_pat, discard_all], seed=5)
+
+    assert not result.discards[:, 0].any()
+    assert result.discards[:, 1].all()
+
+
+def test_same_seed_replays_the_batch() -> None:
+    first = play_batch(50, strategy=draw_to_pairs, seed=6)
+    again = play_batch(50, strategy=draw_to_pairs, seed=6)
+
+    assert (first.final == again.final).all()
+
+
+def test_draw_to_pairs() -> None:
+    hands = np.array([
+        [48, 49, 0, 5, 10],     # pair of aces: draw three
+        [0, 5, 10, 16, 40],     # 2 3 4 6 Q: keep the queen
+        [0, 4, 8, 12, 16],      # straight flush: keep
+        [0, 1, 2, 4, 5],        # full house: keep
+    ], dtype=np.uint8)
+
+    mask = draw_to_pairs(hands)
+
+    assert mask.tolist() == [
+        [False, False, True, True, True],
+        [True, True, True, True, False],
+        [False] * 5,
+        [False] * 5,
+    ]
+
+
+def test_bad_mask_shape_raises() -> None:
+    with pytest.raises(ValueError, match="shape"):
+        play_batch(10, strategy=lambda hands: np.zeros(5, dtype=bool))
+
+
+def test_too_many_players_raise() -> None:
+    with pytest.raises(ValueError):
+        play_batch(10, players=11)
+    with pytest.raises(ValueError, match="Not enough cards"):
+        play_batch(10, players=6, strategy=discard_all, seed=0)
+
+
+def test_as_policy_returns_indices() -> None:
+    policy = as_policy(draw_to_pairs)
+
+    assert policy(0, [48, 49, 0, 5, 10]) == [2, 3, 4]
+
+
+def test_main_plays_with_a_strategy(monkeypatch, capsys) -> None:
+    def no_input(prompt: str) -> str:
+        raise AssertionError("main asked for input")
+
+    monkeypatch.setattr("builtins.input", no_input)
+
+    main.main(strategy=draw_to_pairs)
+
+    out = capsys.readouterr().out
+    assert "player0 after change" in out
+    assert "before change" not in out
+
+
+def test_main_asks_the_strategy_once_per_table(capsys) -> None:
+    calls = []
+
+    def recording(hands: np.ndarray) -> np.ndarray:
+        calls.append(hands.shape)
+        return draw_to_pairs(hands)
+
+    main.main(strategy=recording)
+
+    assert calls == [(2, 5)]
+
+
+def test_batch_hands_go_to_the_scalar_showdown() -> None:
+    result = play_batch(3, players=3, seed=1)
+
+    for final, strengths in zip(result.final, result.strengths):
+        ranking = showdown(final)
+        assert ranking[0] == np.flatnonzero(strengths == strengths.max()).tolist()
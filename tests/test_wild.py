@@ -0,0 +1,103 @@
+import random
+from itertools import product
+
+import pytest
+from poker import canonical, evaluator, main, showdown, wild
+from poker.cards import JOKERS, encode_cards
+
+JOKER = 52
+
+
+def substituted_strength(cards: list[int]) -> int:
+    """Score a hand whose cards may repeat, as a joker substitution can."""
+    ranks = [card >> 2 for card in cards]
+    if len(set(ranks)) == 1:
+        return evaluator.MAX_STRENGTH + 1 + ranks[0]
+    mask = 0
+    for rank in ranks:
+        mask |= 1 << rank
+    if len(set(ranks)) == 5:
+        if len({card & 3 for card in cards}) == 1:
+            return evaluator.FLUSH_TABLE[mask]
+        return evaluator.UNIQUE_TABLE[mask]
+    product_ = 1
+    for rank in ranks:
+        product_ *= evaluator.PRIMES[rank]
+    return evaluator.PAIRED_TABLE[product_]
+
+
+def brute_force(cards: list[int]) -> int:
+    naturals = [card for card in cards if card < 52]
+    return max(
+        substituted_strength(naturals + list(subs))
+        for subs in product(range(52), repeat=5 - len(naturals))
+    )
+
+
+@pytest.mark.parametrize("jokers, hands", [(1, 3000), (2, 150), (3, 5)])
+def test_matches_brute_force_substitution(jokers: int, hands: int) -> None:
+    rng = random.Random(jokers)
+    for _ in range(hands):
+        cards = rng.sample(range(52), 5 - jokers) + [JOKER] * jokers
+        assert wild.evaluate_wild(cards) == brute_force(cards), cards
+
+
+@pytest.mark.parametrize("cards, category", [
+    ([("Hearts", "A"), ("Spades", "A"), ("Clubs", "A"), ("Diamonds", "A"),
+      JOKERS[0]], wild.FIVE_OF_A_KIND),
+    ([("Spades", "10"), ("Spades", "J"), ("Spades", "K"), JOKERS[0], JOKERS[1]],
+     evaluator.ROYAL_FLUSH),
+    ([("Hearts", "9"), ("Clubs", "9"), ("Diamonds", "5"), ("Spades", "5"),
+      JOKERS[1]], evaluator.FULL_HOUSE),
+    ([("Hearts", "2"), ("Spades", "7"), ("Clubs", "9"), ("Diamonds", "J"),
+      JOKERS[0]], evaluator.ONE_PAIR),
+])
+def test_categories(cards: list, category: int) -> None:
+    assert wild.wild_category(wild.evaluate_wild(cards)) == category
+
+
+def test_five_of_a_kind_beats_royal_flush() -> None:
+    five_twos = wild.evaluate_wild([0, 1, 2, 3, JOKER])
+    royal = wild.evaluate_wild(encode_cards(
+        [("Spades", value) for value in ["10", "J", "Q", "K", "A"]]
+    ))
+
+    assert royal == evaluator.MAX_STRENGTH
+    assert evaluator.MAX_STRENGTH < five_twos < wild.evaluate_wild([JOKER] * 5)
+    assert wild.evaluate_wild([JOKER] * 5) == wild.MAX_WILD_STRENGTH
+
+
+def test_hands_without_jokers_score_as_usual() -> None:
+    rng = random.Random(4)
+    for _ in range(1000):
+        cards = rng.sample(range(52), 5)
+        assert wild.evaluate_wild(cards) == evaluator.evaluate5(*cards)
+
+
+@pytest.mark.parametrize("jokers", [0, 1, 2])
+def test_generate_deck_with_jokers(jokers: int) -> None:
+    deck = main.generate_deck(jokers=jokers)
+    encoded = main.generate_deck(encoded=True, jokers=jokers)
+
+    assert len(deck) == len(encoded) == 52 + jokers
+    assert sorted(encode_cards(deck)) == encoded
+    assert deck[52:] == JOKERS[:jokers]
+
+
+def test_generate_deck_rejects_three_jokers() -> None:
+    with pytest.raises(ValueError):
+        main.generate_deck(jokers=3)
+
+
+@pytest.mark.parametrize("evaluate", [
+    main.evaluate_hand,
+    evaluator.evaluate_rank,
+    canonical.evaluate_hand_cached,
+    lambda cards: showdown.showdown([cards, [0, 1, 2, 3, 5]]),
+])
+def test_standard_evaluators_reject_jokers(evaluate) -> None:
+    cards = [("Hearts", "A"), ("Spades", "A"), ("Clubs", "2"), ("Clubs", "9"),
+             JOKERS[1]]
+
+    with pytest.raises(ValueError, match="evaluate_wild"):
+        evaluate(cards)
@@ -0,0 +1,168 @@
+"""Evaluation of five-card hands with jokers as wild cards.
+
+A joker (poker.cards.JOKERS, encoded 52 and 53) stands for any card. Instead
+of substituting all 52 cards for every joker, the best completion is worked
+out once per rank histogram of the natural cards: going down the categories,
+the first one the jokers can complete wins, with each joker placed where it
+helps most (the fourth card of the highest rank that can reach four, the
+missing card of the highest straight, ...). As in poker.holdem the results
+live in two small tables built at import, one keyed by the prime product of
+the naturals and one by the rank bitmask of naturals of a single suit, so a
+joker hand costs two lookups, like a standard hand.
+
+Five of a kind, possible only with jokers, ranks above a royal flush:
+strengths 7463 (five twos) to 7475 (five aces). Below that, strengths are
+the same as in poker.evaluator.
+"""
+from poker.cards import DECK_SIZE, encode_cards
+from poker.evaluator import (
+    CATEGORY_NAMES,
+    FLUSH_TABLE,
+    MAX_STRENGTH,
+    PAIRED_TABLE,
+    PRIMES,
+    STRAIGHTS,
+    UNIQUE_TABLE,
+    evaluate5,
+    hand_category,
+)
+
+FIVE_OF_A_KIND = 11
+
+MAX_WILD_STRENGTH = MAX_STRENGTH + 13
+
+WILD_CATEGORY_NAMES = {**CATEGORY_NAMES, FIVE_OF_A_KIND: "Five of a Kind"}
+
+
+def _paired(ranks: list[int]) -> int:
+    """Return the strength of five rank indices that are not all different."""
+    product = 1
+    for rank in ranks:
+        product *= PRIMES[rank]
+    return PAIRED_TABLE[product]
+
+
+def _covering_straight(mask: int) -> int:
+    """Return the highest straight holding every rank of a mask, or 0."""
+    for straight, _ in reversed(STRAIGHTS):
+        if not mask & ~straight:
+            return straight
+    return 0
+
+
+def _best_unsuited(counts: list[int], wild: int) -> int:
+    """Return the best strength, flushes aside, of naturals plus jokers."""
+    present = [rank for rank in range(12, -1, -1) if counts[rank]]
+    top = max(counts)
+    if top + wild >= 5:
+        return MAX_STRENGTH + 1 + (present[0] if present else 12)
+    if top + wild >= 4:
+        # Jokers complete the highest rank that can reach four; a spare
+        # joker becomes the highest other rank.
+        four = next(rank for rank in present if counts[rank] + wild >= 4)
+        others = [rank for rank in present if rank != four]
+        kicker = others[0] if others else (12 if four != 12 else 11)
+        return _paired([four] * 4 + [kicker])
+    if len(present) == 2:
+        # One joker and two natural pairs.
+        high, low = present
+        return _paired([high] * 3 + [low] * 2)
+    if top == 1:
+        mask = 0
+        for rank in present:
+            mask |= 1 << rank
+        straight = _covering_straight(mask)
+        if straight:
+            return UNIQUE_TABLE[straight]
+    if top + wild >= 3:
+        three = next(rank for rank in present if counts[rank] + wild >= 3)
+        return _paired([three] * 3 + [rank for rank in present if rank != three])
+    # One joker and four different naturals: pair the highest.
+    return _paired([present[0]] * 2 + present[1:])
+
+
+def _best_suited(mask: int) -> int:
+    """Return the best flush of naturals of one suit plus jokers."""
+    straight = _covering_straight(mask)
+    if straight:
+        return FLUSH_TABLE[straight]
+    wild = 5 - mask.bit_count()
+    for rank in range(12, -1, -1):
+        if not wild:
+            break
+        if not mask >> rank & 1:
+            mask |= 1 << rank
+            wild -= 1
+    return FLUSH_TABLE[mask]
+
+
+def _build_tables() -> None:
+    """Fill the joker tables for every set of zero to four naturals."""
+    for mask in range(1 << 13):
+        if mask.bit_count() <= 4:
+            _SUITED_TABLE[mask] = _best_suited(mask)
+
+    counts = [0] * 13
+
+    def visit(rank: int, size: int, product: int) -> None:
+        if rank == 13:
+            _UNSUITED_TABLE[product] = _best_unsuited(counts, 5 - size)
+            return
+        for count in range(min(4, 4 - size) + 1):
+            counts[rank] = count
+            visit(rank + 1, size + count, product * PRIMES[rank] ** count)
+        counts[rank] = 0
+
+    visit(0, 0, 1)
+
+
+_SUITED_TABLE = [0] * (1 << 13)
+_UNSUITED_TABLE = {}
+_build_tables()
+
+_CARD_PRIME = tuple(PRIMES[card >> 2] for card in range(DECK_SIZE))
+
+
+def evaluate_wild(cards: "list[tuple[str, str] | int]") -> int:
+    """Return the strength of the best hand a joker hand can stand for.
+
+    Args:
+        cards (list[tuple[str, str] | int]): Five cards as (suit, value)
+            tuples or encoded ints; jokers are wild.
+
+    Returns:
+        int: Strength from 1 to MAX_WILD_STRENGTH; the scale of
+        evaluator.evaluate_rank extended by five of a kind.
+
+    Raises:
+        ValueError: If the hand does not hold five cards.
+    """
+    cards = encode_cards(cards)
+    if len(cards) != 5:
+        raise ValueError(f"Expected five cards, got {len(cards)}")
+    if max(cards) < DECK_SIZE:
+        return evaluate5(*cards)
+    product = 1
+    mask = suits = naturals = 0
+    for card in cards:
+        if card < DECK_SIZE:
+            product *= _CARD_PRIME[card]
+            mask |= 1 << (card >> 2)
+            suits |= 1 << (card & 3)
+            naturals += 1
+    best = _UNSUITED_TABLE[product]
+    if not suits & (suits - 1) and mask.bit_count() == naturals:
+        return max(best, _SUITED_TABLE[mask])
+    return best
+
+
+def wild_category(strength: int) -> int:
+    """Return the category of a strength returned by evaluate_wild.
+
+    Args:
+        strength (int): Strength returned by evaluate_wild.
+
+    Returns:
+        int: Category from HIGH_CARD (1) to FIVE_OF_A_KIND (11).
+    """
+    return FIVE_OF_A_KIND if strength > MAX_STRENGTH else hand_category(strength)